@@ -0,0 +1,30 @@
+"""Add products.updated_at for incremental exports
+
+Revision ID: 07d3cc6f309a
+Revises: 756adc0644cf
+Create Date: 2026-10-18 16:41:52.307716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '07d3cc6f309a'
+down_revision: Union[str, Sequence[str], None] = '756adc0644cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    op.create_index(op.f('ix_products_updated_at'), 'products', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_products_updated_at'), table_name='products')
+    op.drop_column('products', 'updated_at')
@@ -0,0 +1,39 @@
+"""Add partial indexes for active-product pagination and category fallback
+
+Revision ID: 6ca46d3e66da
+Revises: 07d3cc6f309a
+Create Date: 2026-10-18 18:20:05.943127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6ca46d3e66da'
+down_revision: Union[str, Sequence[str], None] = '07d3cc6f309a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset/offset pagination: WHERE is_active ORDER BY id
+    op.create_index(
+        'ix_products_active_id', 'products', ['id'], unique=False,
+        postgresql_where=sa.text('is_active'), sqlite_where=sa.text('is_active = 1'),
+    )
+    # Category fallback: WHERE is_active AND lower(category) = ? ORDER BY created_at DESC
+    op.create_index(
+        'ix_products_active_category_created', 'products',
+        [sa.text('lower(category)'), sa.text('created_at DESC')], unique=False,
+        postgresql_where=sa.text('is_active'), sqlite_where=sa.text('is_active = 1'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_active_category_created', table_name='products')
+    op.drop_index('ix_products_active_id', table_name='products')
@@ -0,0 +1,54 @@
+"""Create jobs table for the durable background queue
+
+Revision ID: b3f1c2d4e5a6
+Revises: 6ca46d3e66da
+Create Date: 2026-10-18 20:05:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c2d4e5a6'
+down_revision: Union[str, Sequence[str], None] = '6ca46d3e66da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Claim query: WHERE status = 'queued' AND run_at <= now() ORDER BY run_at FOR UPDATE SKIP LOCKED
+    op.create_index(
+        'ix_jobs_queued_run_at', 'jobs', ['run_at'], unique=False,
+        postgresql_where=sa.text("status = 'queued'"), sqlite_where=sa.text("status = 'queued'"),
+    )
+    # Reclaiming jobs from workers that died mid-run
+    op.create_index(
+        'ix_jobs_running_locked_at', 'jobs', ['locked_at'], unique=False,
+        postgresql_where=sa.text("status = 'running'"), sqlite_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_running_locked_at', table_name='jobs')
+    op.drop_index('ix_jobs_queued_run_at', table_name='jobs')
+    op.drop_table('jobs')
@@ -0,0 +1,42 @@
+"""Operational commands.
+
+    python -m app.cli ingest-products seed_products.csv --mode replace
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from app.core.database import AsyncSessionLocal, engine
+from app.core.streaming import iter_file_chunks, iter_records
+from app.services.product_ingest import ingest_products
+
+
+async def _ingest_products(args) -> int:
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    with open(args.path, "rb") as fileobj:
+        async with AsyncSessionLocal() as db:
+            records = iter_records(iter_file_chunks(fileobj), fmt)
+            summary = await ingest_products(db, records, mode=args.mode, batch_size=args.batch_size)
+    await engine.dispose()
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest-products", help="Load a CSV/NDJSON catalog into products")
+    ingest.add_argument("path")
+    ingest.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the file extension")
+    ingest.add_argument("--mode", choices=["replace", "upsert"], default="upsert")
+    ingest.add_argument("--batch-size", type=int, default=5000)
+    ingest.set_defaults(handler=_ingest_products)
+
+    args = parser.parse_args(argv)
+    return asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded in-process LRU map whose entries also expire after a TTL."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.max_size <= 0:
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class CacheBackend(ABC):
+    """Async string cache. Subclasses implement _get/set/delete; hit/miss counting lives here."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl: float):
+        super().__init__()
+        self._cache = TTLCache(max_size, ttl)
+
+    async def _get(self, key):
+        return self._cache.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key):
+        self._cache.delete(key)
+
+    def stats(self):
+        stats = self._cache.stats()
+        stats.update(super().stats())
+        return stats
+
+
+class RedisCacheBackend(CacheBackend):
+    """Works with redis.asyncio.Redis or anything exposing async get/set(ex=)/delete.
+
+    Size-based eviction is left to the server's maxmemory policy. Errors are logged
+    and treated as misses so a cache outage never fails the request.
+    """
+
+    def __init__(self, client: Any, namespace: str, ttl: float):
+        super().__init__()
+        self.client = client
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def _get(self, key):
+        try:
+            value = await self.client.get(self._key(key))
+        except Exception:
+            logger.warning("Cache get failed for %s", self.namespace, exc_info=True)
+            return None
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    async def set(self, key, value, ttl=None):
+        try:
+            await self.client.set(self._key(key), value, ex=max(1, int(self.ttl if ttl is None else ttl)))
+        except Exception:
+            logger.warning("Cache set failed for %s", self.namespace, exc_info=True)
+
+    async def delete(self, key):
+        try:
+            await self.client.delete(self._key(key))
+        except Exception:
+            logger.warning("Cache delete failed for %s", self.namespace, exc_info=True)
+
+
+_redis_client = None
+
+
+def redis_client() -> Any:
+    """The process's redis.asyncio client for REDIS_URL, shared by every Redis-backed store."""
+    global _redis_client
+    if _redis_client is None:
+        from app.core.config import settings
+
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError(
+                "REDIS_URL is set but the redis package is not installed; pip install 'redis>=5.0'"
+            ) from None
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def create_cache_backend(namespace: str, max_size: int, ttl: float) -> CacheBackend:
+    from app.core.config import settings
+
+    if settings.REDIS_URL:
+        return RedisCacheBackend(redis_client(), namespace, ttl)
+    return InMemoryCacheBackend(max_size, ttl)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight awaitable.
+
+    The shared call runs as its own task, so a caller being cancelled does not
+    cancel the work the other waiters are relying on.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,142 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+from app.core.metrics import counter
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+compressed_responses = counter("http_responses_compressed", "Responses sent compressed", ("encoding",))
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/javascript")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best encoding the client accepts: brotli when available, then gzip."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding in (("br", "gzip") if brotli is not None else ("gzip",)):
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class Compressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._impl = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._compress, self._flush = self._impl.process, self._impl.finish
+        else:
+            # wbits=31 writes the gzip header and trailer
+            self._impl = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress, self._flush = self._impl.compress, self._impl.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def flush(self) -> bytes:
+        return self._flush()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    compressor = Compressor(encoding)
+    return compressor.compress(body) + compressor.flush()
+
+
+def weak_etag(etag: str) -> str:
+    # A compressed body is a different byte sequence, so it can only carry a weak validator
+    return etag if etag.startswith("W/") else "W/" + etag
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli for JSON and NDJSON responses of at least COMPRESSION_MIN_SIZE bytes.
+
+    Streaming responses are compressed chunk by chunk. Responses that already
+    carry a Content-Encoding (e.g. pre-compressed cached pages), 204/304s and
+    HEAD requests pass through.
+    """
+
+    def __init__(self, app, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        # HEAD has no body to compress; passing it through keeps its headers truthful
+        if scope["type"] == "http" and scope["method"] != "HEAD":
+            encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        else:
+            encoding = None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows whether compression pays off
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                if (
+                    "content-encoding" in headers
+                    or start_message["status"] in (204, 304)
+                    or not is_compressible(headers.get("content-type"))
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = Compressor(encoding)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers:
+                    headers["ETag"] = weak_etag(headers["etag"])
+                compressed_responses.inc(encoding=encoding)
+                if not more_body:
+                    data = compressor.compress(body) + compressor.flush()
+                    headers["Content-Length"] = str(len(data))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": data})
+                    return
+                del headers["Content-Length"]
+                await send(start_message)
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.flush()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,20 +1,132 @@
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import sys
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "FastAPI Backend"
     API_V1_STR: str = "/api/v1"
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    LOG_FORMAT: Literal["text", "json"] = "text"
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    # Refresh tokens rotate on every use; each one is single-use
+    REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 14
     SQLALCHEMY_DATABASE_URI: str
+    # Connection pool; sized per worker process, so size * workers must fit max_connections
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements per connection (0 for pgbouncer transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # SQLAlchemy compiled-statement cache
+    DB_QUERY_CACHE_SIZE: int = 500
+    # Read-only endpoints round-robin over these (JSON list); empty means use the primary
+    READ_REPLICA_URIS: list[str] = []
+    READ_REPLICA_MAX_LAG_SECONDS: float | None = None
+    READ_REPLICA_LAG_CHECK_SECONDS: float = 5
+    READ_REPLICA_RETRY_SECONDS: float = 30
     OPENAI_API_KEY: str | None = None
+    # Point at a stub server for load tests
+    OPENAI_BASE_URL: str | None = None
+    # Hard deadline for one intent extraction, retries and hedges included
+    OPENAI_TIMEOUT_SECONDS: float = 3.0
+    OPENAI_MAX_RETRIES: int = 0
+    # Consecutive failures that open the breaker, and how long it stays open
+    OPENAI_BREAKER_FAILURE_THRESHOLD: int = 5
+    OPENAI_BREAKER_RESET_SECONDS: float = 30
+    # Send a second identical request if the first hasn't answered by then; unset disables hedging
+    OPENAI_HEDGE_DELAY_SECONDS: float | None = None
+    # Required in the X-Admin-Key header for /admin routes; unset disables them
+    ADMIN_API_KEY: str | None = None
+    USER_IMPORT_BATCH_SIZE: int = 500
+    # Argon2 hashes all bulk imports together may run at once; keep it well below
+    # PASSWORD_HASH_WORKERS so logins always find free hash workers
+    USER_IMPORT_HASH_CONCURRENCY: int = 1
+    # Rows fetched per server-side cursor round trip by /products/export
+    EXPORT_BATCH_SIZE: int = 1000
+    # Incremental exports re-send rows updated this long before updated_since, covering
+    # writes whose transaction started before the previous export but committed after it
+    EXPORT_OVERLAP_SECONDS: float = 300
+    # "auto" picks Postgres full-text search when available, ILIKE otherwise (e.g. SQLite)
+    SEARCH_ENGINE: Literal["auto", "ilike", "fulltext"] = "auto"
+    # Shared cache backend; in-process caches are used when unset
+    REDIS_URL: str | None = None
+    INTENT_CACHE_MAX_SIZE: int = 10000
+    INTENT_CACHE_TTL_SECONDS: int = 3600
+    # Rendered /products and /ai/search responses, keyed by catalog version.
+    # The TTL bounds staleness when another worker writes the catalog.
+    RESPONSE_CACHE_MAX_SIZE: int = 2048
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    # In-memory fallback/featured results; refreshed on catalog change or after this long
+    CATALOG_SNAPSHOT_REFRESH_SECONDS: int = 60
+    FEATURED_PRODUCTS_LIMIT: int = 12
+    # Semantic search: local hashing embeddings, exact top-k below the ANN threshold.
+    # With EMBEDDINGS_PATH set, the index is written at ingest time and memory-mapped.
+    EMBEDDING_DIM: int = 256
+    EMBEDDINGS_PATH: str | None = None
+    SEMANTIC_ANN_THRESHOLD: int = 50000
+    SEMANTIC_ANN_NPROBE: int = 8
+    # Without EMBEDDINGS_PATH each worker rebuilds its own index this often, picking up
+    # writes made by other workers or the CLI
+    SEMANTIC_INDEX_REFRESH_SECONDS: int = 300
+    # Candidates fetched per search before hybrid ranking trims them to the page size
+    SEARCH_CANDIDATES: int = 50
+    # Rule-based intents at or above this confidence skip the LLM entirely
+    LOCAL_INTENT_MIN_CONFIDENCE: float = 0.8
+    # Verified tokens and authenticated users; 0 disables the cache
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 15
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    # Argon2 runs on a dedicated pool; beyond MAX_PENDING callers get a 429
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    # Unset keeps passlib's defaults
+    ARGON2_TIME_COST: int | None = None
+    ARGON2_MEMORY_COST: int | None = None
+    ARGON2_PARALLELISM: int | None = None
+    # Rates like "5/minute"; unset or empty disables that limit.
+    # Shared across workers through REDIS_URL, otherwise per process.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    LOGIN_RATE_LIMIT_PER_IP: str | None = "20/minute"
+    LOGIN_RATE_LIMIT_PER_EMAIL: str | None = "5/minute"
+    # Route path -> per-client rate, e.g. RATE_LIMIT_ROUTES='{"/ai/search": "30/minute"}'
+    RATE_LIMIT_ROUTES: dict[str, str] = {"/ai/search": "30/minute"}
+    # gzip, or brotli when the package is installed, for bodies of at least this many bytes
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # python -m app.serve; "auto" uses uvloop/httptools when installed
+    HOST: str = "0.0.0.0"
+    # Proxies whose X-Forwarded-For is trusted for the client address (comma-separated,
+    # or "*"). Rate limits key on that address, so set this to the load balancer's
+    # addresses; otherwise every client shares the balancer's limit.
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    PORT: int = 8000
+    WEB_CONCURRENCY: int | None = None
+    SERVER_LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    SERVER_HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    # Connections each worker opens before accepting traffic
+    STARTUP_WARM_CONNECTIONS: int = 2
+    # Import-to-ready budget per worker; exceeding it is logged and visible in /metrics
+    COLD_START_TARGET_SECONDS: float = 5.0
+    # Background jobs: "memory" runs them in-process (lost on restart),
+    # "database" keeps them in the jobs table and claims with SKIP LOCKED
+    JOB_BACKEND: Literal["memory", "database"] = "memory"
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_SIZE: int = 10000
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 1.0
+    JOB_RETRY_MAX_SECONDS: float = 300.0
+    JOB_POLL_SECONDS: float = 1.0
+    # A running database job older than this is assumed orphaned and requeued
+    JOB_LOCK_TIMEOUT_SECONDS: int = 300
+    # Shutdown waits this long for queued and running jobs
+    JOB_DRAIN_SECONDS: float = 10.0
 
     model_config = SettingsConfigDict(env_file=".env")
 
-try:
-    settings = Settings()
-    print("INFO:  Environment variables loaded successfully.")
-except Exception as e:
-    print(f"ERROR: Failed to load environment variables: {e}")
-    sys.exit(1)
+# A missing or invalid variable raises pydantic's ValidationError naming the field
+settings = Settings()
@@ -1,11 +1,237 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import asyncio
+import itertools
+import logging
+import time
+from typing import List, Optional
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from app.core.metrics import gauge, stats_gauges
 
-engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI, echo=True)
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also records how long callers wait to acquire a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            # Other errors (e.g. the database refusing connections) aren't pool exhaustion
+            self.timeouts += 1
+            raise
+        # Only successful checkouts, so the average is per acquired connection;
+        # a timed-out wait always lasted DB_POOL_TIMEOUT
+        waited = time.perf_counter() - start
+        self.acquired += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return connection
+
+
+def create_engine_from_settings(url: Optional[str] = None) -> AsyncEngine:
+    url = make_url(url or settings.SQLALCHEMY_DATABASE_URI)
+    kwargs = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+    if url.get_backend_name() == "sqlite":
+        # SQLite picks its own pool class; sizing knobs don't apply
+        return create_async_engine(url, **kwargs)
+
+    kwargs.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    if url.get_driver_name() == "asyncpg":
+        connect_args = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+        if settings.DB_STATEMENT_CACHE_SIZE == 0:
+            # Also disable asyncpg's own cache, e.g. behind pgbouncer in transaction mode
+            connect_args["statement_cache_size"] = 0
+        kwargs["connect_args"] = connect_args
+    return create_async_engine(url, **kwargs)
+
+
+def get_pool_stats(target: Optional[AsyncEngine] = None) -> dict:
+    pool = (target or engine).sync_engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            acquired=pool.acquired,
+            timeouts=pool.timeouts,
+            wait_seconds_total=pool.wait_seconds_total,
+            wait_seconds_max=pool.wait_seconds_max,
+            wait_seconds_avg=pool.wait_seconds_total / pool.acquired if pool.acquired else 0.0,
+        )
+    return stats
+
+
+engine = create_engine_from_settings()
+
+stats_gauges("db_pool", "Primary connection pool", get_pool_stats)
 
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 Base = declarative_base()
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.url = make_url(url)
+        self.engine = create_engine_from_settings(url)
+        self.sessionmaker = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        self.unhealthy_until = 0.0
+        self.lag_seconds: Optional[float] = None
+        self.lag_checked_at = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.unhealthy_until <= time.monotonic()
+
+    def mark_unhealthy(self, reason: str) -> None:
+        logger.warning("Read replica %s taken out of rotation: %s", self.url.render_as_string(), reason)
+        self.unhealthy_until = time.monotonic() + settings.READ_REPLICA_RETRY_SECONDS
+
+    async def measure_lag(self, session: AsyncSession) -> float:
+        if self.engine.dialect.name != "postgresql":
+            return 0.0
+        result = await session.execute(text(
+            "SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+        ))
+        return float(result.scalar())
+
+
+class ReadRouter:
+    """Round-robins read sessions over replicas, falling back to the primary.
+
+    Replicas that fail to connect, or exceed READ_REPLICA_MAX_LAG_SECONDS, are
+    skipped for READ_REPLICA_RETRY_SECONDS. For that same lag budget after this
+    process commits to the primary, reads stay on the primary so they see the write.
+    """
+
+    def __init__(self, urls: List[str]):
+        self.replicas = [Replica(url) for url in urls]
+        self._turn = itertools.count()
+        self.last_write_at: Optional[float] = None
+
+    def _recently_written(self) -> bool:
+        budget = settings.READ_REPLICA_MAX_LAG_SECONDS
+        return (
+            budget is not None and self.last_write_at is not None
+            and time.monotonic() - self.last_write_at < budget
+        )
+
+    async def open_session(self) -> AsyncSession:
+        if self.replicas and not self._recently_written():
+            start = next(self._turn)
+            for i in range(len(self.replicas)):
+                replica = self.replicas[(start + i) % len(self.replicas)]
+                if replica.healthy:
+                    session = await self._try_replica(replica)
+                    if session is not None:
+                        return session
+        return AsyncSessionLocal()
+
+    async def _try_replica(self, replica: Replica) -> Optional[AsyncSession]:
+        session = replica.sessionmaker()
+        try:
+            # Connect eagerly so an unreachable replica falls back here rather than mid-request
+            await session.connection()
+            budget = settings.READ_REPLICA_MAX_LAG_SECONDS
+            now = time.monotonic()
+            if budget is not None and now - replica.lag_checked_at >= settings.READ_REPLICA_LAG_CHECK_SECONDS:
+                replica.lag_seconds = await replica.measure_lag(session)
+                replica.lag_checked_at = now
+                if replica.lag_seconds > budget:
+                    replica.mark_unhealthy(f"lag {replica.lag_seconds:.1f}s over budget")
+                    await session.close()
+                    return None
+            return session
+        except (OSError, SQLAlchemyError) as e:
+            replica.mark_unhealthy(str(e))
+            await session.close()
+            return None
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                "url": replica.url.render_as_string(),
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag_seconds,
+                "pool": get_pool_stats(replica.engine),
+            }
+            for replica in self.replicas
+        ]
+
+
+read_router = ReadRouter(settings.READ_REPLICA_URIS)
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def _note_primary_commit(conn) -> None:
+    read_router.last_write_at = time.monotonic()
+
+gauge(
+    "db_read_replica_healthy", "Whether a read replica is in rotation",
+    lambda: {(r.url.render_as_string(),): r.healthy for r in read_router.replicas}, ("replica",),
+)
+gauge(
+    "db_read_replica_lag_seconds", "Last measured replication lag",
+    lambda: {(r.url.render_as_string(),): r.lag_seconds for r in read_router.replicas}, ("replica",),
+)
+gauge(
+    "db_read_replica_checked_out", "Connections checked out from a replica pool",
+    lambda: {(r.url.render_as_string(),): get_pool_stats(r.engine).get("checked_out") for r in read_router.replicas},
+    ("replica",),
+)
+
+
+async def warm_pool(target: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections at once, so the first requests skip the handshake."""
+    async def connect():
+        async with target.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Held concurrently: opened one at a time they would just reuse a single connection
+    await asyncio.gather(*(connect() for _ in range(max(1, connections))))
+
+
+async def warm_engines(connections: int) -> None:
+    await warm_pool(engine, connections)
+    for replica in read_router.replicas:
+        try:
+            await warm_pool(replica.engine, connections)
+        except (OSError, SQLAlchemyError) as e:
+            replica.mark_unhealthy(str(e))
+
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    for replica in read_router.replicas:
+        await replica.engine.dispose()
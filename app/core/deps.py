@@ -1,51 +1,106 @@
+import logging
+import secrets
+import time
 from typing import Annotated, AsyncGenerator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.services import user as user_service
-from app.schemas.token import TokenData
-from app.core.database import AsyncSessionLocal
-from app.models.user import User
+from app.schemas.token import TokenData, UserLogin
+from app.core.database import AsyncSessionLocal, read_router
+from app.core.cache import TTLCache
+from app.core.rate_limit import client_ip, enforce
+from app.core.revocation import token_denylist
+from app.core.security import decode_token
+
+logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Verified token -> TokenData, so repeat requests skip the signature check.
+# Entries never outlive the token's own expiry. Revocation is still checked
+# on every request, against the in-memory (or Redis) denylist.
+_verified_tokens = TTLCache(settings.PRINCIPAL_CACHE_MAX_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    # For endpoints that never write: served by a read replica when configured
+    async with await read_router.open_session() as session:
+        yield session
+
+_credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+async def get_token_data(token: Annotated[str, Depends(oauth2_scheme)]) -> TokenData:
+    # Signature, expiry and revocation checks; no database access
+    token_data = _verified_tokens.get(token) if settings.PRINCIPAL_CACHE_TTL_SECONDS > 0 else None
+    if token_data is None:
+        try:
+            payload = decode_token(token)
+            # Refresh tokens are only accepted by /auth/refresh
+            if payload.get("sub") is None or payload.get("type", "access") != "access":
+                raise _credentials_exception
+            token_data = TokenData(email=payload["sub"], jti=payload.get("jti"), family=payload.get("fam"))
+        except (JWTError, ValidationError):
+            raise _credentials_exception
+        ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+        if payload.get("exp") is not None:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            _verified_tokens.set(token, token_data, ttl)
+
+    if token_data.jti and await token_denylist.contains(token_data.jti, token_data.family):
+        raise _credentials_exception
+    return token_data
+
 async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
+    token_data: Annotated[TokenData, Depends(get_token_data)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except (JWTError, ValidationError):
-        raise credentials_exception
-        
-    user = await user_service.get_user_by_email(db, email)
+    user = await user_service.get_principal(db, token_data.email)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception
     return user
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)]
+    current_user: Annotated[user_service.Principal, Depends(get_current_user)]
 ):
     if not current_user.is_active:
-        print(f"DEBUG: Access denied for inactive user {current_user.email}")
+        logger.debug("Access denied for inactive user", extra={"email": current_user.email})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is inactive"
         )
     return current_user
+
+async def require_admin(x_admin_key: Annotated[str | None, Header()] = None):
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled"
+        )
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin key"
+        )
+
+async def login_rate_limit(request: Request, user_in: UserLogin):
+    # Runs before the session is used and before Argon2: refused attempts cost neither
+    await enforce("login_ip", client_ip(request), settings.LOGIN_RATE_LIMIT_PER_IP)
+    await enforce("login_email", user_in.email.strip().lower(), settings.LOGIN_RATE_LIMIT_PER_EMAIL)
+
+async def route_rate_limit(request: Request):
+    # Per-client limit for the matched route, from RATE_LIMIT_ROUTES
+    path = request.scope["route"].path
+    await enforce(f"route:{path}", client_ip(request), settings.RATE_LIMIT_ROUTES.get(path))
@@ -0,0 +1,389 @@
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import counter, histogram, stats_gauges
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict], Awaitable[None]]
+_handlers: Dict[str, Handler] = {}
+
+job_runs = counter("jobs", "Background job attempts by outcome", ("name", "outcome"))
+job_wait = histogram("job_wait_seconds", "Time from enqueue (or retry due time) until a worker starts the job", ("name",))
+job_duration = histogram("job_duration_seconds", "Background job run time", ("name",))
+
+
+def job(name: str) -> Callable[[Handler], Handler]:
+    """Register an async handler taking the job's JSON payload, e.g. @job("send_welcome_email")."""
+    def register(fn: Handler) -> Handler:
+        _handlers[name] = fn
+        return fn
+    return register
+
+
+def retry_delay(attempt: int) -> float:
+    # Exponential backoff with jitter, so a failed batch doesn't retry in lockstep
+    delay = settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+    return min(delay, settings.JOB_RETRY_MAX_SECONDS) * random.uniform(0.5, 1.5)
+
+
+def _after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Call `callback` once the session's current transaction commits; forget it on rollback."""
+    session = db.sync_session
+    pending = session.info.get("after_commit_jobs")
+    if pending is None:
+        pending = session.info["after_commit_jobs"] = []
+
+        def committed(_session):
+            callbacks = pending[:]
+            pending.clear()
+            for fn in callbacks:
+                fn()
+
+        event.listen(session, "after_commit", committed)
+        event.listen(session, "after_rollback", lambda _session: pending.clear())
+    pending.append(callback)
+
+
+async def _run(name: str, payload: dict) -> Tuple[Optional[str], bool]:
+    """Run one attempt; returns (error, retryable)."""
+    handler = _handlers.get(name)
+    if handler is None:
+        return f"No handler registered for job {name!r}", False
+    start = time.perf_counter()
+    try:
+        await handler(payload)
+        return None, True
+    except Exception as e:
+        logger.warning("Job %s failed", name, exc_info=True)
+        return f"{type(e).__name__}: {e}", True
+    finally:
+        job_duration.observe(time.perf_counter() - start, name=name)
+
+
+class JobQueue(ABC):
+    """Fire-and-forget background work. Handlers enqueue and return immediately."""
+
+    @abstractmethod
+    async def enqueue(
+        self, name: str, payload: Optional[dict] = None, max_attempts: Optional[int] = None,
+        db: Optional[AsyncSession] = None,
+    ) -> None:
+        """Queue a job. With `db`, the job is tied to that session's transaction
+        (outbox-style): it is only queued if the caller commits, and the caller does."""
+
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    async def drain(self, timeout: float) -> None:
+        """Stop taking new work and wait up to `timeout` for running and queued jobs."""
+
+    def stats(self) -> dict:
+        return {}
+
+
+class InProcessJobQueue(JobQueue):
+    """asyncio.Queue drained by a fixed number of worker tasks.
+
+    Bounded: when JOB_QUEUE_MAX_SIZE jobs are waiting, new ones are dropped and
+    counted rather than growing memory without limit. Jobs live only as long as
+    the process; use the database backend for work that must survive a restart.
+    """
+
+    def __init__(self, workers: int, max_size: int):
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._accepting = True
+        self.in_flight = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_size)
+        self._accepting = True
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    def _put(self, item: tuple) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            job_runs.inc(name=item[0], outcome="dropped")
+            logger.warning("Job queue full; dropped %s", item[0])
+
+    async def enqueue(self, name, payload=None, max_attempts=None, db=None):
+        if not self._accepting:
+            logger.warning("Job queue is draining; dropped %s", name)
+            return
+        self.start()
+        item = (name, payload or {}, 1, max_attempts or settings.JOB_MAX_ATTEMPTS, time.monotonic())
+        if db is None:
+            self._put(item)
+        else:
+            # Nothing durable to write into the transaction; queue once it commits, never on rollback
+            _after_commit(db, lambda: self._put(item))
+
+    def _retry_later(self, item: tuple, delay: float) -> None:
+        async def put_later():
+            await asyncio.sleep(delay)
+            self._put(item)
+
+        task = asyncio.ensure_future(put_later())
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _worker(self) -> None:
+        while True:
+            name, payload, attempt, max_attempts, due = await self._queue.get()
+            self.in_flight += 1
+            try:
+                job_wait.observe(time.monotonic() - due, name=name)
+                error, retryable = await _run(name, payload)
+                if error is None:
+                    job_runs.inc(name=name, outcome="ok")
+                elif retryable and attempt < max_attempts:
+                    job_runs.inc(name=name, outcome="retry")
+                    delay = retry_delay(attempt)
+                    self._retry_later((name, payload, attempt + 1, max_attempts, time.monotonic() + delay), delay)
+                else:
+                    job_runs.inc(name=name, outcome="failed")
+                    logger.error("Job %s gave up after %d attempt(s): %s", name, attempt, error)
+            finally:
+                self.in_flight -= 1
+                self._queue.task_done()
+
+    async def _wait_idle(self) -> None:
+        while True:
+            await self._queue.join()
+            if not self._retries:
+                return
+            await asyncio.wait(set(self._retries))
+
+    async def drain(self, timeout):
+        self._accepting = False
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Job queue drain timed out; abandoning %d job(s)", self.depth() + self.in_flight)
+        for task in (*self._tasks, *self._retries):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+
+    def depth(self) -> int:
+        return (self._queue.qsize() if self._queue is not None else 0) + len(self._retries)
+
+    def stats(self):
+        return {"depth": self.depth(), "in_flight": self.in_flight, "dropped": self.dropped, "workers": self.workers}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DatabaseJobQueue(JobQueue):
+    """Jobs in the `jobs` table, shared by every worker process and node.
+
+    Workers claim due rows with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent
+    pollers never block on or double-run the same job. A job whose worker died
+    mid-run is requeued once its lock is older than JOB_LOCK_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self, session_factory, workers: int, poll_seconds: float):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.in_flight = 0
+        self.queued = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.ensure_future(self._maintain()))
+
+    async def enqueue(self, name, payload=None, max_attempts=None, db=None):
+        job_row = Job(
+            name=name, payload=payload or {}, status="queued", attempts=0,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS, run_at=_utcnow(),
+        )
+        if db is not None:
+            # Committed (or rolled back) by the caller together with its own writes
+            db.add(job_row)
+            _after_commit(db, self._wake)
+            return
+        async with self.session_factory() as session:
+            session.add(job_row)
+            await session.commit()
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _claim(self) -> Optional[Job]:
+        async with self.session_factory() as db:
+            now = _utcnow()
+            job_row = (await db.execute(
+                select(Job)
+                .where(Job.status == "queued", Job.run_at <= now)
+                .order_by(Job.run_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )).scalar_one_or_none()
+            if job_row is None:
+                return None
+            # Conditional on the attempt we read, so backends without row locks (SQLite)
+            # can't double-claim, even if the row was run and requeued in between
+            claimed = await db.execute(
+                update(Job)
+                .where(Job.id == job_row.id, Job.status == "queued", Job.attempts == job_row.attempts)
+                .values(status="running", locked_at=now, attempts=job_row.attempts + 1)
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return None
+            return job_row
+
+    async def _finish(self, job_row: Job, error: Optional[str], retryable: bool) -> None:
+        values = {"locked_at": None, "last_error": error}
+        if error is None:
+            outcome = "ok"
+            values.update(status="done", finished_at=_utcnow())
+        elif retryable and job_row.attempts < job_row.max_attempts:
+            outcome = "retry"
+            values.update(status="queued", run_at=_utcnow() + timedelta(seconds=retry_delay(job_row.attempts)))
+        else:
+            outcome = "failed"
+            values.update(status="failed", finished_at=_utcnow())
+        async with self.session_factory() as db:
+            # Only while our claim stands: if the lock timed out, the job was requeued
+            # (and possibly claimed again) and that attempt owns the row now
+            finished = await db.execute(
+                update(Job)
+                .where(Job.id == job_row.id, Job.status == "running", Job.attempts == job_row.attempts)
+                .values(**values)
+            )
+            await db.commit()
+        if finished.rowcount != 1:
+            job_runs.inc(name=job_row.name, outcome="stale")
+            logger.warning("Job %s finished after its lock expired; outcome discarded", job_row.name)
+            return
+        job_runs.inc(name=job_row.name, outcome=outcome)
+        if outcome == "failed":
+            logger.error("Job %s gave up after %d attempt(s): %s", job_row.name, job_row.attempts, error)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job_row = await self._claim()
+            except Exception:
+                logger.warning("Claiming a job failed", exc_info=True)
+                job_row = None
+            if job_row is None:
+                if self._stopping:
+                    # Draining: due jobs are done; later retries stay queued for the next start
+                    return
+                # Idle: sleep until the next poll, or until this process enqueues something
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            self.in_flight += 1
+            try:
+                run_at = job_row.run_at if job_row.run_at.tzinfo else job_row.run_at.replace(tzinfo=timezone.utc)
+                job_wait.observe(max(0.0, (_utcnow() - run_at).total_seconds()), name=job_row.name)
+                error, retryable = await _run(job_row.name, job_row.payload)
+                await self._finish(job_row, error, retryable)
+            finally:
+                self.in_flight -= 1
+
+    async def _recover_stale(self) -> None:
+        """Requeue jobs orphaned by dead workers, and refresh the depth gauge.
+
+        An orphaned attempt counts against max_attempts like any other, so a job
+        that keeps crashing its worker ends up failed instead of looping forever.
+        """
+        async with self.session_factory() as db:
+            now = _utcnow()
+            orphaned = (Job.status == "running", Job.locked_at < now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS))
+            await db.execute(
+                update(Job)
+                .where(*orphaned, Job.attempts < Job.max_attempts)
+                .values(status="queued", locked_at=None)
+            )
+            exhausted = await db.execute(
+                update(Job)
+                .where(*orphaned, Job.attempts >= Job.max_attempts)
+                .values(status="failed", locked_at=None, finished_at=now, last_error="Worker lost while running the job")
+            )
+            self.queued = (await db.execute(
+                select(func.count()).select_from(Job).where(Job.status == "queued")
+            )).scalar_one()
+            await db.commit()
+        if exhausted.rowcount:
+            logger.error("Gave up on %d job(s) whose workers kept dying", exhausted.rowcount)
+
+    async def _maintain(self) -> None:
+        while not self._stopping:
+            try:
+                await self._recover_stale()
+            except Exception:
+                logger.warning("Job queue maintenance failed", exc_info=True)
+            await asyncio.sleep(max(self.poll_seconds, 1.0))
+
+    async def drain(self, timeout):
+        self._stopping = True
+        if not self._tasks:
+            return
+        self._wakeup.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        if pending:
+            # Their jobs stay "running" and are requeued after JOB_LOCK_TIMEOUT_SECONDS
+            logger.warning("Job queue drain timed out with %d job(s) running", self.in_flight)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self):
+        return {"depth": self.queued, "in_flight": self.in_flight, "workers": self.workers}
+
+
+def create_job_queue() -> JobQueue:
+    if settings.JOB_BACKEND == "database":
+        return DatabaseJobQueue(AsyncSessionLocal, settings.JOB_WORKERS, settings.JOB_POLL_SECONDS)
+    return InProcessJobQueue(settings.JOB_WORKERS, settings.JOB_QUEUE_MAX_SIZE)
+
+
+job_queue = create_job_queue()
+
+stats_gauges("job_queue", "Background job queue", job_queue.stats)
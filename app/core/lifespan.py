@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.core.config import settings
+from app.core.database import dispose_engines, warm_engines
+from app.core.jobs import job_queue
+from app.core.metrics import gauge
+from app.core.security import shutdown_hash_executor
+from app.services.ai_search import close_openai_client, get_openai_client
+from app.services.catalog_snapshot import catalog_snapshot
+from app.services.embeddings import semantic_index
+import app.services.tasks  # noqa: F401  (registers job handlers)
+
+logger = logging.getLogger(__name__)
+
+startup_stats = {"cold_start_seconds": None, "target_seconds": settings.COLD_START_TARGET_SECONDS}
+_startup_phases: dict = {}
+
+gauge("app_cold_start_seconds", "Import-to-ready time of this worker", lambda: startup_stats["cold_start_seconds"])
+gauge("app_startup_phase_seconds", "Time spent in each startup warm-up step",
+      lambda: {(phase,): seconds for phase, seconds in _startup_phases.items()}, ("phase",))
+
+async def _timed_phase(name: str, coro) -> None:
+    start = time.perf_counter()
+    try:
+        await coro
+    except Exception:
+        # A cold dependency only costs the first requests; it must not keep the worker down
+        logger.warning("Startup step %s failed", name, exc_info=True)
+    finally:
+        _startup_phases[name] = round(time.perf_counter() - start, 4)
+
+async def _warm_openai_client() -> None:
+    get_openai_client()
+
+async def _warm_semantic_index() -> None:
+    # Only a persisted index is cheap enough to load here; otherwise it builds on first use
+    if settings.EMBEDDINGS_PATH:
+        await semantic_index.get()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs in each worker after the fork, so connections and clients are never shared
+    await asyncio.gather(
+        _timed_phase("db_pool", warm_engines(settings.STARTUP_WARM_CONNECTIONS)),
+        _timed_phase("catalog_snapshot", catalog_snapshot.refresh()),
+        _timed_phase("openai_client", _warm_openai_client()),
+        _timed_phase("semantic_index", _warm_semantic_index()),
+    )
+    cold_start = round(time.perf_counter() - app.state.import_started, 4)
+    startup_stats["cold_start_seconds"] = cold_start
+    if cold_start > settings.COLD_START_TARGET_SECONDS:
+        logger.warning("Cold start over target", extra={"seconds": cold_start, "phases": _startup_phases})
+    else:
+        logger.info("Worker ready", extra={"seconds": cold_start, "phases": _startup_phases})
+
+    job_queue.start()
+
+    yield
+
+    # Jobs may still need the database and the OpenAI client, so they finish first
+    await job_queue.drain(settings.JOB_DRAIN_SECONDS)
+    await close_openai_client()
+    await dispose_engines()
+    shutdown_hash_executor()
+
+def startup_report() -> dict:
+    return {**startup_stats, "phases": dict(_startup_phases)}
@@ -0,0 +1,136 @@
+import logging
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.core.cache import redis_client
+from app.core.config import settings
+from app.core.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+rate_limit_rejections = counter("rate_limit_rejections", "Requests refused by a rate limit", ("limit",))
+
+_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+
+@lru_cache(maxsize=None)
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """Parse "5/minute" into (5, 60.0) and "100/15minutes" into (100, 900.0)."""
+    match = _RATE.match(rate)
+    if not match:
+        raise ValueError(f"Invalid rate limit {rate!r}, expected e.g. '5/minute'")
+    count, multiple, unit = match.groups()
+    return int(count), int(multiple or 1) * _UNITS[unit]
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> Optional[float]:
+        """Count one request for `key`; None if allowed, else seconds until it would be."""
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Token bucket per key: `limit` requests per `window`, refilling continuously.
+
+    Each key costs one (tokens, timestamp) pair. At most `max_keys` are kept;
+    the least recently seen key is evicted first, which at worst forgives a
+    client that went quiet.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def hit(self, key, limit, window):
+        now = time.monotonic()
+        rate = limit / window
+        tokens, last = self._buckets.get(key, (limit, now))
+        tokens = min(limit, tokens + (now - last) * rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return (1 - tokens) / rate
+        self._buckets[key] = (tokens - 1, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+        return None
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RedisRateLimiter(RateLimiter):
+    """Sliding-window counter shared by every worker and node.
+
+    Keeps one counter per fixed window and weights the previous window by how
+    much of it still overlaps the sliding one. Redis errors allow the request:
+    the limiter must not turn a cache outage into an outage of login.
+    """
+
+    def __init__(self, client: Any, namespace: str = "ratelimit"):
+        self.client = client
+        self.namespace = namespace
+
+    async def hit(self, key, limit, window):
+        now = time.time()
+        current = int(now // window)
+        elapsed = now / window - current
+        base = f"{self.namespace}:{key}:{int(window)}"
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.incr(f"{base}:{current}")
+                pipe.expire(f"{base}:{current}", math.ceil(window * 2))
+                pipe.get(f"{base}:{current - 1}")
+                count, _, previous = await pipe.execute()
+        except Exception:
+            logger.warning("Rate limiter backend unavailable; allowing request", exc_info=True)
+            return None
+        estimate = int(previous or 0) * (1 - elapsed) + count
+        if estimate <= limit:
+            return None
+        return (1 - elapsed) * window
+
+
+def create_rate_limiter() -> RateLimiter:
+    if settings.REDIS_URL:
+        return RedisRateLimiter(redis_client())
+    return InMemoryRateLimiter(settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limiter = create_rate_limiter()
+
+if isinstance(rate_limiter, InMemoryRateLimiter):
+    gauge("rate_limit_tracked_keys", "Clients currently tracked by the in-memory rate limiter",
+          lambda: len(rate_limiter))
+
+
+def client_ip(request: Request) -> str:
+    # uvicorn rewrites this from X-Forwarded-For, but only for requests arriving from
+    # FORWARDED_ALLOW_IPS; behind any other proxy it is the proxy's own address
+    return request.client.host if request.client else "unknown"
+
+
+async def enforce(name: str, key: str, rate: Optional[str]) -> None:
+    """Raise 429 once `key` exceeds `rate` ("5/minute"); None or an empty rate means unlimited."""
+    if not settings.RATE_LIMIT_ENABLED or not rate:
+        return
+    limit, window = parse_rate(rate)
+    retry_after = await rate_limiter.hit(f"{name}:{key}", limit, window)
+    if retry_after is not None:
+        rate_limit_rejections.inc(limit=name)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency for a while.
+
+    Closed: calls go through. After `failure_threshold` consecutive failures the
+    breaker opens and `allow()` returns False for `reset_seconds`. Then it is
+    half-open: one probe call is let through, and its outcome closes or re-opens
+    the breaker.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def release(self) -> None:
+        """Ends a call `allow()` let through without an outcome, e.g. when it was cancelled.
+
+        A half-open breaker then lets the next call probe instead of staying claimed.
+        """
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        # A failed probe re-opens; calls already in flight when it opened don't extend it
+        if self._probing or (self.opened_at is None and self.failures >= self.failure_threshold):
+            self.trips += 1
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self.failures, "trips": self.trips}
+
+
+async def hedged(fn: Callable[[], Awaitable[Any]], delay: Optional[float]) -> Any:
+    """Run `fn`, starting a second identical attempt if the first is still pending after `delay`.
+
+    The first attempt to succeed wins and the other is cancelled. If both fail,
+    the last error is raised. A `delay` of None disables hedging.
+    """
+    if delay is None:
+        return await fn()
+
+    pending = {asyncio.ensure_future(fn())}
+    done, _ = await asyncio.wait(pending, timeout=delay)
+    if not done:
+        pending.add(asyncio.ensure_future(fn()))
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,98 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from fastapi import Request, Response
+from app.core.cache import TTLCache
+from app.core.compression import compress, compressed_responses, negotiate, weak_etag
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.core.metrics import stats_gauges
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    # Compressed copies of body, made on first request per encoding
+    encoded: Dict[str, bytes] = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class Uncached:
+    """Returned by a build function whose result must not be stored, e.g. a degraded fallback."""
+    data: Any
+
+
+def make_etag(body: bytes) -> str:
+    # Strong validator: derived from the exact bytes we send
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+class ResponseCache:
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size, ttl)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, body: bytes) -> CachedResponse:
+        entry = CachedResponse(body=body, etag=make_etag(body))
+        self._cache.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+stats_gauges("response_cache", "Catalog response cache", response_cache.stats)
+
+
+async def cached_json_response(
+    request: Request, key: Hashable, build: Callable[[], Awaitable[Any]]
+) -> Response:
+    """Serve JSON for `key` from the response cache, building and storing it on a miss.
+
+    `build` must return JSON-ready data. Keys should include whatever version
+    tag invalidates them (e.g. the catalog version). GET/HEAD requests carrying
+    a matching If-None-Match get an empty 304. Large bodies are compressed once
+    per entry and encoding, rather than by the middleware on every hit. A build
+    returning Uncached(data) is served once and not stored.
+    """
+    cache_control = "no-cache"
+    entry = response_cache.get(key)
+    if entry is None:
+        data = await build()
+        if isinstance(data, Uncached):
+            body = dumps(data.data)
+            entry = CachedResponse(body=body, etag=make_etag(body))
+            cache_control = "no-store"
+        else:
+            entry = response_cache.set(key, dumps(data))
+
+    body = entry.body
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+    if len(body) >= settings.COMPRESSION_MIN_SIZE:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        if encoding is not None:
+            body = entry.encoded.get(encoding)
+            if body is None:
+                body = entry.encoded[encoding] = compress(entry.body, encoding)
+            headers.update({"Content-Encoding": encoding, "ETag": weak_etag(entry.etag)})
+            compressed_responses.inc(encoding=encoding)
+
+    if request.method in ("GET", "HEAD") and etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,137 @@
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Set
+
+from fastapi import HTTPException, status
+
+from app.core.cache import redis_client
+from app.core.metrics import stats_gauges
+
+logger = logging.getLogger(__name__)
+
+
+class Denylist(ABC):
+    """Revoked token ids (jti) and token families, each kept until the token would expire anyway."""
+
+    @abstractmethod
+    async def add(self, key: str, expires_at: float) -> None:
+        ...
+
+    @abstractmethod
+    async def add_if_absent(self, key: str, expires_at: float) -> bool:
+        """Atomically adds `key`; False if it was already present (someone else got there first)."""
+
+    @abstractmethod
+    async def contains(self, *keys: str) -> bool:
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class TimeBucketedDenylist(Denylist):
+    """In-process denylist: a dict for O(1) lookups plus per-interval expiry buckets.
+
+    Ids are filed under the bucket their token expires in, so expired entries are
+    purged a whole bucket at a time instead of by scanning every id. Unlike the
+    LRU caches this is never size-evicted: dropping an entry would un-revoke a token.
+    """
+
+    def __init__(self, bucket_seconds: float = 60):
+        self.bucket_seconds = bucket_seconds
+        self._expiry: Dict[str, int] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        self._oldest = math.inf
+
+    def _purge(self, now: float) -> None:
+        current = int(now // self.bucket_seconds)
+        while self._oldest <= current:
+            for key in self._buckets.pop(self._oldest, ()):
+                if self._expiry.get(key) == self._oldest:
+                    del self._expiry[key]
+            self._oldest = min(self._buckets, default=math.inf)
+
+    def _insert(self, key: str, expires_at: float) -> None:
+        # Synchronous on purpose: no await between checking and inserting
+        if expires_at <= time.time():
+            return
+        # Rounded up, so an id is never dropped before its token expires
+        bucket = math.ceil(expires_at / self.bucket_seconds)
+        if self._expiry.get(key, -1) >= bucket:
+            return
+        self._expiry[key] = bucket
+        self._buckets.setdefault(bucket, set()).add(key)
+        self._oldest = min(self._oldest, bucket)
+
+    async def add(self, key, expires_at):
+        self._purge(time.time())
+        self._insert(key, expires_at)
+
+    async def add_if_absent(self, key, expires_at):
+        self._purge(time.time())
+        if key in self._expiry:
+            return False
+        self._insert(key, expires_at)
+        return True
+
+    async def contains(self, *keys):
+        self._purge(time.time())
+        return any(key in self._expiry for key in keys)
+
+    def stats(self):
+        return {"entries": len(self._expiry), "buckets": len(self._buckets)}
+
+
+class RedisDenylist(Denylist):
+    """Shared across workers; each id is a key expiring with its token.
+
+    A Redis outage during lookups is logged and treated as "not revoked": access
+    tokens are short-lived, and failing closed would log every user out. Failed
+    writes answer 503, so a logout or refresh never silently leaves a token valid.
+    """
+
+    def __init__(self, client: Any, namespace: str = "denylist"):
+        self.client = client
+        self.namespace = namespace
+
+    async def _set(self, key: str, expires_at: float, nx: bool) -> bool:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return True
+        try:
+            return bool(await self.client.set(f"{self.namespace}:{key}", "1", ex=ttl, nx=nx))
+        except Exception:
+            # Unlike a lookup, a lost write would leave the token usable, so don't pretend it worked
+            logger.error("Denylist write failed", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token revocation is temporarily unavailable",
+            )
+
+    async def add(self, key, expires_at):
+        await self._set(key, expires_at, nx=False)
+
+    async def add_if_absent(self, key, expires_at):
+        return await self._set(key, expires_at, nx=True)
+
+    async def contains(self, *keys):
+        try:
+            return await self.client.exists(*(f"{self.namespace}:{key}" for key in keys)) > 0
+        except Exception:
+            logger.warning("Denylist lookup failed", exc_info=True)
+            return False
+
+
+def create_denylist() -> Denylist:
+    from app.core.config import settings
+
+    if settings.REDIS_URL:
+        return RedisDenylist(redis_client())
+    return TimeBucketedDenylist()
+
+
+token_denylist = create_denylist()
+
+stats_gauges("token_denylist", "Revoked token ids held in memory", token_denylist.stats)
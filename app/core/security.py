@@ -1,21 +1,116 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
+from fastapi import HTTPException, status
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.metrics import histogram, stats_gauges
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
-def create_access_token(subject: Union[str, Any]) -> str:
-    expire = datetime.utcnow() + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+# Changing these parameters marks existing hashes as outdated; they are
+# transparently re-hashed on the user's next successful login.
+_argon2_params = {
+    f"argon2__{name}": value
+    for name, value in (
+        ("time_cost", settings.ARGON2_TIME_COST),
+        ("memory_cost", settings.ARGON2_MEMORY_COST),
+        ("parallelism", settings.ARGON2_PARALLELISM),
     )
-    to_encode = {"exp": expire, "sub": str(subject)}
+    if value is not None
+}
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto", **_argon2_params)
+
+# argon2-cffi releases the GIL while hashing, so a thread pool gives real
+# parallelism without blocking the event loop.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="argon2"
+)
+_hash_pool = {"pending": 0, "completed": 0, "rejected": 0, "seconds_total": 0.0, "seconds_max": 0.0}
+password_hash_duration = histogram(
+    "password_hash_duration_seconds", "Argon2 time on the worker, excluding queueing", ("operation",)
+)
+
+def _create_token(subject: Union[str, Any], token_type: str, minutes: int, family: Optional[str]) -> str:
+    now = datetime.utcnow()
+    to_encode = {
+        "exp": now + timedelta(minutes=minutes),
+        "iat": now,
+        "sub": str(subject),
+        "type": token_type,
+        # jti revokes this token alone; fam revokes everything issued from one login
+        "jti": uuid.uuid4().hex,
+        "fam": family or uuid.uuid4().hex,
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def create_access_token(subject: Union[str, Any], family: Optional[str] = None) -> str:
+    return _create_token(subject, "access", settings.ACCESS_TOKEN_EXPIRE_MINUTES, family)
+
+def create_refresh_token(subject: Union[str, Any], family: str) -> str:
+    return _create_token(subject, "refresh", settings.REFRESH_TOKEN_EXPIRE_MINUTES, family)
+
+def decode_token(token: str) -> dict:
+    # Raises JWTError on a bad signature or an expired token
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+def hash_pool_stats() -> dict:
+    completed = _hash_pool["completed"]
+    return {
+        **_hash_pool,
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "queued": max(0, _hash_pool["pending"] - settings.PASSWORD_HASH_WORKERS),
+        "seconds_avg": _hash_pool["seconds_total"] / completed if completed else 0.0,
+    }
+
+def _timed_call(fn: Callable, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+async def _run_in_hash_pool(fn: Callable, *args, admit: bool = True):
+    # Admission control: shed load with a 429 instead of letting a login storm
+    # build an unbounded queue behind the pool. Bulk callers pass admit=False
+    # and bound their own concurrency.
+    if admit and _hash_pool["pending"] >= settings.PASSWORD_HASH_MAX_PENDING:
+        _hash_pool["rejected"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many concurrent authentication requests, please retry",
+            headers={"Retry-After": "1"},
+        )
+    _hash_pool["pending"] += 1
+    start = time.perf_counter()
+    try:
+        result, hash_seconds = await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, _timed_call, fn, *args
+        )
+        password_hash_duration.observe(hash_seconds, operation=fn.__name__)
+        return result
+    finally:
+        elapsed = time.perf_counter() - start
+        _hash_pool["pending"] -= 1
+        _hash_pool["completed"] += 1
+        _hash_pool["seconds_total"] += elapsed
+        _hash_pool["seconds_max"] = max(_hash_pool["seconds_max"], elapsed)
+
+stats_gauges("password_hash_pool", "Argon2 worker pool", hash_pool_stats)
+
+def shutdown_hash_executor() -> None:
+    # Queued hashes belong to requests that are gone by shutdown
+    _hash_executor.shutdown(wait=False, cancel_futures=True)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_hash_pool(pwd_context.verify, plain_password, hashed_password)
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    # Returns (valid, new_hash); new_hash is set when the stored hash uses outdated parameters
+    return await _run_in_hash_pool(pwd_context.verify_and_update, plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str, admit: bool = True) -> str:
+    return await _run_in_hash_pool(pwd_context.hash, password, admit=admit)
@@ -0,0 +1,20 @@
+from decimal import Decimal
+from typing import Any, Iterable, List
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    # Pydantic emits Decimal as a string in JSON mode; keep the same wire format
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    # OPT_UTC_Z matches pydantic's "Z" suffix for UTC datetimes
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> List[dict]:
+    # Column rows keep select() order, which is the response schema's field order
+    return [dict(row._mapping) for row in rows]
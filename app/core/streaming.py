@@ -0,0 +1,99 @@
+import csv
+import json
+import tempfile
+from typing import AsyncIterator, BinaryIO, Optional, Tuple, Union
+from fastapi import Request
+
+MAX_LINE_BYTES = 1 << 20
+
+Record = Union[dict, ValueError]
+
+
+async def spool_request_body(request: Request, max_memory: int = 8 << 20) -> BinaryIO:
+    """Copy the request body to a temp file that only spills to disk past max_memory.
+
+    Streaming responses may consume the receive channel while they run, so bulk
+    endpoints spool the upload first and then process it from the file.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+async def iter_file_chunks(fileobj: BinaryIO, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    while chunk := fileobj.read(chunk_size):
+        yield chunk
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without holding more than one line in memory."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+        if len(buffer) > MAX_LINE_BYTES:
+            raise ValueError(f"Line longer than {MAX_LINE_BYTES} bytes")
+    if buffer:
+        yield buffer.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], fmt: str
+) -> AsyncIterator[Tuple[int, Record]]:
+    """Yield (line_number, record) from NDJSON or CSV (header row required).
+
+    Malformed lines come back as a ValueError in place of the record so callers
+    can report them per row and keep going.
+    """
+    header: Optional[list] = None
+    pending = ""
+    pending_line = 0
+    line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if fmt == "ndjson":
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            if not isinstance(record, dict):
+                yield line_no, ValueError("Expected a JSON object")
+                continue
+            yield line_no, record
+            continue
+
+        # CSV: a quoted field may span lines, so join until the quotes balance
+        pending = f"{pending}\n{line}" if pending else line
+        pending_line = pending_line or line_no
+        if pending.count('"') % 2:
+            continue
+        text, start_line, pending, pending_line = pending, pending_line, "", 0
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield start_line, dict(zip(header, values))
+
+    if pending:
+        yield pending_line, ValueError("Unterminated quoted field")
+
+
+def detect_format(content_type: Optional[str], default: str = "ndjson") -> str:
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "jsonlines" in content_type or "json" in content_type:
+        return "ndjson"
+    return default
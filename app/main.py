@@ -1,15 +1,36 @@
+import time
+
+# Cold start is measured from here: everything below is import cost
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.routers import health, auth, users, products, ai
+from app.core.lifespan import lifespan
+from app.core.logging_config import configure_logging
+from app.core.metrics import MetricsMiddleware
+from app.routers import health, auth, users, products, ai, metrics, admin
+
+def create_app() -> FastAPI:
+    configure_logging()
+
+    app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+    app.state.import_started = _import_started
+    # Added first so it sits inside MetricsMiddleware and its time is measured
+    app.add_middleware(CompressionMiddleware)
+    app.add_middleware(MetricsMiddleware)
 
-app = FastAPI(title=settings.PROJECT_NAME)
+    @app.get("/", include_in_schema=False)
+    async def root():
+        return {"message": "Welcome to FastAPI Backend", "docs": "/docs"}
 
-@app.get("/", include_in_schema=False)
-async def root():
-    return {"message": "Welcome to FastAPI Backend", "docs": "/docs"}
+    app.include_router(health.router)
+    app.include_router(auth.router)
+    app.include_router(users.router)
+    app.include_router(products.router)
+    app.include_router(ai.router)
+    app.include_router(metrics.router)
+    app.include_router(admin.router)
+    return app
 
-app.include_router(health.router)
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(products.router)
-app.include_router(ai.router)
+app = create_app()
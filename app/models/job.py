@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, text
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class Job(Base):
+    """Durable background job, used when JOB_BACKEND=database."""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    # queued -> running -> done | failed; retries go back to queued with a later run_at
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True))
+
+    # Workers claim with WHERE status = 'queued' AND run_at <= now() ORDER BY run_at
+    # ... FOR UPDATE SKIP LOCKED; finished jobs stay out of the index.
+    __table_args__ = (
+        Index(
+            "ix_jobs_queued_run_at", "run_at",
+            postgresql_where=text("status = 'queued'"), sqlite_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_jobs_running_locked_at", "locked_at",
+            postgresql_where=text("status = 'running'"), sqlite_where=text("status = 'running'"),
+        ),
+    )
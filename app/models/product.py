@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, Index, text
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -13,3 +13,17 @@ class Product(Base):
     category = Column(String, default="electronics")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
+
+    # Partial indexes for the hot catalog queries (migration 6ca46d3e66da). Queries
+    # must filter with `is_active == True` for the planner to match the predicate.
+    __table_args__ = (
+        Index(
+            "ix_products_active_id", "id",
+            postgresql_where=text("is_active"), sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_products_active_category_created", func.lower(category), created_at.desc(),
+            postgresql_where=text("is_active"), sqlite_where=text("is_active = 1"),
+        ),
+    )
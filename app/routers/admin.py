@@ -0,0 +1,52 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.deps import require_admin
+from app.core.serialization import dumps
+from app.core.streaming import detect_format, iter_file_chunks, iter_records, spool_request_body
+from app.services import user as user_service
+from app.services.product_ingest import ingest_products
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+@router.post("/users/import")
+async def import_users(
+    request: Request,
+    batch_size: int = Query(settings.USER_IMPORT_BATCH_SIZE, ge=1, le=5000),
+):
+    """Bulk-create users from NDJSON or CSV (columns: email,password).
+
+    Streams one NDJSON result per input row, then a summary line.
+    """
+    fmt = detect_format(request.headers.get("content-type"))
+    upload = await spool_request_body(request)
+
+    async def results():
+        # The session lives as long as the stream, not the request handler
+        try:
+            async with AsyncSessionLocal() as db:
+                records = iter_records(iter_file_chunks(upload), fmt)
+                async for result in user_service.import_users(db, records, batch_size):
+                    yield dumps(result) + b"\n"
+        finally:
+            upload.close()
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+@router.post("/products/import")
+async def import_products(
+    request: Request,
+    mode: Literal["replace", "upsert"] = Query("upsert", description="replace also deactivates products missing from the input"),
+    batch_size: int = Query(5000, ge=1, le=50000),
+):
+    """Load a CSV or NDJSON catalog and swap it in atomically.
+
+    The search index rebuild and cache warm-up run as background jobs.
+    """
+    fmt = detect_format(request.headers.get("content-type"))
+    with await spool_request_body(request) as upload:
+        async with AsyncSessionLocal() as db:
+            records = iter_records(iter_file_chunks(upload), fmt)
+            return await ingest_products(db, records, mode=mode, batch_size=batch_size, background=True)
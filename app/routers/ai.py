@@ -1,32 +1,82 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.deps import get_db
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.core.database import read_router
+from app.core.deps import require_admin, route_rate_limit
+from app.core.response_cache import Uncached, cached_json_response
+from app.core.serialization import rows_to_dicts
 from app.schemas.ai import AISearchQuery
-from app.schemas.product import ProductOut
-from app.services.ai_search import extract_intent, search_products, fallback_search
+from app.schemas.product import ProductSearchResult
+from app.services.ai_search import (
+    extract_intent, search_products, fallback_search, semantic_search, normalize_query,
+    intent_cache_stats, intent_source_stats, openai_breaker,
+)
+from app.services.product import get_catalog_version, parse_fields
 
 router = APIRouter()
 
-@router.post("/ai/search", response_model=List[ProductOut])
+# Handlers return pre-rendered JSON, so the models only document the response
+@router.post(
+    "/ai/search",
+    responses={200: {"model": List[ProductSearchResult]}},
+    dependencies=[Depends(route_rate_limit)],
+)
 async def ai_product_search(
+    request: Request,
     search_query: AISearchQuery,
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[str] = Query(None, description="Comma-separated product fields to return, e.g. title,price; id is always included"),
 ):
-    intent = await extract_intent(search_query.query)
-    
-    # If extraction was successful (has category or max_price), use smart search
-    if intent.category or intent.max_price:
-        results = await search_products(db, intent)
-    else:
-        # If extraction failed or returned only keywords, use fallback/robust search
-        # Note: extract_intent returns just keywords on failure or if no specific intent found
-        # We can still use search_products with just keywords, but let's stick to the plan's logic flow
-        # actually search_products handles keywords too, so we can use it if intent has anything useful
-        # but let's follow the requested flow: if AI fails -> fallback
-        if not intent.keywords and not intent.category and not intent.max_price:
-             results = await fallback_search(db, search_query.query)
-        else:
-             results = await search_products(db, intent)
-             
-    return results
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def _with_scores(items, scores):
+        # Ranking needs every column, so trimming happens on the way out
+        if selected is not None:
+            items = [{name: item[name] for name in selected} for item in items]
+        if search_query.debug and scores is not None:
+            for item, score in zip(items, scores):
+                item["score"] = score
+        return items
+
+    async def build():
+        # Resolve the intent first: a slow LLM call must not hold a pooled connection
+        intent, degraded = await extract_intent(search_query.query)
+        items = await search(intent)
+        # Don't keep serving OpenAI-outage results once it has recovered
+        return Uncached(items) if degraded else items
+
+    async def search(intent):
+        async with await read_router.open_session() as db:
+            if search_query.mode == "semantic":
+                # Intent still supplies the max_price filter
+                results, scores = await semantic_search(db, normalize_query(search_query.query), intent)
+                return _with_scores(rows_to_dicts(results), scores)
+
+            # If extraction was successful (has category or max_price), use smart search
+            if intent.category or intent.max_price:
+                results, scores = await search_products(db, intent)
+            else:
+                # If extraction failed or returned only keywords, use fallback/robust search
+                # Note: when the LLM fails or its breaker is open, extract_intent returns the local parser's intent
+                # We can still use search_products with just keywords, but let's stick to the plan's logic flow
+                # actually search_products handles keywords too, so we can use it if intent has anything useful
+                # but let's follow the requested flow: if AI fails -> fallback
+                if not intent.keywords and not intent.category and not intent.max_price:
+                     results, scores = await fallback_search(db, search_query.query)
+                else:
+                     results, scores = await search_products(db, intent)
+
+            return _with_scores(rows_to_dicts(results), scores)
+
+    # Identical queries against an unchanged catalog skip both the LLM and the database
+    key = (
+        "ai_search", get_catalog_version(), search_query.mode, search_query.debug, selected,
+        normalize_query(search_query.query),
+    )
+    return await cached_json_response(request, key, build)
+
+@router.get("/ai/stats", include_in_schema=False, dependencies=[Depends(require_admin)])
+async def ai_search_stats():
+    return {"intent_cache": intent_cache_stats(), "intent_sources": intent_source_stats(),
+            "openai_breaker": openai_breaker.stats()}
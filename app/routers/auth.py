@@ -2,10 +2,10 @@ from typing import Annotated
 from fastapi import APIRouter, status, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.user import UserCreate, UserResponse
-from app.schemas.token import UserLogin, Token
+from app.schemas.token import UserLogin, Token, TokenData, RefreshRequest
 from app.services import user as user_service
-from app.core.security import create_access_token
-from app.core.deps import get_current_active_user, get_db
+from app.services import token as token_service
+from app.core.deps import get_current_active_user, get_db, get_token_data, login_rate_limit
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -13,7 +13,8 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 async def signup(user: UserCreate, db: Annotated[AsyncSession, Depends(get_db)]):
     return await user_service.create_user(db, user)
 
-@router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
+@router.post("/login", response_model=Token, status_code=status.HTTP_200_OK,
+             dependencies=[Depends(login_rate_limit)])
 async def login(user_in: UserLogin, db: Annotated[AsyncSession, Depends(get_db)]):
     user = await user_service.authenticate_user(db, user_in.email, user_in.password)
     if not user:
@@ -21,8 +22,18 @@ async def login(user_in: UserLogin, db: Annotated[AsyncSession, Depends(get_db)]
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
-    access_token = create_access_token(subject=user.email)
-    return {"access_token": access_token, "token_type": "bearer"}
+    return token_service.issue_tokens(user.email)
+
+@router.post("/refresh", response_model=Token, status_code=status.HTTP_200_OK)
+async def refresh(body: RefreshRequest, db: Annotated[AsyncSession, Depends(get_db)]):
+    return await token_service.rotate_refresh_token(db, body.refresh_token)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(token_data: Annotated[TokenData, Depends(get_token_data)]):
+    # Ends the login session: its access tokens and refresh tokens alike.
+    # Tokens issued before families existed simply run out their expiry.
+    if token_data.family:
+        await token_service.revoke_family(token_data.family)
 
 @router.get("/profile", response_model=UserResponse)
 async def read_users_me(
@@ -1,8 +1,25 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from app.core.deps import require_admin
 from app.schemas.health import HealthCheck
+from app.core.security import hash_pool_stats
+from app.core.database import get_pool_stats, read_router
+from app.core.jobs import job_queue
+from app.core.response_cache import response_cache
+from app.core.lifespan import startup_report
 
 router = APIRouter()
 
 @router.get("/health", response_model=HealthCheck)
 async def health_check():
     return {"status": "ok hello Dushyant", "version": "0.1.0"}
+
+@router.get("/health/stats", include_in_schema=False, dependencies=[Depends(require_admin)])
+async def runtime_stats():
+    return {
+        "password_hash_pool": hash_pool_stats(),
+        "db_pool": get_pool_stats(),
+        "read_replicas": read_router.stats(),
+        "response_cache": response_cache.stats(),
+        "startup": startup_report(),
+        "job_queue": job_queue.stats(),
+    }
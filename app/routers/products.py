@@ -1,21 +1,87 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.deps import get_db
-from app.services.product import get_paginated_products
-from app.schemas.product import PaginatedProductResponse
+from app.core.deps import get_read_db
+from app.core.response_cache import cached_json_response
+from app.core.config import settings
+from app.core.database import read_router
+from app.core.serialization import dumps, rows_to_dicts
+from app.services.product import (
+    get_paginated_products, get_catalog_version, encode_cursor, decode_cursor, stream_products_for_export,
+    get_export_watermark, parse_fields,
+)
+from app.schemas.product import PaginatedProductResponse, ProductOut
+from app.services.catalog_snapshot import catalog_snapshot
 
 router = APIRouter()
 
-@router.get("/products", response_model=PaginatedProductResponse)
+# Handlers return pre-rendered JSON, so the models only document the response
+@router.get("/products", responses={200: {"model": PaginatedProductResponse}})
 async def get_products(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number, starting from 1"),
     limit: int = Query(10, ge=1, le=100, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's nextCursor; takes precedence over page"),
+    fields: Optional[str] = Query(None, description="Comma-separated product fields to return, e.g. title,price; id is always included"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    products, has_more = await get_paginated_products(db, page, limit)
-    
-    return {
-        "data": products,
-        "page": page,
-        "hasMore": has_more
-    }
+    after_id = None
+    if cursor is not None:
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        products, has_more = await get_paginated_products(db, page, limit, after_id=after_id, fields=selected)
+        return {
+            "data": rows_to_dicts(products),
+            "page": page,
+            "hasMore": has_more,
+            "nextCursor": encode_cursor(products[-1].id) if has_more else None
+        }
+
+    key = ("products", get_catalog_version(), page, limit, after_id, selected)
+    return await cached_json_response(request, key, build)
+
+@router.get("/products/featured", responses={200: {"model": List[ProductOut]}})
+async def get_featured_products(request: Request):
+    # Served from the in-memory snapshot; no database round trip once warm
+    async def build():
+        return rows_to_dicts(await catalog_snapshot.get_featured())
+
+    return await cached_json_response(request, ("featured", catalog_snapshot.version), build)
+
+@router.get("/products/export")
+async def export_products(
+    updated_since: Optional[datetime] = Query(None, description="Only products changed after this time, including deactivated ones"),
+):
+    """Stream the catalog as NDJSON, one product per line.
+
+    Pass the X-Export-Started-At header of the previous export as updated_since
+    to fetch only what changed. Consecutive incremental exports overlap by
+    EXPORT_OVERLAP_SECONDS, so consumers must apply rows idempotently by id.
+    """
+    # Taken from the database clock, not ours: it is what stamps updated_at
+    async with await read_router.open_session() as db:
+        started_at = await get_export_watermark(db)
+
+    async def lines():
+        # Opened here rather than via Depends so the session lives as long as the stream
+        async with await read_router.open_session() as db:
+            async for rows in stream_products_for_export(
+                db, updated_since, settings.EXPORT_BATCH_SIZE, settings.EXPORT_OVERLAP_SECONDS
+            ):
+                yield b"".join(dumps(row) + b"\n" for row in rows_to_dicts(rows))
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"X-Export-Started-At": started_at.isoformat()},
+    )
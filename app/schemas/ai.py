@@ -1,8 +1,12 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 class AISearchQuery(BaseModel):
     query: str
+    # "semantic" ranks by embedding similarity instead of keyword matching
+    mode: Literal["keyword", "semantic"] = "keyword"
+    # Include the per-signal ranking scores with each result
+    debug: bool = False
 
 class IntentData(BaseModel):
     category: Optional[str] = None
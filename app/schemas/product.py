@@ -1,5 +1,5 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
 from decimal import Decimal
 
@@ -11,6 +11,12 @@ class ProductBase(BaseModel):
     category: str
     is_active: bool = True
 
+class ProductImport(ProductBase):
+    # Rows carrying an id update that product; rows without one match on title and category
+    id: Optional[int] = None
+    price: Decimal = Field(ge=0, max_digits=10, decimal_places=2)
+    category: str = "electronics"
+
 class ProductOut(ProductBase):
     id: int
     created_at: datetime
@@ -18,7 +24,12 @@ class ProductOut(ProductBase):
     class Config:
         from_attributes = True
 
+class ProductSearchResult(ProductOut):
+    # Ranking breakdown, only present for debug searches
+    score: Optional[Dict[str, float]] = None
+
 class PaginatedProductResponse(BaseModel):
     data: List[ProductOut]
     page: int
     hasMore: bool
+    nextCursor: Optional[str] = None
@@ -4,9 +4,15 @@ from typing import Optional
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
 
 class TokenData(BaseModel):
     email: Optional[str] = None
+    jti: Optional[str] = None
+    family: Optional[str] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 class UserLogin(BaseModel):
     email: str
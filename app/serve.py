@@ -0,0 +1,60 @@
+"""Production entry point: python -m app.serve
+
+Runs uvicorn with WEB_CONCURRENCY worker processes (default: one per CPU). Each
+worker imports the app and runs its own lifespan, so database pools and HTTP
+clients are created after the fork. For gunicorn process management use
+`gunicorn -c gunicorn.conf.py app.main:app` instead.
+"""
+import importlib.util
+import logging
+import os
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def select_loop() -> str:
+    if settings.SERVER_LOOP != "auto":
+        return settings.SERVER_LOOP
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def select_http() -> str:
+    if settings.SERVER_HTTP != "auto":
+        return settings.SERVER_HTTP
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def worker_count() -> int:
+    return settings.WEB_CONCURRENCY or os.cpu_count() or 1
+
+
+def main() -> None:
+    loop, http, workers = select_loop(), select_http(), worker_count()
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    logger.info("Starting %d worker(s) on %s:%d with loop=%s http=%s",
+                workers, settings.HOST, settings.PORT, loop, http)
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        proxy_headers=True,
+        forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS,
+        # Request timing is already in /metrics and the app's structured logs
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
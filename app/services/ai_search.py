@@ -1,12 +1,56 @@
+import asyncio
 import json
-from openai import AsyncOpenAI
+import logging
+import re
+import time
+from typing import List, Optional
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, desc
 from app.models.product import Product
 from app.schemas.ai import IntentData
 from app.core.config import settings
+from app.core.cache import SingleFlight, create_cache_backend
+from app.core.metrics import gauge, histogram, stats_gauges
+from app.core.resilience import CircuitBreaker, hedged
+from app.services.search_engine import get_search_engine
+from app.services.catalog_snapshot import catalog_snapshot
+from app.services.embeddings import semantic_index
+from app.services.product import PRODUCT_COLUMNS
+from app.services.ranking import rank_candidates
 
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+logger = logging.getLogger(__name__)
+
+# Created per worker by the app lifespan (or on first use); None without an API key
+client = None
+_client_initialized = False
+
+def get_openai_client():
+    global client, _client_initialized
+    if not _client_initialized:
+        _client_initialized = True
+        if settings.OPENAI_API_KEY:
+            # Optional dependency: without the package, intents come from the local parser
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                logger.warning("OPENAI_API_KEY is set but the openai package is not installed")
+            else:
+                client = AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    base_url=settings.OPENAI_BASE_URL,
+                    timeout=settings.OPENAI_TIMEOUT_SECONDS,
+                    max_retries=settings.OPENAI_MAX_RETRIES,
+                )
+    return client
+
+async def close_openai_client() -> None:
+    global client, _client_initialized
+    if client is not None:
+        await client.close()
+    client, _client_initialized = None, False
+
+# While OpenAI keeps failing, searches skip it and use the local fallback path
+openai_breaker = CircuitBreaker(settings.OPENAI_BREAKER_FAILURE_THRESHOLD, settings.OPENAI_BREAKER_RESET_SECONDS)
 
 CATEGORY_MAPPING = {
     "laptop": "electronics",
@@ -22,35 +66,164 @@ CATEGORY_MAPPING = {
     "television": "electronics"
 }
 
-async def extract_intent(query: str) -> IntentData:
+STOP_WORDS = {
+    "a", "an", "the", "for", "with", "to", "of", "in", "on", "at", "and", "or", "me", "my", "i",
+    "want", "need", "show", "find", "get", "buy", "looking", "please", "some", "any", "good",
+    "best", "cheap", "affordable", "new", "budget", "price", "priced", "rs", "inr", "rupees",
+}
+
+# "under 20000", "below 5k", "less than 1.5 lakh", "upto rs 50,000"
+PRICE_PATTERN = re.compile(
+    r"\b(?:under|below|less than|within|up ?to|max(?:imum)?|cheaper than)\s*"
+    r"(?:rs\.?|inr|₹)?\s*(\d[\d,]*(?:\.\d+)?)\s*(k|lakhs?|lacs?|l)?\b"
+)
+PRICE_MULTIPLIERS = {"k": 1_000, "l": 100_000, "lakh": 100_000, "lakhs": 100_000, "lac": 100_000, "lacs": 100_000}
+
+_intent_cache = create_cache_backend(
+    "intent", settings.INTENT_CACHE_MAX_SIZE, settings.INTENT_CACHE_TTL_SECONDS
+)
+_intent_flight = SingleFlight()
+
+# Where each intent came from, so we can track how many LLM calls the local parser avoids
+intent_source_counts = {"local": 0, "cache": 0, "llm": 0, "llm_failed": 0, "no_llm": 0, "breaker_open": 0}
+
+openai_request_duration = histogram(
+    "openai_request_duration_seconds", "Intent extraction round trip to OpenAI", ("outcome",)
+)
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+def intent_cache_stats() -> dict:
+    stats = _intent_cache.stats()
+    stats["in_flight"] = _intent_flight.in_flight()
+    return stats
+
+def intent_source_stats() -> dict:
+    total = sum(intent_source_counts.values())
+    return {
+        **intent_source_counts,
+        "total": total,
+        "local_share": intent_source_counts["local"] / total if total else 0.0,
+    }
+
+stats_gauges("intent_cache", "LLM intent cache", intent_cache_stats)
+stats_gauges("intent_source", "Where search intents came from", intent_source_stats)
+gauge("openai_breaker_open", "1 while the OpenAI circuit breaker is rejecting calls",
+      lambda: 0 if openai_breaker.state == CircuitBreaker.CLOSED else 1)
+
+def stem_keyword(token: str) -> str:
+    # Plural folding against the known product nouns: headphones -> headphone, earbuds -> earbud
+    if token in CATEGORY_MAPPING:
+        return token
+    for suffix in ("es", "s"):
+        if token.endswith(suffix) and token[:-len(suffix)] in CATEGORY_MAPPING:
+            return token[:-len(suffix)]
+    return token
+
+def parse_intent_locally(query: str) -> tuple[IntentData, float]:
+    """Rule-based intent extraction for a normalized query.
+
+    Returns the intent and a confidence in [0, 1]: the share of content words the
+    rules understood. Queries built only from a known product noun, a price phrase
+    and stop words score 1.0.
+    """
+    max_price = None
+    match = PRICE_PATTERN.search(query)
+    if match:
+        amount = float(match.group(1).replace(",", ""))
+        max_price = amount * PRICE_MULTIPLIERS.get(match.group(2) or "", 1)
+        query = query[:match.start()] + " " + query[match.end():]
+
+    tokens = [t for t in re.findall(r"[a-z0-9]+", query) if t not in STOP_WORDS]
+    keywords = [stem_keyword(t) for t in tokens]
+    known = [k for k in keywords if k in CATEGORY_MAPPING]
+
+    if not keywords:
+        confidence = 1.0 if max_price else 0.0
+    else:
+        confidence = len(known) / len(keywords)
+
+    # The main product noun, plus every word the rules didn't recognise: brand and
+    # model terms ("samsung", "16gb") are what the keyword search needs most
+    unknown = [k for k in keywords if k not in CATEGORY_MAPPING]
+    return IntentData(
+        keywords=known[:1] + unknown,
+        max_price=max_price,
+        category=map_category(known),
+    ), confidence
+
+async def extract_intent(query: str) -> tuple[IntentData, bool]:
+    """Returns the intent and whether it is degraded: OpenAI failed or its breaker
+    is open. Results built from a degraded intent should not be cached."""
     # 1. Normalize query
-    query = query.lower().strip()
+    query = normalize_query(query)
     
     # 3. Category Mapping check (simple pre-check or use LLM)
     # The user rules say: "Extract main keyword... Category mapping... Do NOT expect category name from user"
     # We will let the LLM do the extraction but we can also infer category from keywords if LLM fails or for fallback.
     
-    if not client:
+    # Easy queries ("phone under 20000") never need the LLM
+    local_intent, confidence = parse_intent_locally(query)
+    if confidence >= settings.LOCAL_INTENT_MIN_CONFIDENCE:
+        intent_source_counts["local"] += 1
+        return local_intent, False
+
+    if get_openai_client() is None:
         # Fallback extraction logic
-        keywords = query.split()
-        return IntentData(keywords=keywords)
+        intent_source_counts["no_llm"] += 1
+        return local_intent, False
+
+    # Serve repeated queries from the cache, and let concurrent identical
+    # misses share a single OpenAI round trip
+    cached = await _intent_cache.get(query)
+    if cached is not None:
+        intent_source_counts["cache"] += 1
+        return IntentData.model_validate_json(cached), False
 
+    # Without OpenAI, the low-confidence local intent is still better than nothing
+    if not openai_breaker.allow():
+        intent_source_counts["breaker_open"] += 1
+        return local_intent, True
+    return await _intent_flight.do(query, lambda: _extract_and_cache_intent(query))
+
+async def _extract_and_cache_intent(query: str) -> tuple[IntentData, bool]:
+    intent, from_llm = await _extract_intent_llm(query)
+    intent_source_counts["llm" if from_llm else "llm_failed"] += 1
+    # Only cache real LLM answers; a failed call should be retried next time
+    if not from_llm:
+        return parse_intent_locally(query)[0], True
+    await _intent_cache.set(query, intent.model_dump_json())
+    return intent, False
+
+def _request_intent(query: str):
+    return client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {
+                "role": "system", 
+                "content": "You are a helpful assistant that extracts search intent. "
+                           "Extract the 'main_keyword' (e.g. laptop, phone) from the query. "
+                           "Extract 'max_price' only if explicitly mentioned. "
+                           "Return JSON with keys: 'main_keyword' (string), 'max_price' (number or null). "
+                           "Do not return markdown."
+            },
+            {"role": "user", "content": query}
+        ],
+        temperature=0
+    )
+
+async def _extract_intent_llm(query: str) -> tuple[IntentData, bool]:
+    start = time.perf_counter()
+    outcome = "error"
     try:
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "You are a helpful assistant that extracts search intent. "
-                               "Extract the 'main_keyword' (e.g. laptop, phone) from the query. "
-                               "Extract 'max_price' only if explicitly mentioned. "
-                               "Return JSON with keys: 'main_keyword' (string), 'max_price' (number or null). "
-                               "Do not return markdown."
-                },
-                {"role": "user", "content": query}
-            ],
-            temperature=0
+        # One deadline covers SDK retries and the hedged second attempt
+        response = await asyncio.wait_for(
+            hedged(lambda: _request_intent(query), settings.OPENAI_HEDGE_DELAY_SECONDS),
+            settings.OPENAI_TIMEOUT_SECONDS,
         )
+        openai_breaker.record_success()
+        outcome = "ok"
         content = response.choices[0].message.content
         data = json.loads(content)
         
@@ -66,89 +239,81 @@ async def extract_intent(query: str) -> IntentData:
             category=None # We will map category in search_products or here. 
                           # User Rule 3 says "Category mapping: laptop -> electronics". 
                           # We can derive category from the keyword.
-        )
-    except Exception:
-        return IntentData(keywords=query.split())
+        ), True
+    except asyncio.CancelledError:
+        # No outcome to record, but a half-open probe must not stay claimed forever
+        openai_breaker.release()
+        outcome = "cancelled"
+        raise
+    except Exception as e:
+        if outcome != "ok":
+            # Only transport failures count against the provider, not unparseable answers
+            outcome = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+            openai_breaker.record_failure()
+        logger.warning("Intent extraction via OpenAI failed", exc_info=True)
+        return IntentData(), False
+    finally:
+        openai_request_duration.observe(time.perf_counter() - start, outcome=outcome)
+
+def map_category(keywords: List[str]) -> Optional[str]:
+    for k in keywords:
+        if k in CATEGORY_MAPPING:
+            return CATEGORY_MAPPING[k]
+    return None
 
-async def search_products(db: AsyncSession, intent: IntentData):
+async def search_products(db: AsyncSession, intent: IntentData, limit: int = 8):
     # Rule 3 & 4: Map keywords to category, never require exact category match
-    mapped_category = None
-    if intent.keywords:
-         for k in intent.keywords:
-             if k in CATEGORY_MAPPING:
-                 mapped_category = CATEGORY_MAPPING[k]
-                 break
-    
-    # Rule 5: Search Priority (OR logic)
-    # title LIKE %keyword% OR description LIKE %keyword% OR category = mapped_category
-    
-    stmt = select(Product).filter(Product.is_active == True)
-    
-    or_conditions = []
-    if intent.keywords:
-        for keyword in intent.keywords:
-            or_conditions.append(Product.title.ilike(f"%{keyword}%"))
-            or_conditions.append(Product.description.ilike(f"%{keyword}%"))
-    
-    if mapped_category:
-        or_conditions.append(Product.category.ilike(f"%{mapped_category}%"))
-        
-    if or_conditions:
-        stmt = stmt.filter(or_(*or_conditions))
-    
-    # Rule 6: Price Logic (Only if explicitly mentioned)
-    if intent.max_price:
-        stmt = stmt.filter(Product.price <= intent.max_price)
-        
-    result = await db.execute(stmt.limit(8))
-    products = result.scalars().all()
-    
+    mapped_category = map_category(intent.keywords)
+
+    # Over-fetch, then let hybrid ranking pick the best `limit`
+    engine = get_search_engine(db)
+    candidates = await engine.search(
+        db, intent.keywords, category=mapped_category, max_price=intent.max_price,
+        limit=settings.SEARCH_CANDIDATES,
+    )
+
     # Rule 7: Fallback
-    # If search returns empty -> return top 6 products from electronics category
-    if not products:
-        stmt_fallback = select(Product).filter(
-            Product.is_active == True,
-            Product.category.ilike("electronics")
-        ).order_by(desc(Product.created_at))
-        
-        result_fallback = await db.execute(stmt_fallback.limit(6))
-        products = result_fallback.scalars().all()
-    
-    return products
+    # If search returns empty -> return top 6 products from electronics category,
+    # served from the in-memory snapshot rather than a second query
+    if not candidates:
+        return await catalog_snapshot.get_fallback(), None
 
-async def fallback_search(db: AsyncSession, query: str):
+    return rank_candidates(
+        candidates, intent.keywords, mapped_category, intent.max_price, limit,
+        query_text=" ".join(intent.keywords),
+    )
+
+async def fallback_search(db: AsyncSession, query: str, limit: int = 8):
     # Same logic but without LLM extraction
     query = query.lower().strip()
     keywords = query.split()
-    
-    mapped_category = None
-    for k in keywords:
-        if k in CATEGORY_MAPPING:
-            mapped_category = CATEGORY_MAPPING[k]
-            break
-            
-    stmt = select(Product).filter(Product.is_active == True)
-    
-    or_conditions = []
-    for keyword in keywords:
-        or_conditions.append(Product.title.ilike(f"%{keyword}%"))
-        or_conditions.append(Product.description.ilike(f"%{keyword}%"))
-        
-    if mapped_category:
-        or_conditions.append(Product.category.ilike(f"%{mapped_category}%"))
-        
-    if or_conditions:
-        stmt = stmt.filter(or_(*or_conditions))
-        
-    result = await db.execute(stmt.limit(8))
-    products = result.scalars().all()
-    
-    if not products:
-        stmt_fallback = select(Product).filter(
-            Product.is_active == True,
-            Product.category.ilike("electronics")
-        ).order_by(desc(Product.created_at))
-        result_fallback = await db.execute(stmt_fallback.limit(6))
-        products = result_fallback.scalars().all()
-        
-    return products
+    category = map_category(keywords)
+
+    engine = get_search_engine(db)
+    candidates = await engine.search(db, keywords, category=category, limit=settings.SEARCH_CANDIDATES)
+
+    # Rule 7: Fallback
+    # If search returns empty -> return top 6 products from electronics category,
+    # served from the in-memory snapshot rather than a second query
+    if not candidates:
+        return await catalog_snapshot.get_fallback(), None
+
+    return rank_candidates(candidates, keywords, category, limit=limit, query_text=query)
+
+async def semantic_search(db: AsyncSession, query: str, intent: IntentData, limit: int = 8):
+    # Vector top-k over title+description embeddings, re-ranked with the lexical and price signals
+    ids, _ = await semantic_index.search(query, settings.SEARCH_CANDIDATES, intent.max_price)
+    if len(ids) == 0:
+        return await catalog_snapshot.get_fallback(), None
+
+    result = await db.execute(
+        select(*PRODUCT_COLUMNS).where(Product.id.in_(ids.tolist()), Product.is_active == True)
+    )
+    candidates = result.all()
+    if not candidates:
+        return await catalog_snapshot.get_fallback(), None
+
+    return rank_candidates(
+        candidates, intent.keywords, map_category(intent.keywords), intent.max_price, limit,
+        query_text=query,
+    )
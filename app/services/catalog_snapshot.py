@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional
+from sqlalchemy import Row
+from app.core.config import settings
+from app.core.database import read_router
+from app.core.metrics import counter, gauge
+from app.services.product import get_catalog_version, get_newest_products
+
+logger = logging.getLogger(__name__)
+
+snapshot_refreshes = counter("catalog_snapshot_refreshes", "Catalog snapshot refresh attempts", ("outcome",))
+
+
+class CatalogSnapshot:
+    """In-process copy of the catalog answers that are the same for every user.
+
+    Holds the empty-search electronics fallback and the featured list. Reads
+    never touch the database once warm. A changed catalog version, or an entry
+    older than CATALOG_SNAPSHOT_REFRESH_SECONDS, triggers a background refresh
+    while the previous snapshot keeps being served.
+    """
+
+    def __init__(self):
+        self.fallback: Optional[List[Row]] = None
+        self.featured: Optional[List[Row]] = None
+        self.version = -1
+        self.loaded_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self.version != get_catalog_version()
+            or time.monotonic() - self.loaded_at >= settings.CATALOG_SNAPSHOT_REFRESH_SECONDS
+        )
+
+    def staleness_seconds(self) -> Optional[float]:
+        return time.monotonic() - self.loaded_at if self.fallback is not None else None
+
+    async def _ensure_fresh(self) -> None:
+        if self.fallback is None:
+            # Cold start: callers wait for the first load
+            await self.refresh()
+        elif self.is_stale:
+            self.refresh_in_background()
+
+    async def get_fallback(self) -> List[Row]:
+        await self._ensure_fresh()
+        return self.fallback
+
+    async def get_featured(self) -> List[Row]:
+        await self._ensure_fresh()
+        return self.featured
+
+    def refresh_in_background(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        return self._refresh_task
+
+    async def refresh(self) -> None:
+        await asyncio.shield(self.refresh_in_background())
+
+    async def _refresh(self) -> None:
+        # Read the version first: a write landing mid-refresh leaves us marked stale
+        version = get_catalog_version()
+        try:
+            async with await read_router.open_session() as db:
+                # Rule 7: if search returns empty -> top 6 products from electronics category
+                fallback = await get_newest_products(db, 6, category="electronics")
+                featured = await get_newest_products(db, settings.FEATURED_PRODUCTS_LIMIT)
+        except Exception:
+            snapshot_refreshes.inc(outcome="error")
+            if self.fallback is None:
+                raise
+            logger.warning("Catalog snapshot refresh failed; serving previous snapshot", exc_info=True)
+            return
+        self.fallback, self.featured = fallback, featured
+        self.version, self.loaded_at = version, time.monotonic()
+        snapshot_refreshes.inc(outcome="ok")
+
+
+catalog_snapshot = CatalogSnapshot()
+
+gauge(
+    "catalog_snapshot_staleness_seconds", "Age of the in-memory fallback/featured snapshot",
+    catalog_snapshot.staleness_seconds,
+)
+gauge(
+    "catalog_snapshot_versions_behind", "Catalog versions committed since the snapshot was taken",
+    lambda: get_catalog_version() - catalog_snapshot.version if catalog_snapshot.fallback is not None else None,
+)
@@ -0,0 +1,363 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import read_router
+from app.core.metrics import gauge, histogram
+from app.models.product import Product
+from app.services.product import get_catalog_version
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Lets the offline model connect needs to products ("music on the train" -> earbuds).
+# Expanded terms are added at reduced weight.
+CONCEPT_EXPANSIONS = {
+    "music": ["headphone", "earbud", "speaker", "audio"],
+    "listen": ["headphone", "earbud", "speaker", "audio"],
+    "song": ["headphone", "earbud", "speaker"],
+    "audio": ["headphone", "earbud", "speaker"],
+    "commute": ["earbud", "headphone"],
+    "train": ["earbud", "headphone"],
+    "travel": ["earbud", "headphone", "camera"],
+    "photo": ["camera", "lens"],
+    "picture": ["camera"],
+    "phone": ["smartphone", "mobile"],
+    "mobile": ["smartphone", "phone"],
+    "call": ["phone", "mobile"],
+    "text": ["phone", "mobile"],
+    "work": ["laptop", "notebook", "monitor"],
+    "code": ["laptop", "notebook"],
+    "study": ["laptop", "tablet"],
+    "read": ["tablet", "ereader"],
+    "fitness": ["smartwatch", "tracker"],
+    "run": ["smartwatch", "tracker", "earbud"],
+    "workout": ["smartwatch", "tracker", "earbud"],
+    "gaming": ["console", "mouse", "keyboard", "headset"],
+    "movie": ["tv", "television", "projector"],
+    "watch": ["tv", "television", "smartwatch"],
+}
+EXPANSION_WEIGHT = 0.5
+
+semantic_search_duration = histogram(
+    "semantic_search_duration_seconds", "Vector top-k time, excluding the row fetch", ("index",)
+)
+
+
+def _stem(token: str) -> str:
+    for suffix in ("es", "s"):
+        if token.endswith(suffix) and len(token) > len(suffix) + 2:
+            return token[:-len(suffix)]
+    return token
+
+
+class Embedder(ABC):
+    """Maps texts to L2-normalized float32 vectors of size `dim`."""
+
+    dim: int
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        ...
+
+
+class HashingEmbedder(Embedder):
+    """Deterministic, dependency-free embedding model for offline use and tests.
+
+    Words, their stems, concept expansions and character trigrams are hashed
+    (signed feature hashing) into `dim` buckets. Identical input gives identical
+    vectors on every machine.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+        return digest % self.dim, 1.0 if (digest >> 63) & 1 else -1.0
+
+    def _features(self, text: str):
+        for token in _TOKEN_RE.findall(text.lower()):
+            stem = _stem(token)
+            yield f"w:{stem}", 1.0
+            for concept in CONCEPT_EXPANSIONS.get(stem, ()):
+                yield f"w:{concept}", EXPANSION_WEIGHT
+            padded = f"#{stem}#"
+            for i in range(len(padded) - 2):
+                yield f"c:{padded[i:i + 3]}", 0.25
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                bucket, sign = self._bucket(feature)
+                out[row, bucket] += sign * weight
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+
+CURRENT_POINTER = "CURRENT"
+_LEGACY_FILES = {f"{name}.npy" for name in ("ids", "prices", "vectors", "centroids", "offsets")}
+
+
+def current_version(path: str) -> Optional[str]:
+    """The version directory a saved index's CURRENT pointer names, if any."""
+    try:
+        with open(os.path.join(path, CURRENT_POINTER)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class VectorIndex:
+    """Cosine top-k over a float32 matrix, with an optional IVF coarse quantizer.
+
+    Rows are stored grouped by IVF list, so each list is a contiguous slice
+    that can be read straight from a memory-mapped file.
+    """
+
+    def __init__(self, ids: np.ndarray, prices: np.ndarray, vectors: np.ndarray,
+                 centroids: Optional[np.ndarray] = None, offsets: Optional[np.ndarray] = None):
+        self.ids = ids
+        self.prices = prices
+        self.vectors = vectors
+        self.centroids = centroids
+        self.offsets = offsets
+        self._id_order: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, ids: np.ndarray, prices: np.ndarray, vectors: np.ndarray, ann_threshold: int) -> "VectorIndex":
+        if len(ids) < ann_threshold:
+            return cls(ids, prices, vectors)
+        nlist = int(min(4096, max(16, np.sqrt(len(ids)))))
+        centroids = _spherical_kmeans(vectors, nlist)
+        assignments = _assign(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.searchsorted(assignments[order], np.arange(nlist + 1))
+        return cls(ids[order], prices[order], vectors[order], centroids, offsets)
+
+    def search(self, query: np.ndarray, k: int, max_price: Optional[float] = None,
+               nprobe: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        if self.centroids is None:
+            rows = slice(None)
+            vectors, ids, prices = self.vectors, self.ids, self.prices
+        else:
+            probe = np.argpartition(-(self.centroids @ query), min(nprobe, len(self.centroids)) - 1)[:nprobe]
+            rows = np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1]) for c in probe])
+            vectors, ids, prices = self.vectors[rows], self.ids[rows], self.prices[rows]
+
+        scores = vectors @ query
+        if max_price is not None:
+            scores = np.where(prices <= max_price, scores, -np.inf)
+        k = min(k, len(scores))
+        if k == 0:
+            return ids[:0], scores[:0]
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top = top[np.isfinite(scores[top])]
+        return ids[top], scores[top]
+
+    def vectors_for(self, ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Stored vectors for `ids`, plus a mask of which ids the index holds."""
+        if self._id_order is None:
+            self._id_order = np.argsort(self.ids, kind="stable")
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(self.ids) == 0:
+            return np.zeros((len(ids), self.vectors.shape[1]), dtype=np.float32), np.zeros(len(ids), dtype=bool)
+        sorted_ids = self.ids[self._id_order]
+        pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        found = sorted_ids[pos] == ids
+        return self.vectors[self._id_order[pos]], found
+
+    def save(self, path: str) -> str:
+        """Writes the index as a new version directory under `path` and makes it current.
+
+        Readers only follow the CURRENT pointer, which is swapped with a single rename,
+        so they never see a mix of old and new files. Returns the version name.
+        """
+        os.makedirs(path, exist_ok=True)
+        version = f"v{time.time_ns()}-{os.getpid()}"
+        directory = os.path.join(path, version)
+        os.makedirs(f"{directory}.tmp")
+        arrays = {"ids": self.ids, "prices": self.prices, "vectors": self.vectors}
+        if self.centroids is not None:
+            arrays.update(centroids=self.centroids, offsets=self.offsets)
+        for name, array in arrays.items():
+            np.save(os.path.join(f"{directory}.tmp", f"{name}.npy"), array)
+        os.rename(f"{directory}.tmp", directory)
+
+        previous = current_version(path)
+        pointer = os.path.join(path, CURRENT_POINTER)
+        with open(f"{pointer}.{version}.tmp", "w") as f:
+            f.write(version)
+        os.replace(f"{pointer}.{version}.tmp", pointer)
+
+        # Keep the version just replaced: another process may be between reading
+        # the pointer and mapping its files. Anything older is unreachable, as are
+        # arrays from the flat layout used before versioned saves.
+        for entry in os.listdir(path):
+            full = os.path.join(path, entry)
+            if os.path.isdir(full) and entry.startswith("v") and not entry.endswith(".tmp"):
+                if entry not in (version, previous):
+                    shutil.rmtree(full, ignore_errors=True)
+            elif entry in _LEGACY_FILES:
+                os.remove(full)
+        return version
+
+    @classmethod
+    def load(cls, path: str, version: Optional[str] = None) -> "VectorIndex":
+        version = version or current_version(path)
+        if version is None:
+            raise FileNotFoundError(f"No vector index has been saved under {path}")
+        directory = os.path.join(path, version)
+
+        def load(name):
+            file = os.path.join(directory, f"{name}.npy")
+            return np.load(file, mmap_mode="r") if os.path.exists(file) else None
+
+        return cls(load("ids"), load("prices"), load("vectors"), load("centroids"), load("offsets"))
+
+
+def _spherical_kmeans(vectors: np.ndarray, nlist: int, iterations: int = 10, sample: int = 65536) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    train = vectors[rng.choice(len(vectors), size=min(sample, len(vectors)), replace=False)]
+    centroids = train[rng.choice(len(train), size=nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _assign(train, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, train)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty clusters keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    return centroids.astype(np.float32)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 65536) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), chunk):
+        out[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+    return out
+
+
+def product_text(title: str, description: Optional[str]) -> str:
+    # Title repeated so it outweighs the long marketing description
+    return f"{title} {title} {description or ''}"
+
+
+class SemanticIndex:
+    """Process-wide vector index over active products, rebuilt when the catalog changes."""
+
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        self.index: Optional[VectorIndex] = None
+        self.version = -1
+        self._loaded_version: Optional[str] = None
+        self.built_at = 0.0
+        self._lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    async def rebuild(self, db: AsyncSession, batch_size: int = 5000) -> VectorIndex:
+        version = get_catalog_version()
+        ids, prices, chunks = [], [], []
+        query = (
+            select(Product.id, Product.title, Product.description, Product.price)
+            .where(Product.is_active == True)
+            .order_by(Product.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            ids.extend(row.id for row in rows)
+            prices.extend(float(row.price) for row in rows)
+            # CPU-bound: embedding, clustering and saving run in a thread so the
+            # worker keeps serving requests; only the reads stay on the loop
+            texts = [product_text(row.title, row.description) for row in rows]
+            chunks.append(await asyncio.to_thread(self.embedder.embed, texts))
+
+        index, saved = await asyncio.to_thread(self._build, ids, prices, chunks)
+        if saved is not None:
+            self._loaded_version = saved
+        self.index, self.version, self.built_at = index, version, time.monotonic()
+        logger.info("Semantic index built", extra={"products": len(index), "ann": index.centroids is not None})
+        return index
+
+    def _build(self, ids: list, prices: list, chunks: list) -> Tuple["VectorIndex", Optional[str]]:
+        vectors = np.vstack(chunks) if chunks else np.zeros((0, self.embedder.dim), dtype=np.float32)
+        index = VectorIndex.build(
+            np.asarray(ids, dtype=np.int64), np.asarray(prices, dtype=np.float64), vectors,
+            settings.SEMANTIC_ANN_THRESHOLD,
+        )
+        if not settings.EMBEDDINGS_PATH:
+            return index, None
+        saved = index.save(settings.EMBEDDINGS_PATH)
+        return VectorIndex.load(settings.EMBEDDINGS_PATH, saved), saved
+
+    def _persisted_version(self) -> Optional[str]:
+        return current_version(settings.EMBEDDINGS_PATH) if settings.EMBEDDINGS_PATH else None
+
+    async def _rebuild_from_db(self) -> None:
+        async with await read_router.open_session() as db:
+            await self.rebuild(db)
+
+    def rebuild_in_background(self) -> asyncio.Task:
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = asyncio.ensure_future(self._rebuild_from_db())
+        return self._rebuild_task
+
+    async def get(self) -> VectorIndex:
+        saved = self._persisted_version()
+        if self.index is None or (saved is not None and saved != self._loaded_version):
+            async with self._lock:
+                saved = self._persisted_version()
+                if saved is not None and (self.index is None or saved != self._loaded_version):
+                    # Written at ingest time, possibly by another process (e.g. the CLI)
+                    self.index = VectorIndex.load(settings.EMBEDDINGS_PATH, saved)
+                    self.version, self._loaded_version = get_catalog_version(), saved
+                    self.built_at = time.monotonic()
+                elif self.index is None:
+                    await self._rebuild_from_db()
+        elif self.version != get_catalog_version() or self._expired():
+            # Keep answering from the previous index while the new one builds
+            self.rebuild_in_background()
+        return self.index
+
+    def _expired(self) -> bool:
+        # Without a persisted index, writes by other workers or the CLI only show up
+        # through this periodic rebuild; with one, they arrive via the CURRENT pointer
+        return (
+            not settings.EMBEDDINGS_PATH
+            and time.monotonic() - self.built_at >= settings.SEMANTIC_INDEX_REFRESH_SECONDS
+        )
+
+    async def search(self, query: str, k: int, max_price: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        index = await self.get()
+        start = time.perf_counter()
+        ids, scores = index.search(
+            self.embedder.embed([query])[0], k, max_price, nprobe=settings.SEMANTIC_ANN_NPROBE
+        )
+        semantic_search_duration.observe(
+            time.perf_counter() - start, index="ivf" if index.centroids is not None else "exact"
+        )
+        return ids, scores
+
+
+semantic_index = SemanticIndex(HashingEmbedder(settings.EMBEDDING_DIM))
+
+gauge("semantic_index_products", "Products in the semantic index",
+      lambda: len(semantic_index.index) if semantic_index.index is not None else None)
@@ -1,27 +1,137 @@
-from typing import List
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import Row, desc, event, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from sqlalchemy.future import select
 from app.models.product import Product
 
 
+# Bumped after every commit that writes products; cached catalog responses are
+# keyed on it. Writes that bypass the ORM unit of work must call bump_catalog_version().
+_catalog_version = 0
+
+
+def get_catalog_version() -> int:
+    return _catalog_version
+
+
+def bump_catalog_version() -> None:
+    global _catalog_version
+    _catalog_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_product_writes(session, flush_context):
+    if any(isinstance(obj, Product) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["products_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_product_commit(session):
+    # Bump only once the write is visible, so readers can't cache pre-commit data
+    if session.info.pop("products_changed", False):
+        bump_catalog_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_product_writes(session):
+    session.info.pop("products_changed", None)
+
+
+# Columns served by the catalog endpoints, in ProductOut field order. Selecting
+# plain rows skips ORM identity-map work and per-row pydantic validation.
+PRODUCT_COLUMNS = (
+    Product.title,
+    Product.description,
+    Product.price,
+    Product.image_url,
+    Product.category,
+    Product.is_active,
+    Product.id,
+    Product.created_at,
+)
+
+PRODUCT_FIELDS = {column.key: column for column in PRODUCT_COLUMNS}
+
+
+def parse_fields(raw: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse "title,price" into ("title", "price", "id"), in response order; None means every field.
+
+    `id` is always included: clients need it and cursors are built from it.
+    Raises ValueError on unknown field names.
+    """
+    if not raw:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - PRODUCT_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in PRODUCT_FIELDS if name in requested)
+
+
+def product_columns(fields: Optional[Tuple[str, ...]] = None) -> tuple:
+    return PRODUCT_COLUMNS if fields is None else tuple(PRODUCT_FIELDS[name] for name in fields)
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    # Cursors are opaque to clients; raise ValueError on anything we didn't issue
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded.encode()).decode().partition(":")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if prefix != "id" or not value.isdigit():
+        raise ValueError("Malformed cursor")
+    return int(value)
+
+
 async def get_active_products(db: AsyncSession) -> List[Product]:
     query = select(Product).where(Product.is_active == True)
     result = await db.execute(query)
     return result.scalars().all()
 
 
-async def get_paginated_products(db: AsyncSession, page: int, limit: int) -> tuple[List[Product], bool]:
-    offset = (page - 1) * limit
+async def get_newest_products(
+    db: AsyncSession, limit: int, category: Optional[str] = None
+) -> List[Row]:
+    query = select(*PRODUCT_COLUMNS).where(Product.is_active == True)
+    if category is not None:
+        # Equality on lower(category) is served by ix_products_active_category_created
+        query = query.where(func.lower(Product.category) == category)
+    result = await db.execute(query.order_by(desc(Product.created_at)).limit(limit))
+    return result.all()
+
+
+async def get_paginated_products(
+    db: AsyncSession,
+    page: int,
+    limit: int,
+    after_id: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> tuple[List[Row], bool]:
     # Fetch one extra to determine hasMore
     query = (
-        select(Product)
-        .where(Product.is_active.is_(True))
+        select(*product_columns(fields))
+        .where(Product.is_active == True)
         .order_by(Product.id)
-        .offset(offset)
         .limit(limit + 1)
     )
+    if after_id is not None:
+        # Keyset mode: seek past the last id instead of scanning and discarding rows
+        query = query.where(Product.id > after_id)
+    else:
+        query = query.offset((page - 1) * limit)
+
     result = await db.execute(query)
-    products = result.scalars().all()
+    products = result.all()
     
     has_more = False
     if len(products) > limit:
@@ -31,3 +141,32 @@ async def get_paginated_products(db: AsyncSession, page: int, limit: int) -> tup
     return products, has_more
 
 
+async def get_export_watermark(db: AsyncSession) -> datetime:
+    """Current time by the database clock, the one that stamps updated_at."""
+    now = await db.scalar(select(func.now()))
+    # SQLite's CURRENT_TIMESTAMP is naive UTC
+    return now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+
+
+async def stream_products_for_export(
+    db: AsyncSession, updated_since: Optional[datetime] = None, batch_size: int = 1000,
+    overlap_seconds: float = 0,
+) -> AsyncIterator[List[Row]]:
+    """Yield the catalog in batches from a server-side cursor, in id order.
+
+    A full export covers active products. An incremental export (updated_since)
+    also includes deactivated rows, so consumers can remove them. It reaches back
+    `overlap_seconds` before updated_since: updated_at is the writing transaction's
+    start time, so a write still in flight when the previous export began carries
+    a timestamp below that export's watermark. Rows in the overlap are sent again.
+    """
+    query = select(*PRODUCT_COLUMNS, Product.updated_at).order_by(Product.id)
+    if updated_since is not None:
+        query = query.where(Product.updated_at > updated_since - timedelta(seconds=overlap_seconds))
+    else:
+        query = query.where(Product.is_active == True)
+
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
@@ -0,0 +1,198 @@
+import logging
+import time
+from typing import AsyncIterator, List, Literal, Tuple
+from pydantic import ValidationError
+from sqlalchemy import (
+    Boolean, Column, Integer, MetaData, Numeric, String, Table, Text, func, insert, select, text, update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.jobs import job_queue
+from app.core.metrics import counter
+from app.core.streaming import Record
+from app.models.product import Product
+from app.schemas.product import ProductImport
+from app.services.embeddings import semantic_index
+from app.services.product import bump_catalog_version
+
+logger = logging.getLogger(__name__)
+
+IngestMode = Literal["replace", "upsert"]
+
+MAX_REPORTED_ERRORS = 100
+
+PRODUCT_FIELDS = ["title", "description", "price", "image_url", "category", "is_active"]
+
+product_ingest_rows = counter("product_ingest_rows", "Rows processed by product ingestion", ("status",))
+
+# Session-local staging table: rows are validated into it, then swapped into
+# products in the same transaction, so readers see the old catalog until commit.
+_staging = Table(
+    "products_ingest",
+    MetaData(),
+    Column("line", Integer, nullable=False),
+    Column("id", Integer),
+    Column("title", String, nullable=False),
+    Column("description", Text),
+    Column("price", Numeric(10, 2), nullable=False),
+    Column("image_url", String),
+    Column("category", String),
+    Column("is_active", Boolean),
+    prefixes=["TEMPORARY"],
+)
+_STAGING_COLUMNS = [c.name for c in _staging.columns]
+
+
+def _clean(record: dict) -> dict:
+    # CSV has no null: treat empty cells as missing so schema defaults apply
+    return {k: v for k, v in record.items() if v is not None and v != ""}
+
+
+async def ingest_products(
+    db: AsyncSession,
+    records: AsyncIterator[Tuple[int, Record]],
+    mode: IngestMode = "upsert",
+    batch_size: int = 5000,
+    background: bool = False,
+) -> dict:
+    """Validate and load products, then apply them to the catalog atomically.
+
+    "upsert" updates rows with a matching id (or, for rows without one, a
+    matching title and category) and inserts the rest. "replace"
+    does the same and also deactivates every product absent from the input
+    (a soft delete, so incremental exports see the removal). If a
+    row's id or (title, category) repeats, the last occurrence wins. The whole load is one transaction,
+    so there is never a window where the catalog is empty or half-loaded.
+
+    With background=True the embedding rebuild and cache warm-up are queued as
+    jobs instead of delaying the response.
+    """
+    start = time.perf_counter()
+    counts = {"loaded": 0, "invalid": 0}
+    errors: List[dict] = []
+    use_copy = db.bind.dialect.driver == "asyncpg"
+
+    conn = await db.connection()
+    await conn.run_sync(lambda sync_conn: _staging.drop(sync_conn, checkfirst=True))
+    await conn.run_sync(lambda sync_conn: _staging.create(sync_conn))
+
+    batch: List[dict] = []
+    async for line, record in records:
+        if isinstance(record, ValueError):
+            error = str(record)
+        else:
+            try:
+                product = ProductImport.model_validate(_clean(record))
+                batch.append({"line": line, **product.model_dump(include={"id", *PRODUCT_FIELDS})})
+                error = None
+            except ValidationError as e:
+                first = e.errors(include_url=False)[0]
+                error = f"{'.'.join(map(str, first['loc']))}: {first['msg']}"
+        if error is not None:
+            counts["invalid"] += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": line, "error": error})
+        if len(batch) >= batch_size:
+            await _load_batch(conn, batch, use_copy)
+            counts["loaded"] += len(batch)
+            batch = []
+    if batch:
+        await _load_batch(conn, batch, use_copy)
+        counts["loaded"] += len(batch)
+
+    loaded_at = time.perf_counter()
+    deactivated = await _apply_staging(db, mode)
+    await conn.run_sync(lambda sync_conn: _staging.drop(sync_conn))
+    await db.commit()
+    bump_catalog_version()
+
+    # Embeddings are computed here, at ingest time, rather than on the first query
+    embed_start = time.perf_counter()
+    if background:
+        await job_queue.enqueue("rebuild_semantic_index")
+        await job_queue.enqueue("warm_catalog_caches")
+    else:
+        await semantic_index.rebuild(db)
+    embed_seconds = time.perf_counter() - embed_start
+
+    product_ingest_rows.inc(counts["loaded"], status="loaded")
+    product_ingest_rows.inc(counts["invalid"], status="invalid")
+    elapsed = time.perf_counter() - start
+    summary = {
+        "mode": mode,
+        **counts,
+        "deactivated": deactivated,
+        "errors": errors,
+        "load_seconds": round(loaded_at - start, 3),
+        "swap_seconds": round(elapsed - (loaded_at - start) - embed_seconds, 3),
+        "embed_seconds": round(embed_seconds, 3),
+        "rows_per_second": round(counts["loaded"] / elapsed, 1) if elapsed else None,
+    }
+    logger.info("Product ingestion finished", extra={k: v for k, v in summary.items() if k != "errors"})
+    return summary
+
+
+async def _load_batch(conn, batch: List[dict], use_copy: bool) -> None:
+    if use_copy:
+        # COPY is several times faster than executemany on Postgres
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            _staging.name,
+            records=[tuple(row[c] for c in _STAGING_COLUMNS) for row in batch],
+            columns=_STAGING_COLUMNS,
+        )
+    else:
+        await conn.execute(insert(_staging), batch)
+
+
+async def _apply_staging(db: AsyncSession, mode: IngestMode) -> int:
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    # Rows without an id match an existing product on (title, category), so loading
+    # the same file again updates products in place instead of inserting copies
+    await db.execute(
+        update(_staging)
+        .where(_staging.c.id.is_(None), Product.title == _staging.c.title, Product.category == _staging.c.category)
+        .values(id=Product.id)
+    )
+    staged_ids = select(_staging.c.id).where(_staging.c.id.isnot(None))
+    deactivated = 0
+    if mode == "replace":
+        # Soft delete: updated_at moves, so `updated_since` exports report the row as inactive
+        result = await db.execute(
+            update(Product)
+            .where(Product.id.notin_(staged_ids), Product.is_active == True)
+            .values(is_active=False, updated_at=func.now())
+        )
+        deactivated = result.rowcount
+
+    # Last occurrence of each id wins
+    latest = select(func.max(_staging.c.line)).where(_staging.c.id.isnot(None)).group_by(_staging.c.id)
+    upsert = dialect.insert(Product).from_select(
+        ["id", *PRODUCT_FIELDS],
+        select(_staging.c.id, *[_staging.c[f] for f in PRODUCT_FIELDS]).where(_staging.c.line.in_(latest)),
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["id"],
+        set_={**{f: upsert.excluded[f] for f in PRODUCT_FIELDS}, "updated_at": func.now()},
+    )
+    await db.execute(upsert)
+
+    # New products; a repeated (title, category) is inserted once, last occurrence winning
+    latest_new = (
+        select(func.max(_staging.c.line)).where(_staging.c.id.is_(None))
+        .group_by(_staging.c.title, _staging.c.category)
+    )
+    await db.execute(
+        insert(Product).from_select(
+            PRODUCT_FIELDS,
+            select(*[_staging.c[f] for f in PRODUCT_FIELDS])
+            .where(_staging.c.line.in_(latest_new)).order_by(_staging.c.line),
+        )
+    )
+
+    if db.bind.dialect.name == "postgresql":
+        # Explicit ids don't advance the serial sequence
+        await db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('products', 'id'), COALESCE(MAX(id), 1)) FROM products"
+        ))
+    return deactivated
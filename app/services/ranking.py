@@ -0,0 +1,94 @@
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Row
+
+from app.core.metrics import histogram
+from app.services.embeddings import semantic_index
+
+# Relative weight of each signal in the fused score
+WEIGHTS = {
+    "title": 3.0,
+    "description": 1.0,
+    "category": 1.0,
+    "semantic": 2.0,
+    "price": 1.0,
+    "recency": 0.5,
+}
+
+ranking_duration = histogram(
+    "search_ranking_duration_seconds", "Hybrid ranking time per query",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+)
+
+
+def _keyword_hits(texts: np.ndarray, keywords: Sequence[str]) -> np.ndarray:
+    # Share of keywords appearing in each text
+    if not keywords:
+        return np.zeros(len(texts))
+    return np.mean([np.char.find(texts, k) >= 0 for k in keywords], axis=0)
+
+
+def rank_candidates(
+    rows: Sequence[Row],
+    keywords: Sequence[str],
+    category: Optional[str] = None,
+    max_price: Optional[float] = None,
+    limit: int = 8,
+    query_text: Optional[str] = None,
+) -> Tuple[List[Row], List[Dict[str, float]]]:
+    """Score an over-fetched candidate batch and return the top `limit` rows.
+
+    Every signal is computed as a vector over the batch; the returned breakdowns
+    (one dict per returned row) expose each weighted component and the total.
+    Semantic similarity is used only when the vector index is already loaded,
+    so ranking never waits on an index build.
+    """
+    start = time.perf_counter()
+    n = len(rows)
+    if n == 0:
+        return [], []
+
+    keywords = [k.lower() for k in keywords if k]
+    titles = np.array([(row.title or "").lower() for row in rows])
+    descriptions = np.array([(row.description or "").lower() for row in rows])
+    prices = np.array([float(row.price) for row in rows])
+    created = np.array([row.created_at.timestamp() if row.created_at else 0.0 for row in rows])
+
+    signals = {
+        "title": _keyword_hits(titles, keywords),
+        "description": _keyword_hits(descriptions, keywords),
+        "category": np.zeros(n),
+        "semantic": np.zeros(n),
+        "price": np.zeros(n),
+        "recency": np.zeros(n),
+    }
+    if category:
+        categories = np.array([(row.category or "").lower() for row in rows])
+        signals["category"] = (categories == category.lower()).astype(float)
+
+    index = semantic_index.index
+    if query_text and index is not None and len(index):
+        vectors, found = index.vectors_for([row.id for row in rows])
+        query_vector = semantic_index.embedder.embed([query_text])[0]
+        signals["semantic"] = np.where(found, np.clip(vectors @ query_vector, 0, 1), 0.0)
+
+    if max_price:
+        # Closer to the stated budget ranks higher; over budget scores nothing
+        signals["price"] = np.where(prices <= max_price, np.clip(prices / max_price, 0, 1), 0.0)
+
+    span = created.max() - created.min()
+    if span > 0:
+        signals["recency"] = (created - created.min()) / span
+
+    weighted = {name: WEIGHTS[name] * values for name, values in signals.items()}
+    total = np.sum(list(weighted.values()), axis=0)
+    order = np.argsort(-total, kind="stable")[:limit]
+
+    breakdowns = [
+        {**{name: round(float(values[i]), 4) for name, values in weighted.items()}, "total": round(float(total[i]), 4)}
+        for i in order
+    ]
+    ranking_duration.observe(time.perf_counter() - start)
+    return [rows[i] for i in order], breakdowns
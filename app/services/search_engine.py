@@ -0,0 +1,117 @@
+import re
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from sqlalchemy import Row, case, select, or_, func, desc, column
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.product import Product
+from app.services.product import PRODUCT_COLUMNS
+from app.core.config import settings
+
+# Generated by the 756adc0644cf migration; deliberately not mapped on the model
+# so SQLite test databases can still be created from metadata.
+search_vector = column("search_vector")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class SearchEngine(ABC):
+    """Retrieves candidate products for a set of keywords.
+
+    Implementations must honour the same filters: active products only, an optional
+    mapped category that widens the match, and an optional max_price ceiling.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def search(
+        self,
+        db: AsyncSession,
+        keywords: List[str],
+        category: Optional[str] = None,
+        max_price: Optional[float] = None,
+        limit: int = 8,
+    ) -> List[Row]:
+        """Returns PRODUCT_COLUMNS rows."""
+
+
+class IlikeSearchEngine(SearchEngine):
+    """Substring matching; portable to every dialect but always a sequential scan."""
+
+    name = "ilike"
+
+    async def search(self, db, keywords, category=None, max_price=None, limit=8):
+        stmt = select(*PRODUCT_COLUMNS).filter(Product.is_active == True)
+
+        # Rule 5: Search Priority (OR logic)
+        # title LIKE %keyword% OR description LIKE %keyword% OR category = mapped_category
+        or_conditions = []
+        hit_scores = []
+        for keyword in keywords:
+            in_title = Product.title.ilike(f"%{keyword}%")
+            in_description = Product.description.ilike(f"%{keyword}%")
+            or_conditions += [in_title, in_description]
+            hit_scores.append(case((in_title, 2), (in_description, 1), else_=0))
+
+        if category:
+            or_conditions.append(Product.category.ilike(f"%{category}%"))
+
+        if or_conditions:
+            stmt = stmt.filter(or_(*or_conditions))
+
+        # Rule 6: Price Logic (Only if explicitly mentioned)
+        if max_price:
+            stmt = stmt.filter(Product.price <= max_price)
+
+        # A mapped category matches most of the catalog, so keyword hits must fill
+        # the candidate limit first; category-only matches just pad it
+        if hit_scores:
+            stmt = stmt.order_by(desc(sum(hit_scores[1:], hit_scores[0])))
+        result = await db.execute(stmt.order_by(Product.id).limit(limit))
+        return result.all()
+
+
+class FullTextSearchEngine(SearchEngine):
+    """Postgres full-text search over the weighted search_vector, ranked by ts_rank."""
+
+    name = "fulltext"
+
+    @staticmethod
+    def build_tsquery(keywords: List[str], category: Optional[str] = None) -> str:
+        # Prefix-match every token so "laptop" still finds "laptops", OR-ed like the ILIKE path
+        terms = []
+        for word in keywords + ([category] if category else []):
+            for token in _TOKEN_RE.findall(word.lower()):
+                if token not in terms:
+                    terms.append(token)
+        return " | ".join(f"{t}:*" for t in terms)
+
+    async def search(self, db, keywords, category=None, max_price=None, limit=8):
+        stmt = select(*PRODUCT_COLUMNS).filter(Product.is_active == True)
+
+        tsquery_text = self.build_tsquery(keywords, category)
+        if tsquery_text:
+            tsquery = func.to_tsquery("english", tsquery_text)
+            rank = func.ts_rank(search_vector, tsquery)
+            stmt = stmt.filter(search_vector.op("@@")(tsquery)).order_by(desc(rank), Product.id)
+        else:
+            stmt = stmt.order_by(Product.id)
+
+        if max_price:
+            stmt = stmt.filter(Product.price <= max_price)
+
+        result = await db.execute(stmt.limit(limit))
+        return result.all()
+
+
+_ENGINES = {
+    IlikeSearchEngine.name: IlikeSearchEngine(),
+    FullTextSearchEngine.name: FullTextSearchEngine(),
+}
+
+
+def get_search_engine(db: AsyncSession) -> SearchEngine:
+    choice = settings.SEARCH_ENGINE
+    if choice == "auto":
+        choice = "fulltext" if db.bind.dialect.name == "postgresql" else "ilike"
+    return _ENGINES[choice]
@@ -0,0 +1,30 @@
+"""Background job handlers. Importing this module registers them with the job queue."""
+import logging
+from app.core.jobs import job
+from app.services.catalog_snapshot import catalog_snapshot
+from app.services.embeddings import semantic_index
+
+logger = logging.getLogger(__name__)
+audit_logger = logging.getLogger("app.audit")
+
+
+@job("send_welcome_email")
+async def send_welcome_email(payload: dict) -> None:
+    # No mail provider is configured yet; this is where it would be called
+    logger.info("Welcome email queued for delivery", extra={"email": payload["email"]})
+
+
+@job("audit_event")
+async def audit_event(payload: dict) -> None:
+    audit_logger.info(payload["event"], extra={k: v for k, v in payload.items() if k != "event"})
+
+
+@job("rebuild_semantic_index")
+async def rebuild_semantic_index(payload: dict) -> None:
+    # Shares the in-flight rebuild if a search already triggered one
+    await semantic_index.rebuild_in_background()
+
+
+@job("warm_catalog_caches")
+async def warm_catalog_caches(payload: dict) -> None:
+    await catalog_snapshot.refresh()
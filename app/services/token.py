@@ -0,0 +1,58 @@
+import logging
+import time
+import uuid
+from typing import Optional
+
+from fastapi import HTTPException, status
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.revocation import token_denylist
+from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.services.user import get_principal
+
+logger = logging.getLogger(__name__)
+
+def issue_tokens(email: str, family: Optional[str] = None) -> dict:
+    # A new family per login; refreshes keep the family so logout can end all of them
+    family = family or uuid.uuid4().hex
+    return {
+        "access_token": create_access_token(email, family),
+        "refresh_token": create_refresh_token(email, family),
+        "token_type": "bearer",
+    }
+
+async def revoke_family(family: str) -> None:
+    # Any token in the family expires within one refresh lifetime from now
+    await token_denylist.add(family, time.time() + settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60)
+
+async def rotate_refresh_token(db: AsyncSession, refresh_token: str) -> dict:
+    invalid = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = decode_token(refresh_token)
+    except JWTError:
+        raise invalid
+    jti, family, email = payload.get("jti"), payload.get("fam"), payload.get("sub")
+    if payload.get("type") != "refresh" or not (jti and family and email):
+        raise invalid
+
+    if await token_denylist.contains(family):
+        raise invalid
+
+    user = await get_principal(db, email)
+    if user is None or not user.is_active:
+        raise invalid
+
+    # Single use: the presented token is retired before the new pair goes out.
+    # Claiming it is one atomic step, so of two concurrent refreshes only one wins.
+    if not await token_denylist.add_if_absent(jti, payload["exp"]):
+        # A used refresh token came back: assume it leaked and end the whole session
+        logger.warning("Refresh token reuse detected", extra={"email": email})
+        await revoke_family(family)
+        raise invalid
+    return issue_tokens(email, family)
@@ -1,27 +1,100 @@
-from typing import Optional
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, verify_and_update_password
+from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.jobs import job_queue
+from app.core.metrics import counter
+from app.core.streaming import Record
+
+logger = logging.getLogger(__name__)
+
+user_import_rows = counter("user_import_rows", "Rows processed by bulk user import", ("status",))
+
+@dataclass(frozen=True)
+class Principal:
+    """What authentication needs to know about a user. Immutable, so one cached
+    instance can be shared by concurrent requests without touching any session."""
+
+    id: int
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, is_active=bool(user.is_active))
+
+# Authenticated principals by email. Entries are dropped whenever a user is
+# written through a session, and the short TTL bounds staleness for writes made
+# by other workers or outside the ORM.
+principal_cache = TTLCache(settings.PRINCIPAL_CACHE_MAX_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     result = await db.execute(select(User).where(User.email == email))
     return result.scalars().first()
 
+async def get_principal(db: AsyncSession, email: str) -> Optional[Principal]:
+    ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+    principal = principal_cache.get(email) if ttl > 0 else None
+    if principal is None:
+        user = await get_user_by_email(db, email)
+        if user is None:
+            return None
+        principal = Principal.from_user(user)
+        if ttl > 0:
+            principal_cache.set(email, principal, ttl)
+    return principal
+
+def invalidate_principal(email: str) -> None:
+    """Call after changing a user without the ORM (e.g. raw SQL on a connection)."""
+    principal_cache.delete(email)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal_on_write(mapper, connection, target):
+    invalidate_principal(target.email)
+    # Also drop the old key if the email itself changed
+    for old_email in inspect(target).attrs.email.history.deleted:
+        invalidate_principal(old_email)
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_principals_on_bulk_write(orm_execute_state):
+    # update(User) / delete(User) statements skip the per-instance hooks above,
+    # and could touch any row, so every cached principal goes
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and any(
+        mapper.class_ is User for mapper in orm_execute_state.all_mappers
+    ):
+        principal_cache.clear()
+
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = await verify_and_update_password(password, user.hashed_password)
+    if not valid:
         return None
     if not user.is_active:
-        print(f"DEBUG: Login blocked for inactive user {email}")
+        logger.debug("Login blocked for inactive user", extra={"email": email})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is inactive"
         )
+    if new_hash:
+        # Hashing parameters changed since this password was stored
+        user.hashed_password = new_hash
+        await db.commit()
     return user
 
 async def create_user(db: AsyncSession, user: UserCreate) -> UserResponse:
@@ -32,15 +105,102 @@ async def create_user(db: AsyncSession, user: UserCreate) -> UserResponse:
             detail="Email already registered"
         )
     
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash(user.password)
     new_user = User(
         email=user.email,
         hashed_password=hashed_password,
         is_active=True
     )
-    print(f"DEBUG: Attempting to create user {user.email}")
+    logger.debug("Creating user", extra={"email": user.email})
     db.add(new_user)
+    await db.flush()
+    # Queued in the signup transaction: the jobs exist exactly when the user does,
+    # and run in the background so signup latency doesn't include them
+    await job_queue.enqueue("send_welcome_email", {"email": new_user.email}, db=db)
+    await job_queue.enqueue("audit_event", {"event": "user.signup", "user_id": new_user.id, "email": new_user.email}, db=db)
     await db.commit()
-    await db.refresh(new_user)
-    print(f"DEBUG: Successfully created user {new_user.email} with ID {new_user.id}")
+    logger.info("Created user", extra={"email": new_user.email, "user_id": new_user.id})
     return new_user
+
+async def import_users(
+    db: AsyncSession, records: AsyncIterator[Tuple[int, Record]], batch_size: int
+) -> AsyncIterator[dict]:
+    """Bulk-create users from (line, record) pairs, yielding one result per row.
+
+    Rows are validated, hashed with bounded parallelism on the Argon2 pool and
+    inserted in batches with ON CONFLICT (email) DO NOTHING. Only one batch is
+    held in memory at a time. The last item is a summary with throughput.
+    """
+    counts = {"created": 0, "exists": 0, "invalid": 0}
+    start = time.perf_counter()
+    batch: List[Tuple[int, UserCreate]] = []
+
+    def tally(result: dict) -> dict:
+        counts[result["status"]] += 1
+        user_import_rows.inc(status=result["status"])
+        return result
+
+    async for line, record in records:
+        if isinstance(record, ValueError):
+            yield tally({"line": line, "status": "invalid", "error": str(record)})
+            continue
+        try:
+            batch.append((line, UserCreate.model_validate(record)))
+        except ValidationError as e:
+            yield tally({"line": line, "email": record.get("email"), "status": "invalid",
+                         "error": e.errors(include_url=False)[0]["msg"]})
+            continue
+        if len(batch) >= batch_size:
+            for result in await _insert_user_batch(db, batch):
+                yield tally(result)
+            batch = []
+
+    if batch:
+        for result in await _insert_user_batch(db, batch):
+            yield tally(result)
+
+    elapsed = time.perf_counter() - start
+    rows = sum(counts.values())
+    yield {"summary": {**counts, "rows": rows, "seconds": round(elapsed, 3),
+                       "rows_per_second": round(rows / elapsed, 1) if elapsed else None}}
+
+# Shared by every running import, so several at once still can't starve logins of hash workers.
+# Created lazily: a semaphore belongs to the event loop that first waits on it.
+_import_hash_slots: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+def _hash_slots() -> asyncio.Semaphore:
+    global _import_hash_slots
+    loop = asyncio.get_running_loop()
+    if _import_hash_slots is None or _import_hash_slots[0] is not loop:
+        _import_hash_slots = (loop, asyncio.Semaphore(max(1, settings.USER_IMPORT_HASH_CONCURRENCY)))
+    return _import_hash_slots[1]
+
+async def _insert_user_batch(db: AsyncSession, batch: List[Tuple[int, UserCreate]]) -> List[dict]:
+    slots = _hash_slots()
+
+    async def hash_one(password: str) -> str:
+        async with slots:
+            return await get_password_hash(password, admit=False)
+
+    hashes = await asyncio.gather(*(hash_one(user.password) for _, user in batch))
+
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = (
+        dialect.insert(User)
+        .values([
+            {"email": user.email, "hashed_password": hashed, "is_active": True}
+            for (_, user), hashed in zip(batch, hashes)
+        ])
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.email)
+    )
+    created = set((await db.execute(stmt)).scalars())
+    await db.commit()
+
+    results = []
+    for line, user in batch:
+        # Duplicates within the batch: only the first occurrence was inserted
+        status = "created" if user.email in created else "exists"
+        created.discard(user.email)
+        results.append({"line": line, "email": user.email, "status": status})
+    return results
@@ -0,0 +1,68 @@
+"""Authenticated requests per second on /users/me with and without the principal cache.
+
+    python -m benchmarks.bench_auth --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import benchmarks.common  # noqa: F401  (sets offline settings)
+import httpx
+
+from app.core.config import settings
+from app.core.deps import _verified_tokens
+from app.core.database import Base, engine
+from app.main import app
+from app.services.user import principal_cache
+
+
+async def run(client: httpx.AsyncClient, headers: dict, total: int, concurrency: int) -> float:
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get("/users/me", headers=headers)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        credentials = {"email": "bench@example.com", "password": "bench-password"}
+        await client.post("/auth/signup", json=credentials)
+        token = (await client.post("/auth/login", json=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+        settings.PRINCIPAL_CACHE_TTL_SECONDS = 0
+        uncached = await run(client, headers, total, concurrency)
+        settings.PRINCIPAL_CACHE_TTL_SECONDS = ttl or 15
+        principal_cache.clear()
+        _verified_tokens.clear()
+        cached = await run(client, headers, total, concurrency)
+
+    await engine.dispose()
+    print(json.dumps({
+        "requests": total,
+        "concurrency": concurrency,
+        "rps_without_cache": round(uncached, 1),
+        "rps_with_cache": round(cached, 1),
+        "speedup": round(cached / uncached, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
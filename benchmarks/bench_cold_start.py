@@ -0,0 +1,72 @@
+"""Time from process launch until the server answers, for `python -m app.serve`.
+
+    python -m benchmarks.bench_cold_start --runs 5 --workers 1
+
+Also reports each run's own import-to-ready measurement from /health/stats and
+fails (exit 1) when the median exceeds COLD_START_TARGET_SECONDS.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import benchmarks.common  # noqa: F401  (sets offline settings)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure(workers: int, timeout: float) -> dict:
+    port = _free_port()
+    admin_key = os.environ.get("ADMIN_API_KEY") or "bench-admin"
+    env = {**os.environ, "HOST": "127.0.0.1", "PORT": str(port), "WEB_CONCURRENCY": str(workers),
+           "ADMIN_API_KEY": admin_key}
+    stats_request = urllib.request.Request(f"http://127.0.0.1:{port}/health/stats", headers={"X-Admin-Key": admin_key})
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "app.serve"], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(stats_request, timeout=1) as response:
+                    stats = json.load(response)
+                return {
+                    "ready_seconds": round(time.perf_counter() - start, 3),
+                    "app_cold_start_seconds": stats["startup"]["cold_start_seconds"],
+                    "phases": stats["startup"]["phases"],
+                }
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"server not ready after {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    from app.core.config import settings
+
+    runs = [measure(args.workers, args.timeout) for _ in range(args.runs)]
+    median = statistics.median(r["ready_seconds"] for r in runs)
+    print(json.dumps({
+        "workers": args.workers,
+        "target_seconds": settings.COLD_START_TARGET_SECONDS,
+        "median_ready_seconds": round(median, 3),
+        "median_app_cold_start_seconds": statistics.median(r["app_cold_start_seconds"] for r in runs),
+        "runs": runs,
+    }, indent=2))
+    sys.exit(1 if median > settings.COLD_START_TARGET_SECONDS else 0)
@@ -0,0 +1,43 @@
+"""Ingest a synthetic catalog through the product pipeline.
+
+    python -m benchmarks.bench_ingest --rows 1000000 --url postgresql+asyncpg://localhost/bench
+"""
+import argparse
+import asyncio
+import json
+
+from benchmarks.common import BENCH_DATABASE_URL, product_row
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.core.serialization import dumps
+from app.core.streaming import iter_records
+from app.models.product import Product
+from app.services.product_ingest import ingest_products
+
+
+async def ndjson_chunks(rows: int, rows_per_chunk: int = 1000):
+    # Generated on the fly so the benchmark itself stays at flat memory
+    for start in range(0, rows, rows_per_chunk):
+        yield b"".join(dumps(product_row(i)) + b"\n" for i in range(start, min(start + rows_per_chunk, rows)))
+
+
+async def main(url: str, rows: int, batch_size: int, mode: str):
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Product.__table__])
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        summary = await ingest_products(db, iter_records(ndjson_chunks(rows), "ndjson"), mode=mode, batch_size=batch_size)
+    await engine.dispose()
+    print(json.dumps({"rows": rows, "batch_size": batch_size, **summary}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=BENCH_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--mode", choices=["replace", "upsert"], default="replace")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows, args.batch_size, args.mode))
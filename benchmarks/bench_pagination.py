@@ -0,0 +1,42 @@
+"""Compare OFFSET and keyset pagination on /products at shallow and deep pages.
+
+    python -m benchmarks.bench_pagination --rows 200000 --limit 10
+"""
+import argparse
+import asyncio
+import json
+
+from benchmarks.common import BENCH_DATABASE_URL, make_catalog, timed
+from app.services.product import get_paginated_products
+
+
+async def main(url: str, rows: int, limit: int, deep_page: int, repeat: int):
+    engine, Session = await make_catalog(url, rows)
+    async with Session() as db:
+        # Walk to the deep page once to learn the id a client would hold as its cursor
+        deep_products, _ = await get_paginated_products(db, deep_page - 1, limit)
+        deep_after_id = deep_products[-1].id
+
+        report = {
+            "rows": rows,
+            "limit": limit,
+            "offset_page_1": await timed(lambda: get_paginated_products(db, 1, limit), repeat),
+            f"offset_page_{deep_page}": await timed(lambda: get_paginated_products(db, deep_page, limit), repeat),
+            "cursor_page_1": await timed(lambda: get_paginated_products(db, 1, limit, after_id=0), repeat),
+            f"cursor_page_{deep_page}": await timed(
+                lambda: get_paginated_products(db, deep_page, limit, after_id=deep_after_id), repeat
+            ),
+        }
+    await engine.dispose()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=BENCH_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--deep-page", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows, args.limit, args.deep_page, args.repeat))
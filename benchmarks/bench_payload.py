@@ -0,0 +1,87 @@
+"""Bytes on the wire and server-side cost of a 100-item /products page.
+
+    python -m benchmarks.bench_payload --items 100 --fields title,price,image_url
+
+Uses the real seed catalog (long marketing descriptions) and compares the full
+page against a sparse fieldset, each uncompressed, gzip and brotli (if installed).
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import timeit
+from decimal import Decimal
+
+import benchmarks.common  # noqa: F401  (sets offline settings)
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.compression import brotli, compress
+from app.core.database import Base
+from app.core.serialization import dumps, rows_to_dicts
+from app.models.product import Product
+from app.services.product import parse_fields, product_columns
+
+SEED_CSV = os.path.join(os.path.dirname(__file__), "..", "seed_products.csv")
+
+
+def seed_rows(items: int) -> list:
+    with open(SEED_CSV, newline="") as f:
+        rows = list(csv.DictReader(f))
+    # Repeat the seed file if more items are asked for than it holds
+    return [
+        {
+            "title": row["title"],
+            "description": row["description"],
+            "price": Decimal(row["price"]),
+            "image_url": row["image_url"],
+            "category": row["category"],
+            "is_active": True,
+        }
+        for row in (rows[i % len(rows)] for i in range(items))
+    ]
+
+
+def measure(rows, encoding, number: int) -> dict:
+    body = dumps(rows_to_dicts(rows))
+    if encoding is None:
+        seconds = min(timeit.repeat(lambda: dumps(rows_to_dicts(rows)), number=number, repeat=5)) / number
+        return {"bytes": len(body), "serialize_us": round(seconds * 1e6, 1)}
+    compressed = compress(body, encoding)
+    seconds = min(timeit.repeat(lambda: compress(body, encoding), number=number, repeat=5)) / number
+    return {"bytes": len(compressed), "compress_us": round(seconds * 1e6, 1)}
+
+
+async def main(items: int, fields: str, number: int):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Product.__table__])
+        await conn.execute(insert(Product), seed_rows(items))
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        full = (await db.execute(select(*product_columns()).order_by(Product.id).limit(items))).all()
+        sparse = (await db.execute(
+            select(*product_columns(parse_fields(fields))).order_by(Product.id).limit(items)
+        )).all()
+    await engine.dispose()
+
+    encodings = [None, "gzip"] + (["br"] if brotli is not None else [])
+    report = {"items": items, "sparse_fields": fields}
+    for name, rows in (("full", full), ("sparse", sparse)):
+        for encoding in encodings:
+            report[f"{name}_{encoding or 'identity'}"] = measure(rows, encoding, number)
+    baseline = report["full_identity"]["bytes"]
+    report["smallest_vs_full_identity"] = round(
+        min(v["bytes"] for k, v in report.items() if isinstance(v, dict)) / baseline, 3
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--fields", default="title,price,image_url")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.fields, args.number))
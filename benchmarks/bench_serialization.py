@@ -0,0 +1,58 @@
+"""Serialize a 100-item product page: ORM + pydantic + json (old) vs column rows + orjson (new).
+
+    python -m benchmarks.bench_serialization --items 100
+"""
+import argparse
+import asyncio
+import json
+import timeit
+from typing import List
+
+from benchmarks.common import make_catalog
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.core.serialization import dumps, rows_to_dicts
+from app.models.product import Product
+from app.schemas.product import ProductOut
+from app.services.product import PRODUCT_COLUMNS
+
+_product_list = TypeAdapter(List[ProductOut])
+
+
+def old_path(products) -> bytes:
+    # What FastAPI does for response_model=List[ProductOut] plus JSONResponse
+    content = _product_list.dump_python(_product_list.validate_python(products, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def new_path(rows) -> bytes:
+    return dumps(rows_to_dicts(rows))
+
+
+async def main(items: int, number: int):
+    engine, Session = await make_catalog("sqlite+aiosqlite:///:memory:", items)
+    async with Session() as db:
+        products = (await db.execute(select(Product).order_by(Product.id).limit(items))).scalars().all()
+        rows = (await db.execute(select(*PRODUCT_COLUMNS).order_by(Product.id).limit(items))).all()
+    await engine.dispose()
+
+    assert old_path(products) == new_path(rows), "wire format changed"
+
+    old = min(timeit.repeat(lambda: old_path(products), number=number, repeat=5)) / number
+    new = min(timeit.repeat(lambda: new_path(rows), number=number, repeat=5)) / number
+    print(json.dumps({
+        "items": items,
+        "old_us_per_page": round(old * 1e6, 1),
+        "new_us_per_page": round(new * 1e6, 1),
+        "speedup": round(old / new, 2),
+        "bytes": len(new_path(rows)),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.number))
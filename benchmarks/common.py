@@ -0,0 +1,119 @@
+import math
+import os
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+# Outside the working tree, so benchmark runs never leave a database in the repo
+BENCH_DATABASE_URL = "sqlite+aiosqlite:///" + os.path.join(tempfile.gettempdir(), "fastapi-backend-bench.db")
+
+# Benchmarks run offline: provide the settings the app needs before importing it
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", BENCH_DATABASE_URL)
+
+from sqlalchemy import delete, insert, inspect  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+CATEGORIES = ["electronics", "home", "fitness", "books", "fashion"]
+BENCH_PASSWORD = "bench-password"
+NOUNS = ["laptop", "phone", "headphones", "earbuds", "smartwatch", "tablet", "camera", "drone", "speaker", "mouse"]
+
+
+def product_row(i: int) -> dict:
+    noun = NOUNS[i % len(NOUNS)]
+    return {
+        "title": f"Brand{i % 97} {noun.title()} {i}",
+        "description": f"Experience excellence with this premium {noun}, model {i}.",
+        "price": Decimal(500 + (i * 7919) % 150000) / 10,
+        "image_url": f"https://images.example.com/{i}.jpg",
+        "category": "electronics" if i % 3 else CATEGORIES[i % len(CATEGORIES)],
+        "is_active": i % 20 != 0,
+    }
+
+
+def _has_search_vector(sync_conn) -> bool:
+    inspector = inspect(sync_conn)
+    return inspector.has_table("products") and any(
+        column["name"] == "search_vector" for column in inspector.get_columns("products")
+    )
+
+
+async def make_catalog(url: str, rows: int, batch_size: int = 10_000):
+    """Replace the products table contents with `rows` generated products, ids from 1.
+
+    On Postgres the table is truncated in place: the search_vector column and the
+    partial indexes come from migrations, and recreating it from metadata would
+    silently benchmark a different schema.
+    """
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            if not await conn.run_sync(_has_search_vector):
+                raise RuntimeError("products lacks the migrated schema; run `alembic upgrade head` on this database first")
+            await conn.exec_driver_sql("TRUNCATE products RESTART IDENTITY")
+        else:
+            await conn.run_sync(Base.metadata.drop_all, tables=[Product.__table__])
+            await conn.run_sync(Base.metadata.create_all, tables=[Product.__table__])
+        for start in range(0, rows, batch_size):
+            batch = [product_row(i) for i in range(start, min(start + batch_size, rows))]
+            await conn.execute(insert(Product), batch)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+def user_email(i: int) -> str:
+    return f"user{i}@bench.example.com"
+
+
+async def make_users(url: str, count: int, password: str = BENCH_PASSWORD, batch_size: int = 10_000):
+    """Replace the users table contents with `count` active users sharing one password.
+
+    The password is hashed once: hashing per user would make large runs take hours.
+    The table is emptied, not dropped, so a migrated schema is left intact.
+    """
+    from app.core.security import pwd_context
+
+    hashed = pwd_context.hash(password)
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__])
+        await conn.execute(delete(User))
+        for start in range(0, count, batch_size):
+            batch = [
+                {"email": user_email(i), "hashed_password": hashed, "is_active": True}
+                for i in range(start, min(start + batch_size, count))
+            ]
+            await conn.execute(insert(User), batch)
+    await engine.dispose()
+
+
+def percentiles(samples_ms: list) -> dict:
+    samples = sorted(samples_ms)
+    if not samples:
+        return {}
+
+    def at(q: float) -> float:
+        return round(samples[min(len(samples) - 1, max(0, math.ceil(len(samples) * q) - 1))], 3)
+
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": at(0.95),
+        "p99_ms": at(0.99),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+
+async def timed(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
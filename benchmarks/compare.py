@@ -0,0 +1,55 @@
+"""Compare two load_test reports and flag regressions.
+
+    python -m benchmarks.compare baseline.json results.json --threshold 0.10
+
+Exits 1 when any scenario's p95/p99 grew, or its RPS dropped, by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+# metric -> whether a higher value is better
+METRICS = {"rps": True, "p50_ms": False, "p95_ms": False, "p99_ms": False}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> tuple[dict, list]:
+    report, regressions = {}, []
+    for name, after in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        rows = {}
+        for metric, higher_is_better in METRICS.items():
+            old, new = before.get(metric), after.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            rows[metric] = {"before": old, "after": new, "change": round(change, 3)}
+            worse = -change if higher_is_better else change
+            if metric != "p50_ms" and worse > threshold:
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({change:+.1%})")
+        if after.get("errors", 0) > before.get("errors", 0):
+            regressions.append(f"{name}.errors: {before.get('errors', 0)} -> {after['errors']}")
+        report[name] = rows
+    return report, regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    report, regressions = compare(baseline, current, args.threshold)
+    print(json.dumps({
+        "baseline": baseline["meta"].get("commit"),
+        "current": current["meta"].get("commit"),
+        "scenarios": report,
+        "regressions": regressions,
+    }, indent=2))
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,67 @@
+"""Check that the planner serves the hot product queries from their partial indexes.
+
+    python -m benchmarks.explain_product_queries --url postgresql+asyncpg://localhost/bench
+
+Exits non-zero if any query's plan does not mention what its dialect should use.
+On Postgres, sequential scans are disabled for the check so small tables still
+show whether an index is usable. SQLite answers `id > ?` from the rowid itself,
+so there the keyset query is expected to search the primary key instead of
+ix_products_active_id.
+"""
+import argparse
+import asyncio
+import sys
+
+from benchmarks.common import BENCH_DATABASE_URL, make_catalog
+from sqlalchemy import desc, func, select
+
+from app.models.product import Product
+from app.services.product import PRODUCT_COLUMNS
+
+# name -> (query, {dialect: text its plan must contain})
+QUERIES = {
+    "active_id_keyset": (
+        select(*PRODUCT_COLUMNS)
+        .where(Product.is_active == True, Product.id > 100)
+        .order_by(Product.id).limit(11),
+        {"postgresql": "ix_products_active_id", "sqlite": "USING INTEGER PRIMARY KEY"},
+    ),
+    "category_fallback": (
+        select(*PRODUCT_COLUMNS)
+        .where(Product.is_active == True, func.lower(Product.category) == "electronics")
+        .order_by(desc(Product.created_at)).limit(6),
+        {"postgresql": "ix_products_active_category_created", "sqlite": "ix_products_active_category_created"},
+    ),
+}
+
+
+async def main(url: str, rows: int) -> int:
+    engine, _ = await make_catalog(url, rows)
+    failures = 0
+    async with engine.connect() as conn:
+        postgres = conn.dialect.name == "postgresql"
+        if postgres:
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+        else:
+            await conn.exec_driver_sql("ANALYZE")
+        for name, (query, expected_by_dialect) in QUERIES.items():
+            expected = expected_by_dialect.get(conn.dialect.name)
+            if expected is None:
+                print(f"SKIP {name}: no expectation for {conn.dialect.name}\n")
+                continue
+            compiled = query.compile(conn, compile_kwargs={"literal_binds": True})
+            prefix = "EXPLAIN" if postgres else "EXPLAIN QUERY PLAN"
+            plan = "\n".join(" ".join(map(str, row)) for row in await conn.exec_driver_sql(f"{prefix} {compiled}"))
+            ok = expected in plan
+            failures += not ok
+            print(f"{'PASS' if ok else 'FAIL'} {name} (expects {expected})\n{plan}\n")
+    await engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=BENCH_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.url, args.rows)))
@@ -0,0 +1,79 @@
+"""Synthetic data for benchmarks: product catalogs (10k to 10M rows) and users.
+
+    python -m benchmarks.generate catalog --rows 1000000
+    python -m benchmarks.generate catalog --rows 10000000 --out catalog.csv
+    python -m benchmarks.generate users --count 10000
+
+Without --out, rows go straight into --url (the products table is recreated, the
+users table emptied). With --out, a CSV/NDJSON file is written instead; load a
+catalog file with `python -m app.cli ingest-products` to keep a migrated Postgres
+schema (full-text column, partial indexes) intact.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+
+from benchmarks.common import BENCH_DATABASE_URL, BENCH_PASSWORD, make_catalog, make_users, product_row, user_email
+
+CATALOG_FIELDS = ["title", "description", "price", "image_url", "category", "is_active"]
+
+
+def write_catalog(path: str, rows: int) -> None:
+    with open(path, "w", newline="") as f:
+        if path.endswith(".ndjson"):
+            for i in range(rows):
+                row = product_row(i)
+                row["price"] = str(row["price"])
+                f.write(json.dumps(row) + "\n")
+        else:
+            writer = csv.DictWriter(f, fieldnames=CATALOG_FIELDS)
+            writer.writeheader()
+            writer.writerows(product_row(i) for i in range(rows))
+
+
+def write_users(path: str, count: int, password: str) -> None:
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({"email": user_email(i), "password": password}) + "\n")
+
+
+async def main(args) -> None:
+    start = time.perf_counter()
+    if args.kind == "catalog":
+        if args.out:
+            write_catalog(args.out, args.rows)
+        else:
+            engine, _ = await make_catalog(args.url, args.rows)
+            await engine.dispose()
+        count = args.rows
+    else:
+        if args.out:
+            write_users(args.out, args.count, args.password)
+        else:
+            await make_users(args.url, args.count, args.password)
+        count = args.count
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "kind": args.kind,
+        "rows": count,
+        "target": args.out or args.url.split("://")[0],
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(count / elapsed) if elapsed else None,
+    }), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="kind", required=True)
+    catalog = sub.add_parser("catalog")
+    catalog.add_argument("--rows", type=int, default=10_000)
+    users = sub.add_parser("users")
+    users.add_argument("--count", type=int, default=1_000)
+    users.add_argument("--password", default=BENCH_PASSWORD)
+    for p in (catalog, users):
+        p.add_argument("--url", default=BENCH_DATABASE_URL)
+        p.add_argument("--out", help="Write a .csv or .ndjson file instead of loading the database")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,94 @@
+"""Scripted load scenarios against every hot route, reported as JSON.
+
+    python -m benchmarks.load_test --products 100000 --users 1000 --out results.json
+    python -m benchmarks.load_test --scenarios ai_search,users_me --concurrency 50
+    python -m benchmarks.compare baseline.json results.json
+
+By default the app runs in-process over httpx's ASGI transport, against SQLite,
+with /ai/search talking to benchmarks.stub_openai started on a local port, so the
+run needs no network. Pass --base-url to drive a running server instead (it must
+use the same --url database, and its own OPENAI_BASE_URL).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+SCENARIOS = ["products_deep_offset", "products_deep_cursor", "ai_search", "auth_login", "users_me"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stub_openai(latency: float) -> subprocess.Popen:
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.stub_openai", "--port", str(port), "--latency", str(latency)],
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    return proc
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=os.environ.get(
+        "SQLALCHEMY_DATABASE_URI",
+        # Same as benchmarks.common.BENCH_DATABASE_URL, which can't be imported before the env is set
+        "sqlite+aiosqlite:///" + os.path.join(tempfile.gettempdir(), "fastapi-backend-bench.db"),
+    ))
+    parser.add_argument("--base-url", help="Drive a running server instead of the in-process app")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), type=lambda s: s.split(","))
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--ai-unique-queries", type=int, default=200)
+    parser.add_argument("--openai-latency", type=float, default=0.15, help="Stub OpenAI response delay in seconds")
+    parser.add_argument("--no-response-cache", action="store_true", help="Measure every request end to end")
+    parser.add_argument("--skip-setup", action="store_true", help="Reuse the data already in --url")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    os.environ["SQLALCHEMY_DATABASE_URI"] = args.url
+    # Every simulated client shares one address; the limits would turn most requests into 429s
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    if args.no_response_cache:
+        os.environ["RESPONSE_CACHE_MAX_SIZE"] = "0"
+
+    stub = None
+    if "ai_search" in args.scenarios and not args.base_url and not os.environ.get("OPENAI_BASE_URL"):
+        stub = start_stub_openai(args.openai_latency)
+    try:
+        from benchmarks.scenarios import run
+
+        report = asyncio.run(run(args))
+    finally:
+        if stub is not None:
+            stub.terminate()
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
@@ -0,0 +1,170 @@
+"""Load scenarios for benchmarks.load_test.
+
+Kept apart from the CLI because importing the app freezes settings: load_test
+sets the database URL and OpenAI stub address in the environment first.
+"""
+import asyncio
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.common import BENCH_PASSWORD, make_catalog, make_users, percentiles, user_email
+
+# Mix of queries the local parser answers and ones that need the (stubbed) LLM
+AI_QUERIES = [
+    "laptop under {price}",
+    "phone below {price}",
+    "headphones under {price}",
+    "smartwatch for running under {price}",
+    "something to listen to music on the train {n}",
+    "gift for a photographer who travels {n}",
+    "quiet keyboard for late night coding {n}",
+]
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Each scenario's setup returns the coroutine function issuing one request
+
+async def setup_products_deep_offset(client, args):
+    last_page = max(1, args.products // args.page_size)
+
+    async def request(rng):
+        page = rng.randint(max(1, int(last_page * 0.5)), last_page)
+        return await client.get("/products", params={"page": page, "limit": args.page_size})
+    return request
+
+
+async def setup_products_deep_cursor(client, args):
+    from app.services.product import encode_cursor
+
+    async def request(rng):
+        after_id = rng.randint(args.products // 2, max(args.products // 2, args.products - args.page_size))
+        return await client.get("/products", params={"cursor": encode_cursor(after_id), "limit": args.page_size})
+    return request
+
+
+async def setup_ai_search(client, args):
+    async def request(rng):
+        query = rng.choice(AI_QUERIES).format(
+            price=rng.choice([5000, 10000, 20000, 50000, 100000]), n=rng.randint(0, args.ai_unique_queries)
+        )
+        return await client.post("/ai/search", json={"query": query})
+    return request
+
+
+async def setup_auth_login(client, args):
+    async def request(rng):
+        email = user_email(rng.randrange(args.users))
+        return await client.post("/auth/login", json={"email": email, "password": BENCH_PASSWORD})
+    return request
+
+
+async def setup_users_me(client, args):
+    headers = []
+    for i in range(min(args.users, args.concurrency * 2)):
+        response = await client.post("/auth/login", json={"email": user_email(i), "password": BENCH_PASSWORD})
+        response.raise_for_status()
+        headers.append({"Authorization": f"Bearer {response.json()['access_token']}"})
+
+    async def request(rng):
+        return await client.get("/users/me", headers=rng.choice(headers))
+    return request
+
+
+async def run_scenario(request, total: int, concurrency: int, warmup: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    for _ in range(warmup):
+        await request(rng)
+
+    samples, statuses = [], Counter()
+
+    # Fixed quotas rather than a shared queue: each worker's request sequence then
+    # depends only on its seed, not on which worker happened to be free
+    async def worker(worker_rng, quota):
+        for _ in range(quota):
+            start = time.perf_counter()
+            try:
+                status = (await request(worker_rng)).status_code
+            except Exception as e:
+                status = type(e).__name__
+            samples.append((time.perf_counter() - start) * 1000)
+            statuses[str(status)] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(random.Random(seed + i + 1), total // concurrency + (i < total % concurrency))
+        for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "rps": round(total / elapsed, 1),
+        "errors": errors,
+        "status": dict(statuses),
+        **percentiles(samples),
+    }
+
+
+async def run(args) -> dict:
+    if not args.skip_setup:
+        engine, _ = await make_catalog(args.url, args.products)
+        await engine.dispose()
+        await make_users(args.url, args.users)
+
+    # Imported only now: settings and the OpenAI client read the environment at import
+    from app.core.config import settings
+    from app.core.database import Base, engine
+    from app.main import app
+
+    search_engine = settings.SEARCH_ENGINE
+    if search_engine == "auto":
+        search_engine = "fulltext" if engine.dialect.name == "postgresql" else "ilike"
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    results = {}
+    async with client:
+        for name in args.scenarios:
+            request = await globals()[f"setup_{name}"](client, args)
+            results[name] = await run_scenario(request, args.requests, args.concurrency, args.warmup, args.seed)
+            print(f"{name}: {results[name]['rps']} rps, p99 {results[name].get('p99_ms')} ms", file=sys.stderr)
+    await engine.dispose()
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": args.url.split("://")[0],
+            "search_engine": search_engine,
+            "target": args.base_url or "in-process",
+            "products": args.products,
+            "users": args.users,
+            "response_cache": not args.no_response_cache,
+            "openai_stub_latency": args.openai_latency,
+        },
+        "scenarios": results,
+    }
@@ -0,0 +1,80 @@
+"""Minimal stand-in for the OpenAI chat completions API.
+
+Answers with a fixed-shape intent after a configurable delay, and can fail or
+hang a share of requests to exercise the timeout, hedging and circuit breaker.
+
+    python -m benchmarks.stub_openai --port 8001 --latency 0.2 --error-rate 0.1
+    OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8001/v1 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+PRICE = re.compile(r"(\d[\d,]*)")
+
+app = FastAPI()
+app.state.latency = 0.0
+app.state.jitter = 0.0
+app.state.error_rate = 0.0
+app.state.hang_rate = 0.0
+
+
+def _intent(query: str) -> dict:
+    words = [w for w in re.findall(r"[a-z]+", query.lower()) if len(w) > 2]
+    price = PRICE.search(query)
+    return {
+        "main_keyword": words[0] if words else None,
+        "max_price": float(price.group(1).replace(",", "")) if price else None,
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    state = request.app.state
+    roll = random.random()
+    if roll < state.hang_rate:
+        await asyncio.sleep(3600)
+    await asyncio.sleep(state.latency + random.random() * state.jitter)
+    if roll < state.hang_rate + state.error_rate:
+        return JSONResponse({"error": {"message": "stub failure", "type": "server_error"}}, status_code=500)
+
+    query = body["messages"][-1]["content"]
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": json.dumps(_intent(query))},
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra uniform random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Share of requests that never answer")
+    args = parser.parse_args()
+
+    app.state.latency, app.state.jitter = args.latency, args.jitter
+    app.state.error_rate, app.state.hang_rate = args.error_rate, args.hang_rate
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
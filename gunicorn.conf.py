@@ -0,0 +1,21 @@
+# gunicorn -c gunicorn.conf.py app.main:app
+# Same settings as `python -m app.serve`, with gunicorn supervising the workers.
+import os
+
+from app.core.config import settings
+from app.serve import worker_count
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '8000')}"
+workers = worker_count()
+# Picks uvloop and httptools when they are installed
+worker_class = "uvicorn.workers.UvicornWorker"
+# UvicornWorker hands this to uvicorn's proxy header handling
+forwarded_allow_ips = settings.FORWARDED_ALLOW_IPS
+# No preload: each worker builds its own engine, pools and clients after the fork
+preload_app = False
+graceful_timeout = 30
+timeout = 60
+keepalive = 5
+# Recycle workers periodically, staggered so they don't all restart together
+max_requests = 10000
+max_requests_jitter = 1000
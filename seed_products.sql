@@ -1,220 +0,0 @@
-
-CREATE TABLE IF NOT EXISTS products (
-    id SERIAL PRIMARY KEY,
-    title VARCHAR(255) NOT NULL,
-    description TEXT,
-    price DECIMAL(10, 2) NOT NULL CHECK (price >= 0),
-    image_url TEXT,
-    category VARCHAR(100) DEFAULT 'electronics',
-    is_active BOOLEAN DEFAULT TRUE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-
-TRUNCATE TABLE products;
-
-INSERT INTO products (title, description, price, image_url, category, is_active) VALUES
-('HP HD Drone Pro', 'Experience excellence with the HP HD Drone Pro. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 91087.43, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Gaming Mouse HD 656', 'Experience excellence with the Logitech Gaming Mouse HD 656. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4219.31, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG External SSD Portable 268', 'Experience excellence with the LG External SSD Portable 268. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 24848.57, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Xiaomi Smartwatch HD 774', 'Experience excellence with the Xiaomi Smartwatch HD 774. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 17732.15, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Slim Graphics Card X1', 'Experience excellence with the Corsair Slim Graphics Card X1. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 35676.83, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Pro Laptop Ultra', 'Experience excellence with the Bose Pro Laptop Ultra. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 185189.47, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Charger Adapter Series 824', 'Experience excellence with the Corsair Charger Adapter Series 824. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1647.05, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Prime Charger Adapter X1', 'Experience excellence with the Dell Prime Charger Adapter X1. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1833.02, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus USB-C Hub Plus 730', 'Experience excellence with the Asus USB-C Hub Plus 730. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3113.34, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Smartwatch Air 340', 'Experience excellence with the Acer Smartwatch Air 340. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 30256.69, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Slim Router Max', 'Experience excellence with the Dell Slim Router Max. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 6314.79, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Mirrorless Camera Plus 806', 'Experience excellence with the Garmin Mirrorless Camera Plus 806. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 147986.15, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Wireless Earbuds Pro 413', 'Experience excellence with the Garmin Wireless Earbuds Pro 413. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2597.58, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Wireless Earbuds Note 660', 'Experience excellence with the Corsair Wireless Earbuds Note 660. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9056.36, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Charger Adapter Pro 425', 'Experience excellence with the Sony Charger Adapter Pro 425. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2890.4, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech USB-C Hub High-Performance 220', 'Experience excellence with the Logitech USB-C Hub High-Performance 220. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 7693.49, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Ergonomic External SSD Ultra', 'Experience excellence with the Bose Ergonomic External SSD Ultra. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 12018.09, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Wireless Bluetooth Speaker Max', 'Experience excellence with the Razer Wireless Bluetooth Speaker Max. This premium bluetooth speaker features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 26336.92, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo 4K Microphone Max', 'Experience excellence with the Lenovo 4K Microphone Max. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 27231.55, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL 4K Smart Light Max', 'Experience excellence with the JBL 4K Smart Light Max. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1307.63, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Portable Headphones', 'Experience excellence with the Asus Portable Headphones. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 34813.44, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Air Smartphone Ultra', 'Experience excellence with the Apple Air Smartphone Ultra. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 87800.91, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Compact Wireless Earbuds Ultra', 'Experience excellence with the Razer Compact Wireless Earbuds Ultra. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8869.61, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Series Smartwatch Pro', 'Experience excellence with the Logitech Series Smartwatch Pro. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 29704.16, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Compact Smart Light X1', 'Experience excellence with the Bose Compact Smart Light X1. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1670.56, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Series Gaming Mouse Max', 'Experience excellence with the Google Series Gaming Mouse Max. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2609.04, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Mirrorless Camera Series 401', 'Experience excellence with the Sony Mirrorless Camera Series 401. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 42707.13, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Tablet Series 667', 'Experience excellence with the OnePlus Tablet Series 667. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 46727.44, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Action Camera Pro 142', 'Experience excellence with the JBL Action Camera Pro 142. This premium action camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 11086.62, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Slim Power Bank', 'Experience excellence with the Google Slim Power Bank. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4312.51, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Elite Smartwatch X1', 'Experience excellence with the Garmin Elite Smartwatch X1. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 15390.72, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Smartphone Compact 868', 'Experience excellence with the Google Smartphone Compact 868. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 84364.1, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Prime Drone Max', 'Experience excellence with the Google Prime Drone Max. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 136404.08, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Slim Drone S2', 'Experience excellence with the Bose Slim Drone S2. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 84654.55, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Power Bank Pro 604', 'Experience excellence with the LG Power Bank Pro 604. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3774.39, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Smart Home Hub Portable 535', 'Experience excellence with the Fitbit Smart Home Hub Portable 535. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8481.86, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Gaming Mouse High-Performance 153', 'Experience excellence with the OnePlus Gaming Mouse High-Performance 153. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2352.1, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Charger Adapter High-Performance 859', 'Experience excellence with the Lenovo Charger Adapter High-Performance 859. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1720.01, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus High-Performance Wireless Earbuds Max', 'Experience excellence with the Asus High-Performance Wireless Earbuds Max. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 15828.09, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Smartwatch Air 214', 'Experience excellence with the Microsoft Smartwatch Air 214. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 36683.71, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser Noise-Cancelling Laptop X1', 'Experience excellence with the Sennheiser Noise-Cancelling Laptop X1. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 164670.43, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Charger Adapter High-Performance 557', 'Experience excellence with the Lenovo Charger Adapter High-Performance 557. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1632.79, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Smart Smart Home Hub X1', 'Experience excellence with the Microsoft Smart Smart Home Hub X1. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 24172.85, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Smartwatch Max 618', 'Experience excellence with the Lenovo Smartwatch Max 618. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 13210.8, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Smart Light High-Performance 333', 'Experience excellence with the Google Smart Light High-Performance 333. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3771.62, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Smartwatch HD 876', 'Experience excellence with the JBL Smartwatch HD 876. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 26015.23, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Wireless Tablet Ultra', 'Experience excellence with the Asus Wireless Tablet Ultra. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 53818.61, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('DJI Pro Microphone Max', 'Experience excellence with the DJI Pro Microphone Max. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9300.24, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Power Bank Gaming 810', 'Experience excellence with the Fitbit Power Bank Gaming 810. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3048.9, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Headphones Series 822', 'Experience excellence with the Microsoft Headphones Series 822. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5116.79, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Noise-Cancelling Smartwatch Max', 'Experience excellence with the Logitech Noise-Cancelling Smartwatch Max. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 11438.62, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Drone HD 75', 'Experience excellence with the GoPro Drone HD 75. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 38432.06, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Noise-Cancelling Bluetooth Speaker Max', 'Experience excellence with the JBL Noise-Cancelling Bluetooth Speaker Max. This premium bluetooth speaker features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 20594.9, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit High-Performance Charger Adapter', 'Experience excellence with the Fitbit High-Performance Charger Adapter. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2455.48, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Bluetooth Speaker Note 837', 'Experience excellence with the OnePlus Bluetooth Speaker Note 837. This premium bluetooth speaker features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5567.42, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Smart Home Hub X 454', 'Experience excellence with the Lenovo Smart Home Hub X 454. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 24298.65, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Gaming VR Headset X1', 'Experience excellence with the GoPro Gaming VR Headset X1. This premium vr headset features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 55256.33, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer X Microphone', 'Experience excellence with the Acer X Microphone. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 24487.81, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Smartphone Max 647', 'Experience excellence with the Microsoft Smartphone Max 647. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 92648.91, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Plus Charger Adapter Max', 'Experience excellence with the Apple Plus Charger Adapter Max. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1347.28, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer External SSD Compact 724', 'Experience excellence with the Razer External SSD Compact 724. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8768.46, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Microphone X 694', 'Experience excellence with the Lenovo Microphone X 694. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9833.36, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Canon Webcam Prime 370', 'Experience excellence with the Canon Webcam Prime 370. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 13024.18, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Wireless Router X1', 'Experience excellence with the Garmin Wireless Router X1. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16141.18, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Microphone Ultra 404', 'Experience excellence with the Apple Microphone Ultra 404. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 19138.55, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Note Charger Adapter Ultra', 'Experience excellence with the Bose Note Charger Adapter Ultra. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2516.01, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Bluetooth Speaker Max 21', 'Experience excellence with the Microsoft Bluetooth Speaker Max 21. This premium bluetooth speaker features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 18063.75, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser High-Performance Charger Adapter Max', 'Experience excellence with the Sennheiser High-Performance Charger Adapter Max. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2143.16, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer External SSD Compact 524', 'Experience excellence with the Razer External SSD Compact 524. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16449.9, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Gaming Graphics Card Max', 'Experience excellence with the Garmin Gaming Graphics Card Max. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 147973.94, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Tablet X 100', 'Experience excellence with the Dell Tablet X 100. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 76703.74, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Mechanical Keyboard Elite 855', 'Experience excellence with the Lenovo Mechanical Keyboard Elite 855. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16717.24, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Tablet Note 189', 'Experience excellence with the Dell Tablet Note 189. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 59864.09, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Graphics Card Pro 768', 'Experience excellence with the Asus Graphics Card Pro 768. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 111225.02, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft External SSD Max 772', 'Experience excellence with the Microsoft External SSD Max 772. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8870.13, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Prime Router Pro', 'Experience excellence with the Garmin Prime Router Pro. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16641.15, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Gaming Gaming Mouse Pro', 'Experience excellence with the Google Gaming Gaming Mouse Pro. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2191.15, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro 4K Charger Adapter', 'Experience excellence with the GoPro 4K Charger Adapter. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2702.94, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Max Headphones Max', 'Experience excellence with the Sony Max Headphones Max. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 19674.05, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose USB-C Hub Elite 46', 'Experience excellence with the Bose USB-C Hub Elite 46. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8205.08, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus High-Performance Microphone X1', 'Experience excellence with the OnePlus High-Performance Microphone X1. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16224.05, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Max Charger Adapter Max', 'Experience excellence with the Logitech Max Charger Adapter Max. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2682.76, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Router Portable 314', 'Experience excellence with the GoPro Router Portable 314. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8127.32, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Smart Home Hub Gaming 328', 'Experience excellence with the Apple Smart Home Hub Gaming 328. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 10815.42, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Samsung Max Power Bank Pro', 'Experience excellence with the Samsung Max Power Bank Pro. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4364.51, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Mechanical Keyboard Wireless 227', 'Experience excellence with the Logitech Mechanical Keyboard Wireless 227. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4808.63, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony USB-C Hub Smart 403', 'Experience excellence with the Sony USB-C Hub Smart 403. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8245.65, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Series Webcam S2', 'Experience excellence with the Dell Series Webcam S2. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 11893.43, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Smart Mechanical Keyboard Pro', 'Experience excellence with the Fitbit Smart Mechanical Keyboard Pro. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 11290.85, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Xiaomi Charger Adapter Portable 297', 'Experience excellence with the Xiaomi Charger Adapter Portable 297. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1468.17, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Headphones HD 496', 'Experience excellence with the Fitbit Headphones HD 496. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 24597.23, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Gaming Gaming Monitor Pro', 'Experience excellence with the Nikon Gaming Gaming Monitor Pro. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 46181.44, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Smart Tablet Max', 'Experience excellence with the Google Smart Tablet Max. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 50788.59, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('HP Compact USB-C Hub', 'Experience excellence with the HP Compact USB-C Hub. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 6560.82, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin VR Headset Note 204', 'Experience excellence with the Garmin VR Headset Note 204. This premium vr headset features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 70528.01, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Gaming Monitor X 501', 'Experience excellence with the Razer Gaming Monitor X 501. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 32188.67, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Samsung Headphones Ergonomic 771', 'Experience excellence with the Samsung Headphones Ergonomic 771. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 21450.53, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Wireless Earbuds Pro 308', 'Experience excellence with the Sony Wireless Earbuds Pro 308. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 21206.44, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Elite Webcam Ultra', 'Experience excellence with the Microsoft Elite Webcam Ultra. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 11790.75, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro 4K Charger Adapter Ultra', 'Experience excellence with the GoPro 4K Charger Adapter Ultra. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1627.18, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Noise-Cancelling Charger Adapter X1', 'Experience excellence with the OnePlus Noise-Cancelling Charger Adapter X1. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2639.86, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('HP Gaming External SSD Pro', 'Experience excellence with the HP Gaming External SSD Pro. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 19431.65, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Compact Power Bank Max', 'Experience excellence with the GoPro Compact Power Bank Max. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3818.38, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Gaming Monitor Prime 540', 'Experience excellence with the Acer Gaming Monitor Prime 540. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 77943.6, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Max Smart Home Hub', 'Experience excellence with the OnePlus Max Smart Home Hub. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 12387.79, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Mechanical Keyboard Air 637', 'Experience excellence with the Google Mechanical Keyboard Air 637. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4565.78, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Mirrorless Camera Portable 889', 'Experience excellence with the JBL Mirrorless Camera Portable 889. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 66210.68, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Charger Adapter X 634', 'Experience excellence with the JBL Charger Adapter X 634. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1134.42, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Lenovo Pro Tablet X1', 'Experience excellence with the Lenovo Pro Tablet X1. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 44345.65, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Smartwatch Max 62', 'Experience excellence with the Razer Smartwatch Max 62. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 20009.3, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Charger Adapter Pro 602', 'Experience excellence with the OnePlus Charger Adapter Pro 602. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 844.99, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Portable Tablet Ultra', 'Experience excellence with the Acer Portable Tablet Ultra. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 91851.11, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Gaming Monitor Gaming 695', 'Experience excellence with the JBL Gaming Monitor Gaming 695. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 72776.8, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Prime Mirrorless Camera S2', 'Experience excellence with the GoPro Prime Mirrorless Camera S2. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 53683.78, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer 4K Graphics Card X1', 'Experience excellence with the Acer 4K Graphics Card X1. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 64952.85, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Ultra Drone S2', 'Experience excellence with the Acer Ultra Drone S2. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 132406.48, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Drone Plus 303', 'Experience excellence with the Bose Drone Plus 303. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 116476.58, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Action Camera Series 618', 'Experience excellence with the Asus Action Camera Series 618. This premium action camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 14826.83, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Xiaomi Tablet Ergonomic 431', 'Experience excellence with the Xiaomi Tablet Ergonomic 431. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 35029.95, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG USB-C Hub Wireless 229', 'Experience excellence with the LG USB-C Hub Wireless 229. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 6543.44, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Mirrorless Camera Ultra 71', 'Experience excellence with the Fitbit Mirrorless Camera Ultra 71. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 73640.93, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Mechanical Keyboard Wireless 92', 'Experience excellence with the Logitech Mechanical Keyboard Wireless 92. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 7153.29, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Gaming Monitor Portable 873', 'Experience excellence with the Acer Gaming Monitor Portable 873. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 20911.84, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('HP Power Bank Ultra 314', 'Experience excellence with the HP Power Bank Ultra 314. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2405.67, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Noise-Cancelling Headphones Max', 'Experience excellence with the Apple Noise-Cancelling Headphones Max. This premium headphones features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 26577.66, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Series Laptop S2', 'Experience excellence with the Sony Series Laptop S2. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 37862.68, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Drone Slim 483', 'Experience excellence with the Garmin Drone Slim 483. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 89800.03, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Microphone Max 153', 'Experience excellence with the GoPro Microphone Max 153. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 27812.29, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Action Camera Ultra 817', 'Experience excellence with the JBL Action Camera Ultra 817. This premium action camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 32713.86, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Ultra USB-C Hub Pro', 'Experience excellence with the Razer Ultra USB-C Hub Pro. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3237.77, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser Pro External SSD Max', 'Experience excellence with the Sennheiser Pro External SSD Max. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 27896.63, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('DJI Note Power Bank S2', 'Experience excellence with the DJI Note Power Bank S2. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3797.34, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Smart Light HD 448', 'Experience excellence with the Bose Smart Light HD 448. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2487.38, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Pro Power Bank', 'Experience excellence with the Razer Pro Power Bank. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 2215.99, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit USB-C Hub 4K 465', 'Experience excellence with the Fitbit USB-C Hub 4K 465. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3720.72, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Webcam Ergonomic 149', 'Experience excellence with the OnePlus Webcam Ergonomic 149. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9491.17, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Series Mirrorless Camera X1', 'Experience excellence with the JBL Series Mirrorless Camera X1. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 115359.04, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Slim Microphone X1', 'Experience excellence with the Logitech Slim Microphone X1. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 26425.9, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Ultra Smart Light Ultra', 'Experience excellence with the Fitbit Ultra Smart Light Ultra. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1061.26, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Note Power Bank', 'Experience excellence with the Google Note Power Bank. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4441.83, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser Laptop Portable 5', 'Experience excellence with the Sennheiser Laptop Portable 5. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 108779.64, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Compact External SSD X1', 'Experience excellence with the Asus Compact External SSD X1. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 12567.75, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Webcam 4K 521', 'Experience excellence with the Dell Webcam 4K 521. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3385.04, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser Router Elite 672', 'Experience excellence with the Sennheiser Router Elite 672. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9671.5, 'https://images.unsplash.com/photo-1588872657578-831154f92bc3?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Elite Power Bank X1', 'Experience excellence with the Asus Elite Power Bank X1. This premium power bank features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4113.0, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit Prime Microphone Pro', 'Experience excellence with the Fitbit Prime Microphone Pro. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 15130.22, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG X Graphics Card Pro', 'Experience excellence with the LG X Graphics Card Pro. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 105604.55, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Xiaomi USB-C Hub High-Performance 197', 'Experience excellence with the Xiaomi USB-C Hub High-Performance 197. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5988.85, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Gaming Monitor Slim 475', 'Experience excellence with the Nikon Gaming Monitor Slim 475. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 17709.72, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('HP Webcam 4K 59', 'Experience excellence with the HP Webcam 4K 59. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5664.74, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Gaming Mirrorless Camera X1', 'Experience excellence with the JBL Gaming Mirrorless Camera X1. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 115070.29, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Pro Mirrorless Camera X1', 'Experience excellence with the JBL Pro Mirrorless Camera X1. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 104377.75, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Smart Wireless Earbuds Ultra', 'Experience excellence with the Bose Smart Wireless Earbuds Ultra. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 22588.58, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Charger Adapter Gaming 353', 'Experience excellence with the Razer Charger Adapter Gaming 353. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1008.23, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Smartwatch Compact 479', 'Experience excellence with the Corsair Smartwatch Compact 479. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 21429.66, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Smartphone Air 373', 'Experience excellence with the JBL Smartphone Air 373. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 99528.47, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon High-Performance Wireless Earbuds', 'Experience excellence with the Nikon High-Performance Wireless Earbuds. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9461.5, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Prime Tablet Ultra', 'Experience excellence with the Garmin Prime Tablet Ultra. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 95219.68, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech External SSD Smart 354', 'Experience excellence with the Logitech External SSD Smart 354. This premium external ssd features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 14681.29, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Smart Mirrorless Camera Max', 'Experience excellence with the Bose Smart Mirrorless Camera Max. This premium mirrorless camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 107176.5, 'https://images.unsplash.com/photo-1572569028738-411a19717515?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Plus Bluetooth Speaker X1', 'Experience excellence with the Apple Plus Bluetooth Speaker X1. This premium bluetooth speaker features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 8820.27, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser High-Performance Laptop Ultra', 'Experience excellence with the Sennheiser High-Performance Laptop Ultra. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 31689.35, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony High-Performance Action Camera S2', 'Experience excellence with the Sony High-Performance Action Camera S2. This premium action camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 32699.3, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Webcam Pro 88', 'Experience excellence with the JBL Webcam Pro 88. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 13609.93, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Prime Smart Light Ultra', 'Experience excellence with the LG Prime Smart Light Ultra. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4465.97, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Charger Adapter Noise-Cancelling 209', 'Experience excellence with the Garmin Charger Adapter Noise-Cancelling 209. This premium charger adapter features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1540.2, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Microphone Note 740', 'Experience excellence with the Google Microphone Note 740. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 20284.17, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('GoPro Prime Smartphone', 'Experience excellence with the GoPro Prime Smartphone. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 44576.84, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Portable Drone X1', 'Experience excellence with the Logitech Portable Drone X1. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 72785.02, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus Laptop Compact 378', 'Experience excellence with the Asus Laptop Compact 378. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 71695.05, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Series Gaming Mouse Pro', 'Experience excellence with the Microsoft Series Gaming Mouse Pro. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5238.2, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('OnePlus Noise-Cancelling Mechanical Keyboard S2', 'Experience excellence with the OnePlus Noise-Cancelling Mechanical Keyboard S2. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 12935.99, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Wireless Earbuds Portable 166', 'Experience excellence with the LG Wireless Earbuds Portable 166. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 21823.75, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Ergonomic Webcam', 'Experience excellence with the LG Ergonomic Webcam. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9603.19, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Plus Gaming Monitor Max', 'Experience excellence with the Google Plus Gaming Monitor Max. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 30542.07, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Smart Light Slim 124', 'Experience excellence with the Nikon Smart Light Slim 124. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4059.91, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('DJI Prime Wireless Earbuds S2', 'Experience excellence with the DJI Prime Wireless Earbuds S2. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 6412.42, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Smart Light Noise-Cancelling 341', 'Experience excellence with the Nikon Smart Light Noise-Cancelling 341. This premium smart light features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 1029.3, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Elite Smart Home Hub Pro', 'Experience excellence with the Corsair Elite Smart Home Hub Pro. This premium smart home hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 23521.85, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Fitbit 4K Microphone Ultra', 'Experience excellence with the Fitbit 4K Microphone Ultra. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 18366.97, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL Smart Wireless Earbuds X1', 'Experience excellence with the JBL Smart Wireless Earbuds X1. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 3199.32, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Asus HD Smartwatch Pro', 'Experience excellence with the Asus HD Smartwatch Pro. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 9305.25, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Slim Tablet Ultra', 'Experience excellence with the Nikon Slim Tablet Ultra. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 91418.6, 'https://images.unsplash.com/photo-1523275335684-37898b6baf30?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Nikon Prime Wireless Earbuds', 'Experience excellence with the Nikon Prime Wireless Earbuds. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4271.02, 'https://images.unsplash.com/photo-1505740420928-5e560c06d30e?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('JBL HD Router X1', 'Experience excellence with the JBL HD Router X1. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 16322.58, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Prime Laptop Pro', 'Experience excellence with the LG Prime Laptop Pro. This premium laptop features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 90109.01, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Webcam Gaming 602', 'Experience excellence with the LG Webcam Gaming 602. This premium webcam features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5623.92, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Razer Microphone Wireless 496', 'Experience excellence with the Razer Microphone Wireless 496. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 25620.8, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Tablet Ultra 490', 'Experience excellence with the Corsair Tablet Ultra 490. This premium tablet features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 65686.59, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Plus Graphics Card Max', 'Experience excellence with the Sony Plus Graphics Card Max. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 21140.77, 'https://images.unsplash.com/photo-1546868871-7041f2a55e12?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Canon Microphone 4K 276', 'Experience excellence with the Canon Microphone 4K 276. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 20208.14, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sony Prime Action Camera Ultra', 'Experience excellence with the Sony Prime Action Camera Ultra. This premium action camera features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 33884.81, 'https://images.unsplash.com/photo-1593642702821-c8da6771f0c6?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft Smartphone Series 275', 'Experience excellence with the Microsoft Smartphone Series 275. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 90939.54, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Acer Mechanical Keyboard Note 105', 'Experience excellence with the Acer Mechanical Keyboard Note 105. This premium mechanical keyboard features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 4122.82, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('LG Smartphone High-Performance 287', 'Experience excellence with the LG Smartphone High-Performance 287. This premium smartphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 38776.96, 'https://images.unsplash.com/photo-1511707171634-5f897ff02aa9?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Bose Pro Microphone', 'Experience excellence with the Bose Pro Microphone. This premium microphone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5769.63, 'https://images.unsplash.com/photo-1608231387042-66d1773070a5?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Google Graphics Card Compact 616', 'Experience excellence with the Google Graphics Card Compact 616. This premium graphics card features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 98641.75, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Apple Drone Noise-Cancelling 665', 'Experience excellence with the Apple Drone Noise-Cancelling 665. This premium drone features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 48517.92, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Sennheiser X VR Headset X1', 'Experience excellence with the Sennheiser X VR Headset X1. This premium vr headset features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 86282.92, 'https://images.unsplash.com/photo-1591196778771-0014b7454247?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Dell Noise-Cancelling Router', 'Experience excellence with the Dell Noise-Cancelling Router. This premium router features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 13872.08, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Garmin Slim Gaming Monitor S2', 'Experience excellence with the Garmin Slim Gaming Monitor S2. This premium gaming monitor features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 14020.05, 'https://images.unsplash.com/photo-1496181133206-80ce9b88a853?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Microsoft USB-C Hub Portable 172', 'Experience excellence with the Microsoft USB-C Hub Portable 172. This premium usb-c hub features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5046.22, 'https://images.unsplash.com/photo-1526170375885-4d8ecf77b99f?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Corsair Wireless Earbuds Smart 565', 'Experience excellence with the Corsair Wireless Earbuds Smart 565. This premium wireless earbuds features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 5090.39, 'https://images.unsplash.com/photo-1517336714731-489689fd1ca4?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Logitech Smartwatch Compact 649', 'Experience excellence with the Logitech Smartwatch Compact 649. This premium smartwatch features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 10665.24, 'https://images.unsplash.com/photo-1564424224827-cd24b8915874?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE),
-('Xiaomi Series Gaming Mouse X1', 'Experience excellence with the Xiaomi Series Gaming Mouse X1. This premium gaming mouse features top-tier specifications, durable build quality, and cutting-edge technology suitable for both professionals and enthusiasts.', 7408.52, 'https://images.unsplash.com/photo-1610438235354-a6ae5528385c?auto=format&fit=crop&w=500&q=60', 'electronics', TRUE);
@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+# Settings are read at import time, so the environment must be in place first
+_tmp = tempfile.mkdtemp(prefix="app-tests-")
+os.environ.update(
+    SECRET_KEY="test-secret",
+    ALGORITHM="HS256",
+    ACCESS_TOKEN_EXPIRE_MINUTES="30",
+    SQLALCHEMY_DATABASE_URI=f"sqlite+aiosqlite:///{_tmp}/test.db",
+    OPENAI_API_KEY="",
+    REDIS_URL="",
+    EMBEDDINGS_PATH="",
+)
+
+import pytest
+
+from app.core.database import AsyncSessionLocal, Base, engine
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """A session on a freshly created schema, dropped again after the test."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Pooled aiosqlite connections belong to this test's event loop
+    await engine.dispose()
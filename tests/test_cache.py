@@ -0,0 +1,104 @@
+import asyncio
+import builtins
+
+import pytest
+
+from app.core import cache
+from app.core.cache import CacheBackend, RedisCacheBackend, SingleFlight, TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeRedis:
+    def __init__(self, fail: bool = False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("down")
+        self.data[key] = value.encode()
+
+    async def delete(self, key):
+        if self.fail:
+            raise ConnectionError("down")
+        self.data.pop(key, None)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    c = TTLCache(max_size=2, ttl=60)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")
+    c.set("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+    assert c.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    c = TTLCache(max_size=10, ttl=5)
+    c.set("a", 1)
+    now[0] += 5
+    assert c.get("a") is None
+    assert c.stats()["expirations"] == 1
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+async def test_redis_backend_round_trip_and_namespacing():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client, "intent", ttl=60)
+    await backend.set("q", "v")
+    assert client.data == {"intent:q": b"v"}
+    assert await backend.get("q") == "v"
+    await backend.delete("q")
+    assert await backend.get("q") is None
+    assert backend.stats() == {"hits": 1, "misses": 1}
+
+
+async def test_redis_backend_errors_are_misses():
+    backend = RedisCacheBackend(FakeRedis(fail=True), "intent", ttl=60)
+    await backend.set("q", "v")
+    assert await backend.get("q") is None
+    await backend.delete("q")
+
+
+async def test_single_flight_coalesces_concurrent_calls():
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    flight = SingleFlight()
+    results = await asyncio.gather(*(flight.do("k", load) for _ in range(5)))
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert flight.in_flight() == 0
+
+
+def test_redis_client_without_package_is_a_clear_error(monkeypatch):
+    real_import = builtins.__import__
+
+    def no_redis(name, *args, **kwargs):
+        if name.startswith("redis"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(builtins, "__import__", no_redis)
+    with pytest.raises(RuntimeError, match="redis package is not installed"):
+        cache.redis_client()
@@ -0,0 +1,99 @@
+import gzip
+import json
+
+import httpx
+import pytest
+from sqlalchemy import insert
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate
+from app.main import app as main_app
+from app.models.product import Product
+
+pytestmark = pytest.mark.anyio
+
+LARGE = {"items": ["laptop"] * 500}
+
+
+async def _large(request):
+    return JSONResponse(LARGE, headers={"ETag": '"v1"'})
+
+
+async def _small(request):
+    return JSONResponse({"ok": True})
+
+
+async def _not_modified(request):
+    return Response(status_code=304, headers={"ETag": '"v1"'})
+
+
+sample_app = CompressionMiddleware(Starlette(routes=[
+    Route("/large", _large), Route("/small", _small), Route("/not-modified", _not_modified),
+]), minimum_size=1024)
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.parametrize("accept, brotli_available, expected", [
+    ("gzip, deflate, br", True, "br"),
+    ("gzip, deflate, br", False, "gzip"),
+    ("br;q=0, gzip", True, "gzip"),
+    ("identity", True, None),
+    ("*", False, "gzip"),
+    (None, True, None),
+])
+def test_negotiate(monkeypatch, accept, brotli_available, expected):
+    monkeypatch.setattr(compression, "brotli", object() if brotli_available else None)
+    assert negotiate(accept) == expected
+
+
+async def test_large_json_is_gzipped_with_weak_etag():
+    async with _client(sample_app) as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(json.dumps(LARGE))
+    assert response.json() == LARGE
+
+
+async def test_brotli_when_installed():
+    pytest.importorskip("brotli")
+    async with _client(sample_app) as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == LARGE
+
+
+@pytest.mark.parametrize("method, path", [("GET", "/small"), ("GET", "/not-modified"), ("HEAD", "/large")])
+async def test_passed_through_uncompressed(method, path):
+    async with _client(sample_app) as client:
+        response = await client.request(method, path, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    if method == "HEAD":
+        assert response.content == b""
+
+
+async def test_ndjson_export_streams_compressed(db):
+    await db.execute(insert(Product), [
+        {"title": f"Product {i}", "description": "x" * 200, "price": 10, "category": "electronics"}
+        for i in range(1, 51)
+    ])
+    await db.commit()
+
+    async with _client(main_app) as client:
+        async with client.stream("GET", "/products/export", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            assert "content-length" not in response.headers
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    rows = [json.loads(line) for line in gzip.decompress(raw).splitlines()]
+    assert [row["id"] for row in rows] == list(range(1, 51))
@@ -0,0 +1,34 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.database import InstrumentedQueuePool
+
+pytestmark = pytest.mark.anyio
+
+
+def _pool(refuse: bool = False) -> InstrumentedQueuePool:
+    def creator():
+        if refuse:
+            raise sqlite3.OperationalError("connection refused")
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    return InstrumentedQueuePool(creator, pool_size=1, max_overflow=0, timeout=0.05)
+
+
+async def test_only_pool_exhaustion_counts_as_timeout():
+    pool = _pool()
+    held = await greenlet_spawn(pool.connect)
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert (pool.acquired, pool.timeouts) == (1, 1)
+    held.close()
+
+
+async def test_connect_errors_are_neither_acquired_nor_timeouts():
+    pool = _pool(refuse=True)
+    with pytest.raises(sqlite3.OperationalError):
+        await greenlet_spawn(pool.connect)
+    assert (pool.acquired, pool.timeouts) == (0, 0)
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core import jobs
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.jobs import DatabaseJobQueue, InProcessJobQueue, job
+from app.models.job import Job
+from app.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_SECONDS", 0.001)
+    monkeypatch.setattr(settings, "JOB_RETRY_MAX_SECONDS", 0.001)
+
+
+@pytest.fixture
+def flaky():
+    """A job that fails its first `payload["failures"]` attempts."""
+    calls = []
+
+    @job("test_flaky")
+    async def handler(payload):
+        calls.append(payload)
+        if len(calls) <= payload["failures"]:
+            raise RuntimeError("boom")
+
+    yield calls
+    jobs._handlers.pop("test_flaky", None)
+
+
+async def test_in_process_retries_until_success(flaky):
+    queue = InProcessJobQueue(workers=2, max_size=10)
+    await queue.enqueue("test_flaky", {"failures": 2}, max_attempts=5)
+    await queue.drain(5)
+
+    assert len(flaky) == 3
+
+
+async def test_in_process_gives_up_after_max_attempts(flaky):
+    queue = InProcessJobQueue(workers=1, max_size=10)
+    await queue.enqueue("test_flaky", {"failures": 10}, max_attempts=3)
+    await queue.drain(5)
+
+    assert len(flaky) == 3
+    assert queue.depth() == 0
+
+
+async def test_in_process_queues_session_job_only_on_commit(db, flaky):
+    queue = InProcessJobQueue(workers=1, max_size=10)
+    db.add(User(email="a@example.com", hashed_password="x"))
+    await queue.enqueue("test_flaky", {"failures": 0}, db=db)
+    assert queue.depth() == 0
+    await db.rollback()
+
+    db.add(User(email="b@example.com", hashed_password="x"))
+    await queue.enqueue("test_flaky", {"failures": 0, "n": 2}, db=db)
+    await db.commit()
+    await queue.drain(5)
+
+    assert flaky == [{"failures": 0, "n": 2}]
+
+
+async def _jobs(db):
+    db.expire_all()
+    return (await db.execute(select(Job).order_by(Job.id))).scalars().all()
+
+
+async def test_database_job_is_part_of_the_callers_transaction(db):
+    queue = DatabaseJobQueue(AsyncSessionLocal, workers=1, poll_seconds=0.01)
+    await queue.enqueue("test_flaky", {"failures": 0}, db=db)
+    await db.rollback()
+    assert await _jobs(db) == []
+
+    await queue.enqueue("test_flaky", {"failures": 0}, db=db)
+    await db.commit()
+    assert [j.status for j in await _jobs(db)] == ["queued"]
+
+
+async def test_database_queue_retries_and_drains(db, flaky):
+    queue = DatabaseJobQueue(AsyncSessionLocal, workers=2, poll_seconds=0.01)
+    await queue.enqueue("test_flaky", {"failures": 1}, max_attempts=3)
+    queue.start()
+    for _ in range(500):
+        if [j.status for j in await _jobs(db)] == ["done"]:
+            break
+        await asyncio.sleep(0.01)
+    await queue.drain(5)
+
+    (row,) = await _jobs(db)
+    assert row.status == "done" and row.attempts == 2
+    assert len(flaky) == 2
+
+
+async def _stale_running(db, attempts, max_attempts):
+    db.add(Job(
+        name="test_flaky", payload={}, status="running", attempts=attempts, max_attempts=max_attempts,
+        run_at=jobs._utcnow(), locked_at=jobs._utcnow() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS + 60),
+    ))
+
+
+async def test_stale_jobs_requeue_until_attempts_run_out(db):
+    await _stale_running(db, attempts=1, max_attempts=3)
+    await _stale_running(db, attempts=3, max_attempts=3)
+    await db.commit()
+
+    await DatabaseJobQueue(AsyncSessionLocal, workers=1, poll_seconds=0.01)._recover_stale()
+
+    requeued, exhausted = await _jobs(db)
+    assert requeued.status == "queued" and requeued.locked_at is None
+    assert exhausted.status == "failed" and exhausted.finished_at is not None
+
+
+async def test_finish_after_lock_expired_is_discarded(db):
+    queue = DatabaseJobQueue(AsyncSessionLocal, workers=1, poll_seconds=0.01)
+    await queue.enqueue("test_flaky", {"failures": 0})
+    first = await queue._claim()
+    # The lock timed out, the job was requeued and another worker claimed it again
+    (row,) = await _jobs(db)
+    row.status, row.locked_at = "queued", None
+    await db.commit()
+    second = await queue._claim()
+    assert second.attempts == first.attempts + 1
+
+    await queue._finish(first, "RuntimeError: late", True)
+    (row,) = await _jobs(db)
+    assert row.status == "running" and row.attempts == 2
+
+    await queue._finish(second, None, True)
+    (row,) = await _jobs(db)
+    assert row.status == "done"
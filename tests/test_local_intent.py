@@ -0,0 +1,63 @@
+import pytest
+
+from app.services.ai_search import parse_intent_locally
+
+
+@pytest.mark.parametrize("query, max_price", [
+    ("phone under 20000", 20000),
+    ("laptop below 50,000", 50000),
+    ("tablet upto rs 15000", 15000),
+    ("camera up to 1.5 lakh", 150000),
+    ("headphones less than 5k", 5000),
+    ("smartwatch within ₹ 12,500", 12500),
+    ("tv cheaper than 2 lakhs", 200000),
+])
+def test_price_phrases(query, max_price):
+    intent, _ = parse_intent_locally(query)
+    assert intent.max_price == max_price
+
+
+def test_no_price_without_a_phrase():
+    intent, _ = parse_intent_locally("phone 20000")
+    assert intent.max_price is None
+
+
+@pytest.mark.parametrize("query, keyword", [
+    ("headphones", "headphone"),
+    ("earbuds", "earbud"),
+    ("laptops", "laptop"),
+    ("phones", "phone"),
+])
+def test_plurals_fold_to_known_nouns(query, keyword):
+    intent, confidence = parse_intent_locally(query)
+    assert intent.keywords == [keyword]
+    assert intent.category == "electronics"
+    assert confidence == 1.0
+
+
+def test_unknown_plurals_are_left_alone():
+    intent, _ = parse_intent_locally("watches")
+    assert intent.keywords == ["watches"]
+    assert intent.category is None
+
+
+def test_unrecognised_words_are_kept_as_keywords():
+    intent, confidence = parse_intent_locally("samsung phone")
+    assert intent.keywords == ["phone", "samsung"]
+    assert intent.category == "electronics"
+    assert confidence == 0.5
+
+    intent, _ = parse_intent_locally("gaming laptop 16gb ram")
+    assert intent.keywords == ["laptop", "gaming", "16gb", "ram"]
+
+
+@pytest.mark.parametrize("query, confidence", [
+    ("best phone under 20000", 1.0),
+    ("under 5000", 1.0),
+    ("please show me", 0.0),
+    ("samsung galaxy phone", 1 / 3),
+    ("something to listen to music", 0.0),
+])
+def test_confidence_is_share_of_understood_words(query, confidence):
+    _, score = parse_intent_locally(query)
+    assert score == pytest.approx(confidence)
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.user import Principal, get_principal, principal_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def user(db, monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_TTL_SECONDS", 60)
+    principal_cache.clear()
+    db.add(User(email="a@example.com", hashed_password="x", is_active=True))
+    await db.commit()
+    yield
+    principal_cache.clear()
+
+
+async def test_principal_is_an_immutable_snapshot(db, user):
+    principal = await get_principal(db, "a@example.com")
+    assert principal == Principal(id=1, email="a@example.com", is_active=True)
+    with pytest.raises(AttributeError):
+        principal.is_active = False
+    assert await get_principal(db, "a@example.com") is principal
+
+
+async def test_bulk_update_invalidates_cached_principal(db, user):
+    assert (await get_principal(db, "a@example.com")).is_active
+    await db.execute(update(User).where(User.email == "a@example.com").values(is_active=False))
+    await db.commit()
+    assert not (await get_principal(db, "a@example.com")).is_active
+
+
+async def test_orm_update_invalidates_cached_principal(db, user):
+    await get_principal(db, "a@example.com")
+    row = await db.get(User, 1)
+    row.is_active = False
+    await db.commit()
+    assert not (await get_principal(db, "a@example.com")).is_active
+
+
+async def test_disabled_cache_is_bypassed(db, user, monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_TTL_SECONDS", 0)
+    await get_principal(db, "a@example.com")
+    assert len(principal_cache) == 0
@@ -0,0 +1,53 @@
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.main import app
+from app.models.product import Product
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(db):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def _export(client, updated_since=None):
+    params = {"updated_since": updated_since} if updated_since else {}
+    response = await client.get("/products/export", params=params)
+    assert response.status_code == 200
+    ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+    return ids, response.headers["x-export-started-at"]
+
+
+async def _stamp(db, product_id, updated_at):
+    await db.execute(update(Product).where(Product.id == product_id).values(updated_at=updated_at))
+    await db.commit()
+
+
+async def test_incremental_export_catches_writes_that_started_before_the_watermark(db, client):
+    db.add_all([Product(title="Laptop", price=10), Product(title="Phone", price=20)])
+    await db.commit()
+    ids, watermark = await _export(client)
+    assert ids == [1, 2]
+    exported_at = datetime.fromisoformat(watermark)
+    await _stamp(db, 1, exported_at - timedelta(seconds=settings.EXPORT_OVERLAP_SECONDS + 60))
+
+    # A transaction that began before the export but committed after it is
+    # stamped with its start time, i.e. below the watermark
+    await db.execute(update(Product).where(Product.id == 2).values(is_active=False))
+    await _stamp(db, 2, exported_at - timedelta(seconds=30))
+
+    ids, _ = await _export(client, watermark)
+    assert ids == [2]
+
+
+async def test_watermark_is_timezone_aware(db, client):
+    _, watermark = await _export(client)
+    assert datetime.fromisoformat(watermark).tzinfo is not None
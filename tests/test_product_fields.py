@@ -0,0 +1,42 @@
+import httpx
+import pytest
+from sqlalchemy import insert
+
+from app.main import app
+from app.models.product import Product
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(db):
+    await db.execute(insert(Product), [
+        {"title": f"Laptop {i}", "description": "A laptop", "price": 100 + i, "category": "electronics"}
+        for i in range(1, 6)
+    ])
+    await db.commit()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_products_fields_narrow_response(client):
+    response = await client.get("/products", params={"fields": "title,price", "limit": 2})
+
+    assert response.status_code == 200
+    assert [set(item) for item in response.json()["data"]] == [{"id", "title", "price"}] * 2
+
+
+async def test_ai_search_fields_narrow_response(client):
+    response = await client.post("/ai/search", params={"fields": "title,price"}, json={"query": "laptop"})
+
+    assert response.status_code == 200
+    items = response.json()
+    assert items and all(set(item) == {"id", "title", "price"} for item in items)
+
+
+@pytest.mark.parametrize("method, path, body", [("GET", "/products", None), ("POST", "/ai/search", {"query": "laptop"})])
+async def test_unknown_fields_are_rejected(client, method, path, body):
+    response = await client.request(method, path, params={"fields": "title,password"}, json=body)
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
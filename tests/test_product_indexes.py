@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import event, insert
+
+from app.core.database import engine
+from app.models.product import Product
+from app.services.product import get_newest_products, get_paginated_products
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def catalog(db):
+    await db.execute(insert(Product), [
+        {"title": f"Product {i}", "price": 10, "category": "electronics" if i % 3 else "home", "is_active": i % 20 != 0}
+        for i in range(1, 1001)
+    ])
+    await db.commit()
+    return db
+
+
+async def _plan_of(db, call) -> str:
+    """EXPLAIN QUERY PLAN for the statement `call` sends, exactly as the service built it."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    (statement, parameters), = [s for s in statements if "FROM products" in s[0]]
+    conn = await db.connection()
+    rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return "\n".join(row[-1] for row in rows)
+
+
+async def test_keyset_page_uses_active_id_index(catalog):
+    plan = await _plan_of(catalog, lambda: get_paginated_products(catalog, 1, 10, after_id=100))
+    assert "ix_products_active_id" in plan
+
+
+async def test_category_fallback_uses_active_category_index(catalog):
+    plan = await _plan_of(catalog, lambda: get_newest_products(catalog, 6, category="electronics"))
+    assert "ix_products_active_category_created" in plan
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.streaming import iter_file_chunks, iter_records
+from app.models.product import Product
+from app.services.product_ingest import ingest_products
+
+pytestmark = pytest.mark.anyio
+
+SEED_CSV = Path(__file__).resolve().parent.parent / "seed_products.csv"
+
+
+async def _records(rows):
+    for line, row in enumerate(rows, 1):
+        yield line, row
+
+
+def _product(id, title):
+    return {"id": id, "title": title, "price": "10.00", "category": "electronics"}
+
+
+async def test_replace_deactivates_missing_products(db):
+    await ingest_products(db, _records([_product(1, "Laptop"), _product(2, "Phone")]), mode="replace")
+    summary = await ingest_products(db, _records([_product(1, "Laptop Pro")]), mode="replace")
+
+    assert summary["deactivated"] == 1
+    rows = {p.id: p for p in (await db.execute(select(Product).execution_options(populate_existing=True))).scalars()}
+    # Kept as a tombstone rather than deleted, so incremental exports can report it
+    assert set(rows) == {1, 2}
+    assert rows[1].is_active and rows[1].title == "Laptop Pro"
+    assert not rows[2].is_active
+
+
+async def test_upsert_keeps_products_missing_from_input(db):
+    await ingest_products(db, _records([_product(1, "Laptop"), _product(2, "Phone")]), mode="replace")
+    summary = await ingest_products(db, _records([_product(1, "Laptop Pro")]), mode="upsert")
+
+    assert summary["deactivated"] == 0
+    active = (await db.execute(select(Product.id).where(Product.is_active == True))).scalars().all()
+    assert sorted(active) == [1, 2]
+
+
+async def test_replace_without_ids_is_idempotent(db):
+    rows = [{"title": "Laptop", "price": "10.00"}, {"title": "Phone", "price": "5.00"}]
+    await ingest_products(db, _records(rows), mode="replace")
+    before = (await db.execute(select(Product.id, Product.title).order_by(Product.id))).all()
+
+    rows[0]["price"] = "12.00"
+    summary = await ingest_products(db, _records(rows), mode="replace")
+
+    assert summary["deactivated"] == 0
+    products = (await db.execute(
+        select(Product).order_by(Product.id).execution_options(populate_existing=True)
+    )).scalars().all()
+    assert [(p.id, p.title) for p in products] == before
+    assert all(p.is_active for p in products)
+    assert str(products[0].price) == "12.00"
+
+
+async def test_seed_catalog_replace_twice_keeps_rows_and_ids(db):
+    for _ in range(2):
+        with open(SEED_CSV, "rb") as fileobj:
+            await ingest_products(db, iter_records(iter_file_chunks(fileobj), "csv"), mode="replace")
+        ids = (await db.execute(select(Product.id).where(Product.is_active == True).order_by(Product.id))).scalars().all()
+        total = (await db.execute(select(func.count()).select_from(Product))).scalar_one()
+        assert total == len(ids) == 205
+    assert ids == list(range(1, 206))
@@ -0,0 +1,168 @@
+import runpy
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from app.core import rate_limit
+from app.core.rate_limit import InMemoryRateLimiter, RedisRateLimiter, parse_rate
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    monkeypatch.setattr(rate_limit.time, "time", clock)
+    return clock
+
+
+def test_parse_rate():
+    assert parse_rate("5/minute") == (5, 60)
+    assert parse_rate("100/15minutes") == (100, 900)
+    with pytest.raises(ValueError):
+        parse_rate("lots")
+
+
+async def test_token_bucket_blocks_then_refills(clock):
+    limiter = InMemoryRateLimiter(max_keys=10)
+    assert [await limiter.hit("k", 2, 60) for _ in range(2)] == [None, None]
+
+    retry_after = await limiter.hit("k", 2, 60)
+    assert retry_after == pytest.approx(30)
+    # Other clients have their own bucket
+    assert await limiter.hit("other", 2, 60) is None
+
+    clock.now += 30
+    assert await limiter.hit("k", 2, 60) is None
+    assert await limiter.hit("k", 2, 60) is not None
+
+
+async def test_least_recently_seen_key_is_evicted(clock):
+    limiter = InMemoryRateLimiter(max_keys=2)
+    for key in ("a", "b", "c"):
+        await limiter.hit(key, 1, 60)
+
+    assert len(limiter) == 2 and limiter.evictions == 1
+    # "a" was forgotten, so it starts with a full bucket again
+    assert await limiter.hit("a", 1, 60) is None
+    assert await limiter.hit("c", 1, 60) is not None
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key))
+
+    def get(self, key):
+        self.ops.append(("get", key))
+
+    async def execute(self):
+        results = []
+        for op, key in self.ops:
+            if op == "incr":
+                self.store[key] = self.store.get(key, 0) + 1
+                results.append(self.store[key])
+            elif op == "get":
+                results.append(self.store.get(key))
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.store = {}
+        self.fail = fail
+
+    def pipeline(self, transaction=True):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return FakePipeline(self.store)
+
+
+async def test_sliding_window_weights_previous_window(clock):
+    limiter = RedisRateLimiter(FakeRedis())
+    clock.now = 6000.0  # start of a 60s window
+    assert [await limiter.hit("k", 4, 60) for _ in range(4)] == [None] * 4
+    assert await limiter.hit("k", 4, 60) == pytest.approx(60)
+
+    # Halfway into the next window the previous 5 hits still count as 2.5
+    clock.now = 6090.0
+    assert await limiter.hit("k", 4, 60) is None
+    assert await limiter.hit("k", 4, 60) is not None
+
+
+async def test_redis_outage_allows_requests(clock):
+    limiter = RedisRateLimiter(FakeRedis(fail=True))
+
+    assert await limiter.hit("k", 1, 60) is None
+    assert await limiter.hit("k", 1, 60) is None
+
+
+async def test_enforce_raises_429_with_retry_after(monkeypatch, clock):
+    monkeypatch.setattr(rate_limit, "rate_limiter", InMemoryRateLimiter(max_keys=10))
+    monkeypatch.setattr(rate_limit.settings, "RATE_LIMIT_ENABLED", True)
+    await rate_limit.enforce("login", "1.2.3.4", "1/minute")
+
+    with pytest.raises(HTTPException) as exc:
+        await rate_limit.enforce("login", "1.2.3.4", "1/minute")
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "60"
+    # No rate configured means no limit
+    await rate_limit.enforce("login", "1.2.3.4", None)
+
+
+async def _seen_ip(trusted_hosts, peer, headers):
+    app = FastAPI()
+
+    @app.get("/ip")
+    async def ip(request: Request):
+        return rate_limit.client_ip(request)
+
+    transport = httpx.ASGITransport(app=ProxyHeadersMiddleware(app, trusted_hosts=trusted_hosts), client=(peer, 1234))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return (await client.get("/ip", headers=headers)).json()
+
+
+async def test_client_ip_uses_forwarded_header_from_trusted_proxy():
+    headers = {"X-Forwarded-For": "203.0.113.7"}
+    assert await _seen_ip("10.0.0.5", "10.0.0.5", headers) == "203.0.113.7"
+    # From an untrusted peer the header is ignored, so it can't be used to dodge limits
+    assert await _seen_ip("127.0.0.1", "10.0.0.5", headers) == "10.0.0.5"
+
+
+def test_launchers_pass_forwarded_allow_ips(monkeypatch):
+    from app import serve
+
+    calls = []
+    monkeypatch.setattr(serve.settings, "FORWARDED_ALLOW_IPS", "10.0.0.0/8")
+    monkeypatch.setattr(serve.uvicorn, "run", lambda *args, **kwargs: calls.append(kwargs))
+    serve.main()
+
+    assert calls[0]["proxy_headers"] and calls[0]["forwarded_allow_ips"] == "10.0.0.0/8"
+    gunicorn_conf = runpy.run_path(str(Path(__file__).resolve().parent.parent / "gunicorn.conf.py"))
+    assert gunicorn_conf["forwarded_allow_ips"] == "10.0.0.0/8"
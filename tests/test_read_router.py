@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, ReadRouter, engine, read_router
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def replica_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path}/replica.db"
+
+
+@pytest.fixture
+async def router(replica_url):
+    router = ReadRouter([replica_url])
+    yield router
+    for replica in router.replicas:
+        await replica.engine.dispose()
+
+
+def _served_by(session) -> str:
+    return str(session.bind.url)
+
+
+async def test_reads_go_to_the_replica(router, replica_url):
+    async with await router.open_session() as session:
+        assert _served_by(session) == replica_url
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+
+async def test_failing_replica_falls_back_to_primary(tmp_path):
+    router = ReadRouter([f"sqlite+aiosqlite:///{tmp_path}/missing/dir/replica.db"])
+    (replica,) = router.replicas
+
+    async with await router.open_session() as session:
+        assert _served_by(session) == str(engine.url)
+    assert not replica.healthy
+
+    # Out of rotation: the next read doesn't even try it
+    async with await router.open_session() as session:
+        assert _served_by(session) == str(engine.url)
+    await replica.engine.dispose()
+
+
+async def test_replica_over_lag_budget_is_skipped(router, monkeypatch):
+    monkeypatch.setattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 5)
+    (replica,) = router.replicas
+
+    async def lagging(session):
+        return 30.0
+
+    monkeypatch.setattr(replica, "measure_lag", lagging)
+    async with await router.open_session() as session:
+        assert _served_by(session) == str(engine.url)
+    assert not replica.healthy and replica.lag_seconds == 30.0
+
+
+async def test_reads_after_a_write_stay_on_primary_within_budget(db, router, replica_url, monkeypatch):
+    monkeypatch.setattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 5)
+    monkeypatch.setattr(read_router, "last_write_at", None)
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("CREATE TABLE IF NOT EXISTS scratch (x INTEGER)"))
+        await session.execute(text("INSERT INTO scratch VALUES (1)"))
+        await session.commit()
+    # Any commit on the primary engine is noted on the shared router
+    assert read_router.last_write_at is not None
+    router.last_write_at = read_router.last_write_at
+
+    async with await router.open_session() as session:
+        assert _served_by(session) == str(engine.url)
+
+    router.last_write_at = time.monotonic() - 6
+    async with await router.open_session() as session:
+        assert _served_by(session) == replica_url
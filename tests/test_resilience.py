@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from app.core import resilience
+from app.core.resilience import CircuitBreaker, hedged
+from app.services import ai_search
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+def test_breaker_opens_after_threshold_and_probes_once(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    clock.now += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    # Only one probe at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.trips == 2
+
+
+def test_released_probe_lets_the_next_call_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+@pytest.fixture
+def openai_breaker(monkeypatch, clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    monkeypatch.setattr(ai_search, "openai_breaker", breaker)
+    monkeypatch.setattr(ai_search, "get_openai_client", lambda: object())
+    return breaker
+
+
+async def test_cancelled_probe_releases_breaker(monkeypatch, openai_breaker, clock):
+    openai_breaker.record_failure()
+    clock.now += 10
+    assert openai_breaker.allow()
+
+    started = asyncio.Event()
+
+    async def hang():
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(ai_search, "_request_intent", lambda query: hang())
+    task = asyncio.ensure_future(ai_search._extract_intent_llm("laptop for gaming"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert openai_breaker.allow()
+
+
+async def test_open_breaker_falls_back_to_local_intent(openai_breaker):
+    openai_breaker.record_failure()
+
+    intent, degraded = await ai_search.extract_intent("gaming laptop with rgb keyboard")
+
+    assert degraded
+    assert "laptop" in intent.keywords and intent.category == "electronics"
+
+
+async def test_failed_llm_call_falls_back_to_local_intent(monkeypatch, openai_breaker):
+    async def fail():
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(ai_search, "_request_intent", lambda query: fail())
+
+    intent, degraded = await ai_search.extract_intent("quiet laptop for the office")
+
+    assert degraded
+    assert intent.keywords == ["laptop", "quiet", "office"]
+    assert openai_breaker.state == CircuitBreaker.OPEN
+
+
+async def test_hedged_returns_first_success():
+    calls = []
+
+    async def attempt():
+        calls.append(None)
+        if len(calls) == 1:
+            await asyncio.sleep(60)
+        return "second"
+
+    assert await hedged(attempt, delay=0.01) == "second"
+    assert len(calls) == 2
@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from app.core.response_cache import response_cache
+from app.main import app
+from app.routers import ai
+from app.schemas.ai import IntentData
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(db):
+    response_cache.clear()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    response_cache.clear()
+
+
+def _intent_source(monkeypatch, degraded: bool) -> list:
+    calls = []
+
+    async def extract_intent(query):
+        calls.append(query)
+        return IntentData(keywords=["laptop"]), degraded
+
+    monkeypatch.setattr(ai, "extract_intent", extract_intent)
+    return calls
+
+
+async def test_search_results_are_cached(client, monkeypatch):
+    calls = _intent_source(monkeypatch, degraded=False)
+    for _ in range(2):
+        response = await client.post("/ai/search", json={"query": "a laptop for work"})
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+    assert len(calls) == 1
+
+
+async def test_degraded_search_results_are_not_cached(client, monkeypatch):
+    calls = _intent_source(monkeypatch, degraded=True)
+    for _ in range(2):
+        response = await client.post("/ai/search", json={"query": "a laptop for work"})
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-store"
+    assert len(calls) == 2
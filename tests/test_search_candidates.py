@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import or_, select
+
+from app.core.streaming import iter_file_chunks, iter_records
+from app.models.product import Product
+from app.services.product_ingest import ingest_products
+from app.services.search_engine import IlikeSearchEngine
+
+pytestmark = pytest.mark.anyio
+
+SEED_CSV = Path(__file__).resolve().parent.parent / "seed_products.csv"
+
+
+@pytest.fixture
+async def seeded(db):
+    with open(SEED_CSV, "rb") as fileobj:
+        await ingest_products(db, iter_records(iter_file_chunks(fileobj), "csv"), mode="replace")
+    return db
+
+
+async def _matching(db, keyword):
+    pattern = f"%{keyword}%"
+    rows = await db.execute(
+        select(Product.id).where(
+            Product.is_active == True, or_(Product.title.ilike(pattern), Product.description.ilike(pattern))
+        )
+    )
+    return set(rows.scalars())
+
+
+async def test_keyword_hits_fill_candidates_before_category_matches(seeded):
+    laptops = await _matching(seeded, "laptop")
+    assert len(laptops) > 2
+
+    rows = await IlikeSearchEngine().search(seeded, ["laptop"], category="electronics", limit=50)
+
+    ids = [row.id for row in rows]
+    assert laptops <= set(ids)
+    # Keyword hits lead; category-only matches only pad the remainder
+    assert set(ids[:len(laptops)]) == laptops
+
+
+async def test_title_hits_rank_above_description_hits(seeded):
+    rows = await IlikeSearchEngine().search(seeded, ["laptop"], category="electronics", limit=3)
+
+    assert all("laptop" in row.title.lower() for row in rows)
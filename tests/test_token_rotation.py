@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.revocation import RedisDenylist, TimeBucketedDenylist
+from app.models.user import User
+from app.services import token as token_service
+from app.services.user import get_principal, principal_cache
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = "a@example.com"
+
+
+@pytest.fixture
+def denylist(monkeypatch):
+    denylist = TimeBucketedDenylist()
+    monkeypatch.setattr(token_service, "token_denylist", denylist)
+    return denylist
+
+
+@pytest.fixture
+async def user(db, monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_TTL_SECONDS", 60)
+    principal_cache.clear()
+    db.add(User(email=EMAIL, hashed_password="x", is_active=True))
+    await db.commit()
+    # Warm the cache so concurrent rotations don't share the session
+    await get_principal(db, EMAIL)
+    yield
+    principal_cache.clear()
+
+
+def _family(tokens):
+    return token_service.decode_token(tokens["refresh_token"])["fam"]
+
+
+async def test_add_if_absent_claims_once():
+    denylist = TimeBucketedDenylist()
+    expires_at = time.time() + 60
+
+    assert await denylist.add_if_absent("jti", expires_at)
+    assert not await denylist.add_if_absent("jti", expires_at)
+    assert await denylist.contains("jti")
+
+
+async def test_rotation_is_single_use_and_reuse_revokes_family(db, user, denylist):
+    first = token_service.issue_tokens(EMAIL)
+    second = await token_service.rotate_refresh_token(db, first["refresh_token"])
+    assert _family(second) == _family(first)
+
+    with pytest.raises(HTTPException) as exc:
+        await token_service.rotate_refresh_token(db, first["refresh_token"])
+    assert exc.value.status_code == 401
+    # The replayed token ended the session, so its successor no longer works either
+    assert await denylist.contains(_family(first))
+    with pytest.raises(HTTPException):
+        await token_service.rotate_refresh_token(db, second["refresh_token"])
+
+
+class SlowDenylist(TimeBucketedDenylist):
+    """Answers after a round trip, like a networked store: state can change meanwhile."""
+
+    async def contains(self, *keys):
+        found = await super().contains(*keys)
+        await asyncio.sleep(0)
+        return found
+
+    async def add_if_absent(self, key, expires_at):
+        added = await super().add_if_absent(key, expires_at)
+        await asyncio.sleep(0)
+        return added
+
+
+async def test_concurrent_refresh_with_same_token_counts_as_reuse(db, user, monkeypatch):
+    denylist = SlowDenylist()
+    monkeypatch.setattr(token_service, "token_denylist", denylist)
+    tokens = token_service.issue_tokens(EMAIL)
+
+    results = await asyncio.gather(
+        *(token_service.rotate_refresh_token(db, tokens["refresh_token"]) for _ in range(2)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, dict) for r in results) == 1
+    assert sum(isinstance(r, HTTPException) for r in results) == 1
+    assert await denylist.contains(_family(tokens))
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.keys = {}
+        self.fail = fail
+
+    async def set(self, key, value, ex=None, nx=False):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    async def exists(self, *keys):
+        return sum(key in self.keys for key in keys)
+
+
+async def test_redis_add_if_absent_uses_set_nx():
+    denylist = RedisDenylist(FakeRedis())
+    expires_at = time.time() + 60
+
+    assert await denylist.add_if_absent("jti", expires_at)
+    assert not await denylist.add_if_absent("jti", expires_at)
+    assert await denylist.contains("jti")
+
+
+async def test_redis_write_failure_is_not_silent():
+    denylist = RedisDenylist(FakeRedis(fail=True))
+
+    with pytest.raises(HTTPException) as exc:
+        await denylist.add("jti", time.time() + 60)
+    assert exc.value.status_code == 503
@@ -0,0 +1,70 @@
+import json
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.security import pwd_context
+from app.main import app
+from app.models.user import User
+from app.services.user import import_users
+
+pytestmark = pytest.mark.anyio
+
+
+async def _records(rows):
+    for line, row in enumerate(rows, 1):
+        yield line, row
+
+
+@pytest.fixture
+async def existing(db):
+    db.add(User(email="old@example.com", hashed_password="x", is_active=True))
+    await db.commit()
+
+
+ROWS = [
+    {"email": "a@example.com", "password": "pw-a"},
+    {"email": "a@example.com", "password": "pw-a2"},   # duplicate within the batch
+    {"email": "old@example.com", "password": "pw-old"},  # already in the table
+    {"email": "b@example.com", "password": "pw-b"},
+    {"email": "not-an-email", "password": "pw"},
+    {"email": "b@example.com", "password": "pw-b2"},   # duplicate across batches
+]
+
+
+async def test_import_counts_duplicates_and_existing_rows(db, existing):
+    results = [r async for r in import_users(db, _records(ROWS), batch_size=2)]
+
+    summary = results[-1]["summary"]
+    assert (summary["created"], summary["exists"], summary["invalid"], summary["rows"]) == (2, 3, 1, 6)
+    # Invalid rows are reported straight away, the rest when their batch is written
+    statuses = {r["line"]: r["status"] for r in results[:-1]}
+    assert statuses == {1: "created", 2: "exists", 3: "exists", 4: "created", 5: "invalid", 6: "exists"}
+
+    users = {u.email: u for u in (await db.execute(
+        select(User).execution_options(populate_existing=True)
+    )).scalars()}
+    assert set(users) == {"a@example.com", "b@example.com", "old@example.com"}
+    # First occurrence wins, and only a hash is stored
+    assert users["a@example.com"].hashed_password != "pw-a"
+    assert pwd_context.verify("pw-a", users["a@example.com"].hashed_password)
+    assert pwd_context.verify("pw-b", users["b@example.com"].hashed_password)
+    assert users["old@example.com"].hashed_password == "x"
+
+
+async def test_admin_import_streams_results(db, existing, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin")
+    body = "\n".join(json.dumps(row) for row in ROWS[:4])
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/admin/users/import", content=body,
+            headers={"X-Admin-Key": "admin", "Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1]["summary"]["created"] == 2
+    assert lines[-1]["summary"]["exists"] == 2
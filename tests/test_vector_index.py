@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.models.product import Product
+from app.services.embeddings import HashingEmbedder, SemanticIndex, VectorIndex, current_version
+from app.services.product import get_catalog_version
+
+
+def _index(n, ann_threshold):
+    texts = [f"product {i} laptop phone camera" for i in range(n)]
+    vectors = HashingEmbedder(32).embed(texts)
+    return VectorIndex.build(np.arange(n, dtype=np.int64), np.full(n, 10.0), vectors, ann_threshold)
+
+
+def test_flat_save_after_ivf_drops_quantizer(tmp_path):
+    path = str(tmp_path)
+    _index(300, ann_threshold=100).save(path)
+    assert VectorIndex.load(path).centroids is not None
+
+    _index(50, ann_threshold=100).save(path)
+    loaded = VectorIndex.load(path)
+    assert loaded.centroids is None and loaded.offsets is None
+    assert len(loaded) == 50
+
+
+def test_save_keeps_only_current_and_previous_versions(tmp_path):
+    path = str(tmp_path)
+    versions = [_index(20, ann_threshold=100).save(path) for _ in range(3)]
+
+    assert current_version(path) == versions[-1]
+    assert sorted(e for e in os.listdir(path) if e.startswith("v")) == sorted(versions[1:])
+    # The previous version stays loadable for readers that already resolved it
+    assert len(VectorIndex.load(path, versions[1])) == 20
+
+
+@pytest.mark.anyio
+async def test_unpersisted_index_refreshes_after_interval(db, monkeypatch):
+    db.add(Product(title="Laptop", price=10, category="electronics", is_active=True))
+    await db.commit()
+    index = SemanticIndex(HashingEmbedder(32))
+    assert len(await index.get()) == 1
+
+    # As if written by another worker or the CLI: this process's catalog version didn't move
+    db.add(Product(title="Phone", price=5, category="electronics", is_active=True))
+    await db.commit()
+    index.version = get_catalog_version()
+    await index.get()
+    assert index._rebuild_task is None
+
+    monkeypatch.setattr(settings, "SEMANTIC_INDEX_REFRESH_SECONDS", 0)
+    await index.get()
+    await index._rebuild_task
+    assert len(index.index) == 2